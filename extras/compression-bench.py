@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""
+Measure how long the post-processing compression plugins keep the thread
+that writes the feed (i.e. the reactor thread) busy, with and without
+compression worker threads
+
+usage:
+
+    python compression-bench.py [--mib=50] [--workers=4]
+
+"write CPU" is the CPU time that the writing thread spends in write() and
+close() calls, "wall" the total time until the compressed feed is complete.
+"""
+import argparse
+import bz2
+import gzip
+import lzma
+from io import BytesIO
+from time import perf_counter, thread_time
+
+from scrapy.extensions.postprocessing import Bz2Plugin, GzipPlugin, LZMAPlugin
+
+
+class _Output(BytesIO):
+    def close(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mib", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    line = b'{"url": "https://example.com/item/%d", "title": "Product %d"}\n'
+    data = b"".join(line % (i, i) for i in range(args.mib * 1024 * 1024 // 60))
+    lines = data.splitlines(keepends=True)
+    for plugin_cls, prefix, decompress in (
+        (GzipPlugin, "gzip", gzip.decompress),
+        (Bz2Plugin, "bz2", bz2.decompress),
+        (LZMAPlugin, "lzma", lzma.decompress),
+    ):
+        for workers in (0, args.workers):
+            output = _Output()
+            start, start_cpu = perf_counter(), thread_time()
+            plugin = plugin_cls(output, {f"{prefix}_workers": workers})
+            for chunk in lines:
+                plugin.write(chunk)
+            plugin.close()
+            cpu, wall = thread_time() - start_cpu, perf_counter() - start
+            assert decompress(output.getvalue()) == data
+            print(
+                f"{prefix:<5} workers={workers:<2} write CPU {cpu:6.2f}s "
+                f"wall {wall:6.2f}s {len(output.getvalue()) / 2**20:8.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Measure the time it takes to find the encoding of responses and decode them
+
+usage:
+
+    python encoding-bench.py [--number=200] [PAGE ...]
+
+PAGE are files with saved response bodies, e.g. pages saved from a browser or
+with ``scrapy fetch --nolog URL > page.html``. Without them, the HTML pages of
+the test suite are used, both as they are and with their text converted to
+encodings that they do not declare.
+
+For each page, the time to build an HtmlResponse and get its text is reported,
+together with the encoding found.
+"""
+import argparse
+from pathlib import Path
+from timeit import timeit
+
+from scrapy.http import HtmlResponse
+
+SAMPLE_DATA = Path(__file__).parent.parent / "tests" / "sample_data"
+
+
+def decode(body, encoding_hint=None):
+    response = HtmlResponse(
+        "https://example.com", body=body, encoding_hint=encoding_hint
+    )
+    response.text
+    return response.encoding
+
+
+def sample_corpus():
+    corpus = {}
+    for path in sorted(SAMPLE_DATA.glob("*/*.html")):
+        body = path.read_bytes()
+        corpus[path.name] = (body, None)
+        # a long page with no declared encoding
+        text = HtmlResponse("https://example.com", body=body).text * 50
+        text = text.replace("charset=", "x=") + "жé"
+        corpus[f"{path.stem}-utf8-undeclared"] = (text.encode("utf-8"), None)
+        corpus[f"{path.stem}-cp1251-hinted"] = (
+            text.encode("cp1251", "replace"),
+            "cp1251",
+        )
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("pages", nargs="*", type=Path)
+    args = parser.parse_args()
+
+    if args.pages:
+        corpus = {path.name: (path.read_bytes(), None) for path in args.pages}
+    else:
+        corpus = sample_corpus()
+    print(f"{'page':<40} {'bytes':>9} {'encoding':>10} {'time (us)':>10}")
+    for name, (body, hint) in corpus.items():
+        encoding = decode(body, hint)
+        elapsed = timeit(lambda: decode(body, hint), number=args.number)
+        print(
+            f"{name[:40]:<40} {len(body):9d} {encoding:>10}"
+            f" {elapsed / args.number * 1e6:10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
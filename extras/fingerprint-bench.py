@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""
+Measure the request fingerprinting throughput of every
+REQUEST_FINGERPRINTER_IMPLEMENTATION
+
+usage:
+
+    python fingerprint-bench.py [--requests=100000] [--urls=20000]
+
+Requests are built from a smaller set of distinct URLs, like the links that
+many pages of a website have in common, and each request is fingerprinted
+twice (e.g. by the dupefilter and later by the HTTP cache).
+"""
+import argparse
+import warnings
+from random import Random
+from time import perf_counter
+
+from scrapy.http import Request
+from scrapy.utils.request import RequestFingerprinter
+from scrapy.utils.test import get_crawler
+from scrapy.utils.url import _canonicalize_url
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--urls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    random = Random(0)
+    urls = [
+        f"https://www.example.com/category/{i % 50}/item?id={i}&sort=price&page={i % 7}"
+        for i in range(args.urls)
+    ]
+    requests = [Request(random.choice(urls)) for _ in range(args.requests)]
+
+    for implementation in ("2.6", "2.7", "2.11"):
+        _canonicalize_url.cache_clear()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            crawler = get_crawler(
+                settings_dict={"REQUEST_FINGERPRINTER_IMPLEMENTATION": implementation}
+            )
+            fingerprinter = RequestFingerprinter(crawler)
+            start = perf_counter()
+            for request in requests:
+                fingerprinter.fingerprint(request)
+            for request in requests:
+                fingerprinter.fingerprint(request)
+            elapsed = perf_counter() - start
+        print(f"{implementation:<5} {2 * args.requests / elapsed:10.0f} fingerprints/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Micro-benchmarks of the scrapy.http.Headers operations done for every
+request and response
+
+usage:
+
+    python headers-bench.py [--number=100000]
+"""
+import argparse
+from timeit import timeit
+
+from twisted.web.http_headers import Headers as TxHeaders
+
+from scrapy.core.downloader.handlers.http11 import ScrapyAgent
+from scrapy.http import HtmlResponse, Request
+from scrapy.http.headers import Headers
+
+REQUEST_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en",
+    "User-Agent": "Scrapy/2.11 (+https://scrapy.org)",
+    "Accept-Encoding": "gzip, deflate, br",
+}
+
+RESPONSE_HEADERS = {
+    b"date": [b"Mon, 16 Oct 2023 10:00:00 GMT"],
+    b"content-type": [b"text/html; charset=utf-8"],
+    b"cache-control": [b"max-age=0, private, must-revalidate"],
+    b"set-cookie": [b"a=1; Path=/", b"b=2; Path=/; HttpOnly"],
+    b"server": [b"nginx"],
+    b"vary": [b"Accept-Encoding"],
+    b"etag": [b'W/"5e1b2c9d"'],
+    b"x-frame-options": [b"SAMEORIGIN"],
+    b"strict-transport-security": [b"max-age=31536000"],
+}
+
+
+class _TxResponse:
+    length = 1024
+
+    def __init__(self):
+        self.headers = TxHeaders(RESPONSE_HEADERS)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    request_headers = Headers(REQUEST_HEADERS)
+    txresponse = _TxResponse()
+    response_headers = ScrapyAgent._headers_from_twisted_response(txresponse)
+    benchmarks = {
+        "Headers(dict)": lambda: Headers(REQUEST_HEADERS),
+        "Headers.copy()": request_headers.copy,
+        "Headers lookup": lambda: request_headers.get("user-agent"),
+        "Request(headers=...)": lambda: Request(
+            "https://example.com", headers=request_headers
+        ),
+        "from twisted response": lambda: ScrapyAgent._headers_from_twisted_response(
+            txresponse
+        ),
+        "HtmlResponse(headers=...)": lambda: HtmlResponse(
+            "https://example.com", headers=response_headers
+        ),
+    }
+    for name, func in benchmarks.items():
+        elapsed = timeit(func, number=args.number)
+        print(f"{name:<28} {elapsed / args.number * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Measure the throughput of the JSON and JSON lines item exporters, and check
+that their output matches the one of a straightforward implementation
+
+usage:
+
+    python json-exporter-bench.py [--items=200000]
+"""
+import argparse
+from io import BytesIO
+from time import perf_counter
+
+from itemadapter import ItemAdapter
+
+from scrapy.exporters import JsonItemExporter, JsonLinesItemExporter
+from scrapy.item import Field, Item
+from scrapy.utils.serialize import ScrapyJSONEncoder
+
+
+class Product(Item):
+    url = Field()
+    title = Field()
+    price = Field(serializer=str)
+    stock = Field()
+    tags = Field()
+    available = Field()
+
+
+def encode_items(items):
+    encoder = ScrapyJSONEncoder()
+    for item in items:
+        adapter = ItemAdapter(item)
+        yield encoder.encode(
+            {
+                name: adapter.get_field_meta(name).get("serializer", lambda x: x)(value)
+                for name, value in adapter.items()
+            }
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=200_000)
+    args = parser.parse_args()
+
+    items = [
+        Product(
+            url=f"https://www.example.com/category/{i % 50}/item/{i}",
+            title=f"Product \xa3{i}",
+            price=i * 1.5,
+            stock=i % 100,
+            tags=["new", f"category {i % 50}"],
+            available=bool(i % 10),
+        )
+        for i in range(args.items)
+    ]
+    dicts = [ItemAdapter(item).asdict() for item in items]
+    for item_type, items in (("Item", items), ("dict", dicts)):
+        encoded = list(encode_items(items))
+        for exporter_cls, expected in (
+            (JsonLinesItemExporter, "".join(line + "\n" for line in encoded)),
+            (JsonItemExporter, "[" + ",".join(encoded) + "]"),
+        ):
+            output = BytesIO()
+            start = perf_counter()
+            exporter = exporter_cls(output)
+            exporter.start_exporting()
+            for item in items:
+                exporter.export_item(item)
+            exporter.finish_exporting()
+            elapsed = perf_counter() - start
+            assert output.getvalue() == expected.encode()
+            print(
+                f"{exporter_cls.__name__:<22} {item_type:<5} "
+                f"{args.items / elapsed:10.0f} items/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
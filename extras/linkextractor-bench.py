@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Measure the throughput of LinkExtractor on a link-dense page
+
+usage:
+
+    python linkextractor-bench.py [--links=10000] [--number=20]
+
+The page mixes unique relative links, repeated navigation links, links to
+other domains and links to images, so that every filter of the link
+extractor has some work to do.
+"""
+import argparse
+from timeit import timeit
+
+from scrapy.http import HtmlResponse
+from scrapy.linkextractors import LinkExtractor
+
+
+def build_page(links):
+    anchors = []
+    for i in range(links):
+        kind = i % 5
+        if kind == 0:
+            href, text = f"/item/{i}?ref=list&amp;page={i % 20}", f"Item {i}"
+        elif kind == 1:
+            href, text = f"/category/{i % 30}/", f"Category {i % 30}"
+        elif kind == 2:
+            href, text = f"https://cdn{i % 3}.example.net/img/{i}.jpg", "Image"
+        elif kind == 3:
+            href, text = " ../about.html ", "About"
+        else:
+            href, text = f"https://other{i % 50}.example.org/p/{i}", "External"
+        anchors.append(f'<a href="{href}">{text}</a>')
+    body = "\n".join(f"<li>{a}</li>" for a in anchors)
+    return HtmlResponse(
+        "https://www.example.com/list/index.html",
+        body=f"<html><body><ul>{body}</ul></body></html>".encode(),
+        encoding="utf-8",
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--links", type=int, default=10_000)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    response = build_page(args.links)
+    response.selector  # parse once, outside of the measurements
+    extractors = {
+        "default": LinkExtractor(),
+        "allow/deny": LinkExtractor(
+            allow=[r"/item/\d+", r"/category/", r"/about"],
+            deny=[r"page=1\b", r"/category/2/", r"sessionid="],
+        ),
+        "allow_domains": LinkExtractor(
+            allow_domains=["example.com", "example.org"],
+            deny_domains=["other1.example.org"],
+        ),
+        "canonicalize": LinkExtractor(canonicalize=True),
+    }
+    for name, extractor in extractors.items():
+        count = len(extractor.extract_links(response))
+        elapsed = timeit(lambda: extractor.extract_links(response), number=args.number)
+        print(
+            f"{name:<14} {elapsed / args.number * 1000:8.1f} ms/page"
+            f"  ({count} links)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Measure the cost of OffsiteMiddleware with a large allowed_domains list
+
+usage:
+
+    python offsite-bench.py [--domains=100000] [--requests=100000]
+
+The "regex" rows use the host regex of get_host_regex(), which is what
+OffsiteMiddleware subclasses overriding that method still get.
+"""
+import argparse
+from time import perf_counter
+
+from scrapy.http import Request
+from scrapy.spidermiddlewares.offsite import OffsiteMiddleware
+from scrapy.spiders import Spider
+from scrapy.utils.test import get_crawler
+
+
+class RegexOffsiteMiddleware(OffsiteMiddleware):
+    def get_host_regex(self, spider):
+        return super().get_host_regex(spider)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--domains", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=100_000)
+    args = parser.parse_args()
+
+    domains = [f"shop{i}.example{i % 100}.com" for i in range(args.domains)]
+    # about half of the requests are to allowed domains
+    hosts = (i * 7 % (2 * args.domains) for i in range(args.requests))
+    requests = [Request(f"https://www.shop{j}.example{j % 100}.com/") for j in hosts]
+    crawler = get_crawler(Spider)
+    spider = crawler._create_spider("bench", allowed_domains=domains)
+
+    for name, cls in (("set", OffsiteMiddleware), ("regex", RegexOffsiteMiddleware)):
+        mw = cls.from_crawler(crawler)
+        start = perf_counter()
+        mw.spider_opened(spider)
+        opened = perf_counter() - start
+        start = perf_counter()
+        allowed = sum(mw.should_follow(request, spider) for request in requests)
+        elapsed = perf_counter() - start
+        print(
+            f"{name:<6} spider_opened: {opened:6.2f}s"
+            f"  should_follow: {args.requests / elapsed:9.0f} requests/s"
+            f"  ({allowed} allowed)"
+        )
+
+
+if __name__ == "__main__":
+    main()
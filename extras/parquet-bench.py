@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+"""
+Compare the export time and output size of the JSON lines, CSV and Parquet
+item exporters
+
+usage:
+
+    python parquet-bench.py [--items=200000]
+"""
+import argparse
+from io import BytesIO
+from random import Random
+from time import perf_counter
+
+from scrapy.exporters import CsvItemExporter, JsonLinesItemExporter, ParquetItemExporter
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=200_000)
+    args = parser.parse_args()
+
+    random = Random(0)
+    items = [
+        {
+            "url": f"https://www.example.com/category/{i % 50}/item/{i}",
+            "title": f"Product {i}",
+            "category": f"category {i % 50}",
+            "price": round(random.uniform(1, 1000), 2),
+            "stock": random.randint(0, 100),
+            "available": random.random() < 0.9,
+        }
+        for i in range(args.items)
+    ]
+    for exporter_cls in (JsonLinesItemExporter, CsvItemExporter, ParquetItemExporter):
+        output = BytesIO()
+        start = perf_counter()
+        exporter = exporter_cls(output)
+        exporter.start_exporting()
+        for item in items:
+            exporter.export_item(item)
+        exporter.finish_exporting()
+        elapsed = perf_counter() - start
+        print(
+            f"{exporter_cls.__name__:<22} {elapsed:6.2f}s "
+            f"{len(output.getvalue()) / 1024 / 1024:8.2f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""
+Measure the memory used by requests waiting in a scheduler memory queue
+
+usage:
+
+    python request-memory-bench.py --requests=1000000 [--count-refs]
+
+With --count-refs, trackref only counts live requests instead of keeping a
+record of every one of them (see scrapy.utils.trackref.track_instances).
+"""
+import argparse
+import gc
+import resource
+import sys
+from time import perf_counter
+
+from scrapy.http import Request
+from scrapy.squeues import LifoMemoryQueue
+from scrapy.utils import trackref
+
+
+def max_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes everywhere else
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1_000_000)
+    parser.add_argument("--count-refs", action="store_true")
+    args = parser.parse_args()
+
+    if args.count_refs:
+        trackref.track_instances(False)
+
+    gc.collect()
+    start_rss = max_rss_mb()
+    start = perf_counter()
+    queue = LifoMemoryQueue()
+    for i in range(args.requests):
+        queue.push(Request(f"https://example.com/page/{i}?sort=price"))
+    elapsed = perf_counter() - start
+    gc.collect()
+    used = max_rss_mb() - start_rss
+
+    print(f"requests queued:    {len(queue)}")
+    print(f"time:               {elapsed:.2f}s")
+    print(f"memory:             {used:.1f} MiB")
+    print(f"memory per request: {used * 1024 * 1024 / args.requests:.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Measure how many robots.txt checks per second each robots.txt parser does
+
+usage:
+
+    python robotstxt-bench.py [--urls=100000] [--parser=ProtegoRobotParser]
+
+URLs share a few paths, like the product and listing pages of a website, and
+are checked against a robots.txt file made only of path prefixes, for which
+decisions are cached by path prefix, and against one with wildcards, for
+which they are not.
+"""
+import argparse
+from random import Random
+from time import perf_counter
+
+from scrapy.utils.misc import load_object
+
+PREFIX_RULES = "\n".join(
+    ["User-agent: *"]
+    + [f"Disallow: /private{i}/" for i in range(40)]
+    + ["Disallow: /search", "Allow: /search/about", "", "User-agent: otherbot"]
+    + ["Disallow: /"]
+)
+WILDCARD_RULES = PREFIX_RULES + "\nUser-agent: *\nDisallow: /*?session=\n"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--urls", type=int, default=100_000)
+    parser.add_argument("--parser", default="ProtegoRobotParser")
+    args = parser.parse_args()
+
+    parser_cls = load_object(f"scrapy.robotstxt.{args.parser}")
+    random = Random(0)
+    urls = [
+        f"https://www.example.com/category/{random.randrange(50)}/item?id={i}"
+        for i in range(args.urls)
+    ]
+    user_agent = b"Scrapy/2.11 (+https://scrapy.org)"
+    for name, rules in (("prefixes", PREFIX_RULES), ("wildcards", WILDCARD_RULES)):
+        rp = parser_cls.from_crawler(None, rules.encode())
+        for method in ("_allowed", "allowed"):
+            allowed = getattr(rp, method)
+            start = perf_counter()
+            for url in urls:
+                allowed(url, user_agent)
+            elapsed = perf_counter() - start
+            print(f"{name:<10} {method:<9} {args.urls / elapsed:10.0f} checks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""
+Measure the peak memory used by SitemapSpider to parse a large gzipped sitemap
+
+usage:
+
+    python sitemap-memory-bench.py [--urls=50000]
+"""
+import argparse
+import gzip
+import resource
+import sys
+from io import BytesIO
+from time import perf_counter
+
+from scrapy.http import Response
+from scrapy.spiders import SitemapSpider
+
+
+def max_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes everywhere else
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def build_sitemap(urls):
+    """Return a gzipped sitemap, never holding it uncompressed in memory"""
+    f = BytesIO()
+    with gzip.GzipFile(fileobj=f, mode="wb") as g:
+        g.write(
+            b'<?xml version="1.0" encoding="UTF-8"?>\n'
+            b'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        )
+        for i in range(urls):
+            g.write(
+                f"<url><loc>https://www.example.com/products/{i}.html</loc>"
+                f"<lastmod>2023-10-16</lastmod><changefreq>daily</changefreq>"
+                f"<priority>0.8</priority></url>\n".encode()
+            )
+        g.write(b"</urlset>")
+    return f.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--urls", type=int, default=50_000)
+    args = parser.parse_args()
+
+    body = build_sitemap(args.urls)
+    response = Response("https://www.example.com/sitemap.xml.gz", body=body)
+    spider = SitemapSpider("bench")
+
+    start_rss = max_rss_mb()
+    start = perf_counter()
+    count = 0
+    for _ in spider._parse_sitemap(response):
+        count += 1
+    elapsed = perf_counter() - start
+    used = max_rss_mb() - start_rss
+
+    print(f"requests:    {count}")
+    print(f"time:        {elapsed:.2f}s")
+    print(f"memory:      {used:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
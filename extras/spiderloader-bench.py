@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Measure how long "scrapy list" and "scrapy crawl" take in a project with many
+spider modules
+
+usage:
+
+    python spiderloader-bench.py [--spiders=300]
+
+Every generated spider module does some work at import time, like real
+spider modules that import parsing libraries or build lookup tables.
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+SPIDER_MODULE = """\
+from scrapy import Spider
+
+CATEGORIES = {{str(i): i for i in range(20000)}}
+
+
+class Spider{i}(Spider):
+    name = "spider{i}"
+    allowed_domains = ["example{i}.com"]
+"""
+
+
+def create_project(root, spiders):
+    (root / "scrapy.cfg").write_text("[settings]\ndefault = bench.settings\n")
+    package = root / "bench"
+    (package / "spiders").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "settings.py").write_text('SPIDER_MODULES = ["bench.spiders"]\n')
+    (package / "spiders" / "__init__.py").write_text("")
+    for i in range(spiders):
+        (package / "spiders" / f"spider{i}.py").write_text(SPIDER_MODULE.format(i=i))
+
+
+def run(args, cwd, loader):
+    env = {"SCRAPY_SETTINGS_MODULE": "bench.settings", "PYTHONPATH": str(cwd)}
+    command = [sys.executable, "-m", "scrapy.cmdline", *args]
+    command += ["-s", f"SPIDER_LOADER_CLASS={loader}", "-s", "LOG_LEVEL=ERROR"]
+    start = perf_counter()
+    subprocess.run(command, cwd=cwd, env=env, check=True, capture_output=True)
+    return perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--spiders", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        create_project(root, args.spiders)
+        # compile every module once, so that the measurements don't include it
+        subprocess.run(
+            [sys.executable, "-m", "compileall", "-q", str(root)], check=True
+        )
+        for loader in (
+            "scrapy.spiderloader.SpiderLoader",
+            "scrapy.spiderloader.IndexedSpiderLoader",
+        ):
+            # the first run builds the index of IndexedSpiderLoader
+            run(["list"], root, loader)
+            list_time = run(["list"], root, loader)
+            crawl_time = run(["crawl", "spider7"], root, loader)
+            print(
+                f"{loader:<42} scrapy list: {list_time:.2f}s"
+                f"  scrapy crawl: {crawl_time:.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,10 @@ import inspect
 import os
 import sys
 from importlib.metadata import entry_points
+from pkgutil import iter_modules
 
 import scrapy
+import scrapy.commands
 from scrapy.commands import BaseRunSpiderCommand, ScrapyCommand, ScrapyHelpFormatter
 from scrapy.crawler import CrawlerProcess
 from scrapy.exceptions import UsageError
@@ -46,13 +48,17 @@ def _get_commands_from_module(module, inproject):
     return d
 
 
-def _get_commands_from_entry_points(inproject, group="scrapy.commands"):
-    cmds = {}
+def _iter_entry_points(group):
     if sys.version_info >= (3, 10):
-        eps = entry_points(group=group)
-    else:
-        eps = entry_points().get(group, ())
-    for entry_point in eps:
+        return entry_points(group=group)
+    return entry_points().get(group, ())
+
+
+def _get_commands_from_entry_points(inproject, group="scrapy.commands", name=None):
+    cmds = {}
+    for entry_point in _iter_entry_points(group):
+        if name is not None and entry_point.name != name:
+            continue
         obj = entry_point.load()
         if inspect.isclass(obj):
             cmds[entry_point.name] = obj()
@@ -70,6 +76,24 @@ def _get_commands_dict(settings, inproject):
     return cmds
 
 
+def _get_command(settings, inproject, cmdname):
+    """Return the command that _get_commands_dict() would return for the
+    given name, or None, only importing the modules that could define it."""
+    cmds_module = settings["COMMANDS_MODULE"]
+    if cmds_module:
+        cmds = _get_commands_from_module(cmds_module, inproject)
+        if cmdname in cmds:
+            return cmds[cmdname]
+    cmds = _get_commands_from_entry_points(inproject, name=cmdname)
+    if cmdname in cmds:
+        return cmds[cmdname]
+    builtin_names = {name for _, name, _ in iter_modules(scrapy.commands.__path__)}
+    if cmdname in builtin_names:
+        cmds = _get_commands_from_module(f"scrapy.commands.{cmdname}", inproject)
+        return cmds.get(cmdname)
+    return None
+
+
 def _pop_command_name(argv):
     i = 0
     for arg in argv[1:]:
@@ -135,16 +159,15 @@ def execute(argv=None, settings=None):
             settings["EDITOR"] = editor
 
     inproject = inside_project()
-    cmds = _get_commands_dict(settings, inproject)
     cmdname = _pop_command_name(argv)
     if not cmdname:
         _print_commands(settings, inproject)
         sys.exit(0)
-    elif cmdname not in cmds:
+    cmd = _get_command(settings, inproject, cmdname)
+    if cmd is None:
         _print_unknown_command(settings, cmdname, inproject)
         sys.exit(2)
 
-    cmd = cmds[cmdname]
     parser = ScrapyArgumentParser(
         formatter_class=ScrapyHelpFormatter,
         usage=f"scrapy {cmdname} {cmd.syntax()}",
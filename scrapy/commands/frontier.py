@@ -0,0 +1,65 @@
+import logging
+
+from scrapy.commands import ScrapyCommand
+from scrapy.core.frontier import Frontier, FrontierServerFactory
+
+logger = logging.getLogger(__name__)
+
+
+class Command(ScrapyCommand):
+    default_settings = {"LOG_LEVEL": "INFO"}
+
+    def syntax(self):
+        return "[options]"
+
+    def short_desc(self):
+        return "Run a frontier server shared by several crawler processes"
+
+    def add_options(self, parser):
+        ScrapyCommand.add_options(self, parser)
+        parser.add_argument(
+            "--listen",
+            "-l",
+            metavar="ENDPOINT",
+            help="server endpoint string to listen on "
+            f"(default: {self.settings['FRONTIER_LISTEN']})",
+        )
+        parser.add_argument(
+            "--delay",
+            type=float,
+            help="seconds between requests to the same download slot "
+            f"(default: {self.settings['DOWNLOAD_DELAY']})",
+        )
+
+    def run(self, args, opts):
+        from twisted.internet import reactor
+        from twisted.internet.endpoints import serverFromString
+
+        listen = opts.listen or self.settings["FRONTIER_LISTEN"]
+        delay = (
+            opts.delay
+            if opts.delay is not None
+            else self.settings.getfloat("DOWNLOAD_DELAY")
+        )
+        frontier = Frontier(delay=delay)
+        endpoint = serverFromString(reactor, listen)
+
+        def listening(port):
+            logger.info(
+                "Frontier listening on %(address)s", {"address": port.getHost()}
+            )
+
+        def failed(failure):
+            logger.error(
+                "Could not listen on %(endpoint)s: %(error)s",
+                {"endpoint": listen, "error": failure.value},
+            )
+            self.exitcode = 1
+            reactor.stop()
+
+        def start():
+            dfd = endpoint.listen(FrontierServerFactory(frontier))
+            dfd.addCallbacks(listening, failed)
+
+        reactor.callWhenRunning(start)
+        reactor.run()
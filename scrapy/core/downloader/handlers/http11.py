@@ -409,9 +409,12 @@ class ScrapyAgent:
         return headers
 
     def _cb_bodyready(self, txresponse, request):
+        # the response headers are converted only once, receivers of the
+        # headers_received signal get a copy that they are free to modify
+        headers = self._headers_from_twisted_response(txresponse)
         headers_received_result = self._crawler.signals.send_catch_log(
             signal=signals.headers_received,
-            headers=self._headers_from_twisted_response(txresponse),
+            headers=headers.copy(),
             body_length=txresponse.length,
             request=request,
             spider=self._crawler.spider,
@@ -426,6 +429,7 @@ class ScrapyAgent:
                 txresponse._transport.loseConnection()
                 return {
                     "txresponse": txresponse,
+                    "headers": headers,
                     "body": b"",
                     "flags": ["download_stopped"],
                     "certificate": None,
@@ -437,6 +441,7 @@ class ScrapyAgent:
         if txresponse.length == 0:
             return {
                 "txresponse": txresponse,
+                "headers": headers,
                 "body": b"",
                 "flags": None,
                 "certificate": None,
@@ -482,6 +487,7 @@ class ScrapyAgent:
             _ResponseReader(
                 finished=d,
                 txresponse=txresponse,
+                headers=headers,
                 request=request,
                 maxsize=maxsize,
                 warnsize=warnsize,
@@ -496,7 +502,7 @@ class ScrapyAgent:
         return d
 
     def _cb_bodydone(self, result, request, url):
-        headers = self._headers_from_twisted_response(result["txresponse"])
+        headers = result["headers"]
         respcls = responsetypes.from_args(headers=headers, url=url, body=result["body"])
         try:
             version = result["txresponse"].version
@@ -541,6 +547,7 @@ class _ResponseReader(protocol.Protocol):
         self,
         finished,
         txresponse,
+        headers,
         request,
         maxsize,
         warnsize,
@@ -549,6 +556,7 @@ class _ResponseReader(protocol.Protocol):
     ):
         self._finished = finished
         self._txresponse = txresponse
+        self._headers = headers
         self._request = request
         self._bodybuf = BytesIO()
         self._maxsize = maxsize
@@ -565,6 +573,7 @@ class _ResponseReader(protocol.Protocol):
         self._finished.callback(
             {
                 "txresponse": self._txresponse,
+                "headers": self._headers,
                 "body": self._bodybuf.getvalue(),
                 "flags": flags,
                 "certificate": self._certificate,
@@ -3,9 +3,24 @@ Downloader Middleware manager
 
 See documentation in docs/topics/downloader-middleware.rst
 """
-from typing import Any, Callable, Generator, List, Union, cast
+from __future__ import annotations
 
-from twisted.internet.defer import Deferred, inlineCallbacks
+import inspect
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from twisted.internet.defer import Deferred, fail, succeed
 from twisted.python.failure import Failure
 
 from scrapy import Spider
@@ -14,12 +29,30 @@ from scrapy.http import Request, Response
 from scrapy.middleware import MiddlewareManager
 from scrapy.settings import BaseSettings
 from scrapy.utils.conf import build_component_list
-from scrapy.utils.defer import deferred_from_coro, mustbe_deferred
+from scrapy.utils.defer import _maybe_await, deferred_from_coro
+
+if TYPE_CHECKING:
+    # typing.Self requires Python 3.11
+    from typing_extensions import Self
+
+    from scrapy.crawler import Crawler
+    from scrapy.statscollectors import StatsCollector
+    from scrapy.utils.timing import ComponentTimer
 
 
 class DownloaderMiddlewareManager(MiddlewareManager):
     component_name = "downloader middleware"
 
+    def __init__(self, *middlewares: Any) -> None:
+        self.stats: Optional[StatsCollector] = None
+        super().__init__(*middlewares)
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> Self:
+        mwman = super().from_crawler(crawler)
+        mwman.stats = crawler.stats
+        return mwman
+
     @classmethod
     def _get_mwlist_from_settings(cls, settings: BaseSettings) -> List[Any]:
         return build_component_list(settings.getwithbase("DOWNLOADER_MIDDLEWARES"))
@@ -31,73 +64,181 @@ class DownloaderMiddlewareManager(MiddlewareManager):
             self.methods["process_response"].appendleft(mw.process_response)
         if hasattr(mw, "process_exception"):
             self.methods["process_exception"].appendleft(mw.process_exception)
+        self._compile_chains()
+
+    def _instrument(self, timer: ComponentTimer) -> None:
+        super()._instrument(timer)
+        self._compile_chains()
+
+    def _compile_chains(self) -> None:
+        self._chains: Dict[str, Tuple[Callable, ...]] = {
+            name: tuple(cast(Deque[Callable], self.methods[name]))
+            for name in ("process_request", "process_response", "process_exception")
+        }
 
     def download(
         self, download_func: Callable, request: Request, spider: Spider
     ) -> Deferred:
-        @inlineCallbacks
-        def process_request(request: Request) -> Generator[Deferred, Any, Any]:
-            for method in self.methods["process_request"]:
-                method = cast(Callable, method)
-                response = yield deferred_from_coro(
-                    method(request=request, spider=spider)
-                )
-                if response is not None and not isinstance(
-                    response, (Response, Request)
-                ):
-                    raise _InvalidOutput(
-                        f"Middleware {method.__qualname__} must return None, Response or "
-                        f"Request, got {response.__class__.__name__}"
+        """Run *request* through the middleware chain and *download_func*.
+
+        Middleware methods are called synchronously, one after another, for as
+        long as they return a final value. When one of them returns a
+        :class:`~twisted.internet.defer.Deferred` or an awaitable object, the
+        rest of that chain runs in a coroutine, resumed once it is ready.
+        """
+        try:
+            result = self._process_request(download_func, request, spider)
+        except Exception:
+            dfd = fail()
+        else:
+            dfd = result if isinstance(result, Deferred) else succeed(result)
+        dfd.addErrback(self._process_exception, request, spider)
+        dfd.addCallback(self._process_response, request, spider)
+        return dfd
+
+    def _resume(self, coro: Coroutine) -> Deferred:
+        if self.stats is not None:
+            self.stats.inc_value("downloader/middleware_resumed_count")
+        return deferred_from_coro(coro)
+
+    def _process_request(
+        self, download_func: Callable, request: Request, spider: Spider
+    ) -> Union[Response, Request, Deferred]:
+        methods = self._chains["process_request"]
+        for index, method in enumerate(methods):
+            response = method(request=request, spider=spider)
+            if _is_pending(response):
+                return self._resume(
+                    self._process_request_async(
+                        download_func, request, spider, index, response
                     )
-                if response:
-                    return response
-            return (yield download_func(request=request, spider=spider))
-
-        @inlineCallbacks
-        def process_response(
-            response: Union[Response, Request]
-        ) -> Generator[Deferred, Any, Union[Response, Request]]:
-            if response is None:
-                raise TypeError("Received None in process_response")
-            elif isinstance(response, Request):
+                )
+            if _check_request_output(method, response):
                 return response
+        return download_func(request=request, spider=spider)
 
-            for method in self.methods["process_response"]:
-                method = cast(Callable, method)
-                response = yield deferred_from_coro(
-                    method(request=request, response=response, spider=spider)
-                )
-                if not isinstance(response, (Response, Request)):
-                    raise _InvalidOutput(
-                        f"Middleware {method.__qualname__} must return Response or Request, "
-                        f"got {type(response)}"
-                    )
-                if isinstance(response, Request):
-                    return response
+    def _process_response(
+        self, response: Union[Response, Request], request: Request, spider: Spider
+    ) -> Union[Response, Request, Deferred]:
+        if response is None:
+            raise TypeError("Received None in process_response")
+        elif isinstance(response, Request):
             return response
 
-        @inlineCallbacks
-        def process_exception(
-            failure: Failure,
-        ) -> Generator[Deferred, Any, Union[Failure, Response, Request]]:
-            exception = failure.value
-            for method in self.methods["process_exception"]:
-                method = cast(Callable, method)
-                response = yield deferred_from_coro(
-                    method(request=request, exception=exception, spider=spider)
+        methods = self._chains["process_response"]
+        for index, method in enumerate(methods):
+            result = method(request=request, response=response, spider=spider)
+            if _is_pending(result):
+                return self._resume(
+                    self._process_response_async(
+                        request, response, spider, index, result
+                    )
                 )
-                if response is not None and not isinstance(
-                    response, (Response, Request)
-                ):
-                    raise _InvalidOutput(
-                        f"Middleware {method.__qualname__} must return None, Response or "
-                        f"Request, got {type(response)}"
+            response = result
+            if _check_response_output(method, response):
+                return response
+        return response
+
+    def _process_exception(
+        self, failure: Failure, request: Request, spider: Spider
+    ) -> Union[Failure, Response, Request, Deferred]:
+        exception = failure.value
+        methods = self._chains["process_exception"]
+        for index, method in enumerate(methods):
+            response = method(request=request, exception=exception, spider=spider)
+            if _is_pending(response):
+                return self._resume(
+                    self._process_exception_async(
+                        request, exception, spider, index, response
                     )
-                if response:
-                    return response
-            return failure
-
-        deferred = mustbe_deferred(process_request, request)
-        deferred.addErrback(process_exception)
-        deferred.addCallback(process_response)
-        return deferred
+                )
+            if _check_request_output(method, response):
+                return response
+        return failure
+
+    async def _process_request_async(
+        self,
+        download_func: Callable,
+        request: Request,
+        spider: Spider,
+        start: int,
+        pending: Any,
+    ) -> Union[Response, Request]:
+        methods = self._chains["process_request"]
+        for method in methods[start:]:
+            if pending is None:
+                response = method(request=request, spider=spider)
+            else:
+                response, pending = pending, None
+            response = await _maybe_await(response)
+            if _check_request_output(method, response):
+                return response
+        return await _maybe_await(download_func(request=request, spider=spider))
+
+    async def _process_response_async(
+        self,
+        request: Request,
+        response: Union[Response, Request],
+        spider: Spider,
+        start: int,
+        pending: Any,
+    ) -> Union[Response, Request]:
+        methods = self._chains["process_response"]
+        for method in methods[start:]:
+            if pending is None:
+                response = method(request=request, response=response, spider=spider)
+            else:
+                response, pending = pending, None
+            response = await _maybe_await(response)
+            if _check_response_output(method, response):
+                return response
+        return response
+
+    async def _process_exception_async(
+        self,
+        request: Request,
+        exception: Exception,
+        spider: Spider,
+        start: int,
+        pending: Any,
+    ) -> Union[Response, Request]:
+        methods = self._chains["process_exception"]
+        for method in methods[start:]:
+            if pending is None:
+                response = method(request=request, exception=exception, spider=spider)
+            else:
+                response, pending = pending, None
+            response = await _maybe_await(response)
+            if _check_request_output(method, response):
+                return response
+        raise exception
+
+
+def _is_pending(result: Any) -> bool:
+    return isinstance(result, Deferred) or inspect.isawaitable(result)
+
+
+def _check_request_output(method: Callable, response: Any) -> bool:
+    """Validate the output of a process_request or process_exception method,
+    return whether it ends its chain."""
+    if response is None:
+        return False
+    if not isinstance(response, (Response, Request)):
+        raise _InvalidOutput(
+            f"Middleware {method.__qualname__} must return None, Response or "
+            f"Request, got {response.__class__.__name__}"
+        )
+    return True
+
+
+def _check_response_output(method: Callable, response: Any) -> bool:
+    """Validate the output of a process_response method, return whether it
+    ends its chain."""
+    if isinstance(response, Response):
+        return False
+    if not isinstance(response, Request):
+        raise _InvalidOutput(
+            f"Middleware {method.__qualname__} must return Response or Request, "
+            f"got {type(response)}"
+        )
+    return True
@@ -99,6 +99,9 @@ class ExecutionEngine:
         self.scraper = Scraper(crawler)
         self._spider_closed_callback: Callable = spider_closed_callback
         self.start_time: Optional[float] = None
+        self.start_requests_batch_size: int = max(
+            1, crawler.settings.getint("START_REQUESTS_BATCH_SIZE")
+        )
 
     def _get_scheduler_class(self, settings: BaseSettings) -> Type["BaseScheduler"]:
         from scrapy.core.scheduler import BaseScheduler
@@ -169,17 +172,42 @@ class ExecutionEngine:
         if self.paused:
             return None
 
+        self._process_scheduler()
+
+        if self.slot.start_requests is not None and not self._needs_backout():
+            if self._next_start_requests():
+                self._process_scheduler()
+                if self.slot.start_requests is not None and not self._needs_backout():
+                    # there is still capacity left (e.g. the scheduler dropped
+                    # the whole batch), pull the next batch on the next loop
+                    self.slot.nextcall.schedule()
+
+        if self.spider_is_idle() and self.slot.close_if_idle:
+            self._spider_idle()
+
+    def _process_scheduler(self) -> None:
         while (
             not self._needs_backout()
             and self._next_request_from_scheduler() is not None
         ):
             pass
 
-        if self.slot.start_requests is not None and not self._needs_backout():
+    def _next_start_requests(self) -> int:
+        """Pull up to :setting:`START_REQUESTS_BATCH_SIZE` start requests into
+        the scheduler, stopping early if the engine needs to back out.
+
+        Return the number of start requests that were pulled.
+        """
+        assert self.slot is not None  # typing
+        assert self.slot.start_requests is not None  # typing
+        assert self.spider is not None  # typing
+        count = 0
+        while count < self.start_requests_batch_size and not self._needs_backout():
             try:
                 request = next(self.slot.start_requests)
             except StopIteration:
                 self.slot.start_requests = None
+                break
             except Exception:
                 self.slot.start_requests = None
                 logger.error(
@@ -187,11 +215,11 @@ class ExecutionEngine:
                     exc_info=True,
                     extra={"spider": self.spider},
                 )
+                break
             else:
-                self.crawl(request)
-
-        if self.spider_is_idle() and self.slot.close_if_idle:
-            self._spider_idle()
+                self._schedule_request(request, self.spider)
+                count += 1
+        return count
 
     def _needs_backout(self) -> bool:
         assert self.slot is not None  # typing
@@ -282,7 +310,13 @@ class ExecutionEngine:
         if self.spider is None:
             raise RuntimeError(f"No open spider to crawl: {request}")
         self._schedule_request(request, self.spider)
-        self.slot.nextcall.schedule()  # type: ignore[union-attr]
+        # While the downloader or the scraper are full there is no point in
+        # waking up the engine, it is woken up as soon as they free capacity.
+        if not (
+            self.downloader.needs_backout()
+            or (self.scraper.slot is not None and self.scraper.slot.needs_backout())
+        ):
+            self.slot.nextcall.schedule()  # type: ignore[union-attr]
 
     def _schedule_request(self, request: Request, spider: Spider) -> None:
         self.signals.send_catch_log(
@@ -0,0 +1,506 @@
+"""
+Shared frontier for distributed crawls
+
+A frontier server, started with the ``scrapy frontier`` command, keeps the
+pending requests of a crawl. Any number of crawler processes, on the same or
+on different hosts, use :class:`FrontierScheduler` to push requests to it and
+pop requests from it.
+
+The server partitions requests by download slot, filters duplicate requests
+and enforces a delay between requests to the same slot across all crawler
+processes.
+
+Messages are marshalled tuples, each prefixed with its length as a 32-bit
+integer. A crawler process sends ``(command, arguments)`` and the server
+answers each message, in order, with ``(pending, result)``, where
+``pending`` is the number of requests left in the frontier:
+
+* ``("push", [(slot, priority, fingerprint, data), ...])`` adds requests,
+  serialized into ``data``. Requests with an already seen ``fingerprint``
+  are dropped, and their count is the result. ``fingerprint`` is ``None``
+  for requests that must not be filtered.
+
+* ``("pop", count)`` takes up to ``count`` requests. The result is
+  ``([(slot, priority, data), ...], wait)``, where ``wait`` is the number of
+  seconds until a delayed slot can give more requests, or ``None``.
+
+See documentation in docs/topics/scheduler.rst
+"""
+from __future__ import annotations
+
+import logging
+import marshal
+import pickle
+import time
+from collections import deque
+from heapq import heappop, heappush
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from twisted.internet.defer import Deferred, succeed
+from twisted.internet.endpoints import clientFromString, connectProtocol
+from twisted.internet.protocol import Factory
+from twisted.protocols.basic import Int32StringReceiver
+from twisted.python.failure import Failure
+
+from scrapy.core.scheduler import BaseScheduler
+from scrapy.http.request import Request
+from scrapy.spiders import Spider
+from scrapy.squeues import _pickle_serialize
+from scrapy.statscollectors import StatsCollector
+from scrapy.utils.log import failure_to_exc_info
+from scrapy.utils.reactor import CallLaterOnce
+from scrapy.utils.request import request_from_dict
+
+if TYPE_CHECKING:
+    # typing.Self requires Python 3.11
+    from typing_extensions import Self
+
+    from scrapy.crawler import Crawler
+
+
+logger = logging.getLogger(__name__)
+
+_MAX_MESSAGE_LENGTH = 2**28
+
+PushEntry = Tuple[str, int, Optional[bytes], bytes]
+PopEntry = Tuple[str, int, bytes]
+
+
+class Frontier:
+    """Pending requests of a crawl, partitioned by download slot.
+
+    Each slot gives its requests by priority, and after giving a request it
+    is not ready again until *delay* seconds have passed. Ready slots give
+    requests in turns.
+    """
+
+    def __init__(self, delay: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        self.delay: float = delay
+        self._clock: Callable[[], float] = clock
+        self._queues: Dict[str, List[Tuple[int, int, bytes]]] = {}
+        # (time when the slot is ready, sequence, slot), for non-empty slots
+        self._ready: List[Tuple[float, int, str]] = []
+        # time when the slot is ready, for empty slots that are not ready yet
+        self._delayed: Dict[str, float] = {}
+        self._prune_delayed_at: int = 1024
+        self._seen: set = set()
+        self._sequence = count()
+        self._len: int = 0
+
+    def push(self, entries: Sequence[PushEntry]) -> int:
+        """Add requests, and return how many were dropped as duplicates."""
+        filtered = 0
+        for slot, priority, fingerprint, data in entries:
+            if fingerprint is not None:
+                if fingerprint in self._seen:
+                    filtered += 1
+                    continue
+                self._seen.add(fingerprint)
+            queue = self._queues.get(slot)
+            if queue is None:
+                queue = self._queues[slot] = []
+                ready_time = self._delayed.pop(slot, 0.0)
+                heappush(self._ready, (ready_time, next(self._sequence), slot))
+            heappush(queue, (-priority, next(self._sequence), data))
+            self._len += 1
+        return filtered
+
+    def pop(self, count: int) -> Tuple[List[PopEntry], Optional[float]]:
+        """Take up to *count* requests from ready slots, and return them with
+        the seconds until the next slot is ready, or ``None`` if the frontier
+        is empty."""
+        now = self._clock()
+        entries: List[PopEntry] = []
+        while len(entries) < count and self._ready and self._ready[0][0] <= now:
+            _, _, slot = heappop(self._ready)
+            queue = self._queues[slot]
+            priority, _, data = heappop(queue)
+            entries.append((slot, -priority, data))
+            self._len -= 1
+            ready_time = now + self.delay
+            if queue:
+                heappush(self._ready, (ready_time, next(self._sequence), slot))
+            else:
+                del self._queues[slot]
+                if self.delay:
+                    self._delayed[slot] = ready_time
+        if len(self._delayed) >= self._prune_delayed_at:
+            self._delayed = {s: t for s, t in self._delayed.items() if t > now}
+            self._prune_delayed_at = max(2 * len(self._delayed), 1024)
+        wait = max(self._ready[0][0] - now, 0.0) if self._ready else None
+        return entries, wait
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class FrontierServerProtocol(Int32StringReceiver):
+    """Server side of a connection from a crawler process."""
+
+    MAX_LENGTH = _MAX_MESSAGE_LENGTH
+
+    def __init__(self, frontier: Frontier):
+        self.frontier: Frontier = frontier
+        self._commands: Dict[str, Callable[[Any], Any]] = {
+            "push": frontier.push,
+            "pop": frontier.pop,
+        }
+
+    def stringReceived(self, string: bytes) -> None:
+        try:
+            command, args = marshal.loads(string)
+            result = self._commands[command](args)
+        except Exception:
+            logger.warning(
+                "Invalid message from %(peer)s, closing the connection",
+                {"peer": self.transport.getPeer()},
+                exc_info=True,
+            )
+            self.transport.loseConnection()
+            return
+        self.sendString(marshal.dumps((len(self.frontier), result)))
+
+    def lengthLimitExceeded(self, length: int) -> None:
+        logger.warning(
+            "Message of %(length)d bytes from %(peer)s exceeds the limit of "
+            "%(limit)d bytes, closing the connection",
+            {
+                "length": length,
+                "peer": self.transport.getPeer(),
+                "limit": self.MAX_LENGTH,
+            },
+        )
+        self.transport.loseConnection()
+
+
+class FrontierServerFactory(Factory):
+    def __init__(self, frontier: Frontier):
+        self.frontier: Frontier = frontier
+
+    def buildProtocol(self, addr: Any) -> FrontierServerProtocol:
+        return FrontierServerProtocol(self.frontier)
+
+
+class FrontierClientProtocol(Int32StringReceiver):
+    """Client side of the connection to a frontier server."""
+
+    MAX_LENGTH = _MAX_MESSAGE_LENGTH
+
+    def __init__(self) -> None:
+        #: Number of requests in the frontier, as of the last answer
+        self.pending: int = 0
+        #: Fires with ``None`` when the connection is lost
+        self.closed: Deferred = Deferred()
+        #: Why the connection was lost
+        self.reason: Optional[Failure] = None
+        self._calls: Deque[Deferred] = deque()
+
+    def call(self, command: str, args: Any) -> Deferred:
+        """Send a command and return a Deferred that fires with its result."""
+        dfd: Deferred = Deferred()
+        self._calls.append(dfd)
+        self.sendString(marshal.dumps((command, args)))
+        return dfd
+
+    def stringReceived(self, string: bytes) -> None:
+        self.pending, result = marshal.loads(string)
+        self._calls.popleft().callback(result)
+
+    def connectionLost(self, reason: Failure) -> None:  # type: ignore[override]
+        calls, self._calls = self._calls, deque()
+        for dfd in calls:
+            dfd.errback(reason)
+        self.reason = reason
+        self.closed.callback(None)
+
+
+class FrontierScheduler(BaseScheduler):
+    """
+    A scheduler that keeps requests in a frontier server shared by several
+    crawler processes, see :ref:`topics-scheduler-frontier`.
+
+    Pushed requests are sent in batches, at the latest in the next iteration
+    of the reactor loop, and popped requests are fetched in batches ahead of
+    time. Requests fetched but not popped are given back to the server when
+    the scheduler is closed.
+
+    Requests that cannot be serialized stay in the crawler process.
+
+    :param crawler: The crawler object corresponding to the current crawl.
+    :type crawler: :class:`scrapy.crawler.Crawler`
+
+    :param endpoint: The client endpoint string of the frontier server.
+                     The value for the :setting:`FRONTIER_ENDPOINT` setting is used by default.
+    :type endpoint: str
+
+    :param batch_size: The maximum number of requests sent or fetched in one message.
+                       The value for the :setting:`FRONTIER_BATCH_SIZE` setting is used by default.
+    :type batch_size: int
+
+    :param logunser: A boolean that indicates whether or not unserializable requests should be logged.
+                     The value for the :setting:`SCHEDULER_DEBUG` setting is used by default.
+    :type logunser: bool
+
+    :param stats: A stats collector object to record stats about the request scheduling process.
+                  The value for the :setting:`STATS_CLASS` setting is used by default.
+    :type stats: :class:`scrapy.statscollectors.StatsCollector` instance or similar:
+                 any class that implements the `StatsCollector` interface
+    """
+
+    def __init__(
+        self,
+        crawler: Crawler,
+        endpoint: str,
+        batch_size: int = 100,
+        logunser: bool = False,
+        stats: Optional[StatsCollector] = None,
+    ):
+        self.crawler: Crawler = crawler
+        self.endpoint: str = endpoint
+        self.batch_size: int = batch_size
+        self.logunser: bool = logunser
+        self.stats: Optional[StatsCollector] = stats
+        self.spider: Optional[Spider] = None
+        self._protocol: Optional[FrontierClientProtocol] = None
+        self._pushes: List[PushEntry] = []
+        self._requests: Deque[PopEntry] = deque()
+        self._local: Deque[Request] = deque()
+        # pushes sent whose answer has not been received
+        self._pushing: int = 0
+        self._pop_dfd: Optional[Deferred] = None
+        self._closing: bool = False
+        self._flush_call: CallLaterOnce = CallLaterOnce(self._flush)
+        self._wake_call: CallLaterOnce = CallLaterOnce(self._wake)
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> Self:
+        return cls(
+            crawler,
+            endpoint=crawler.settings["FRONTIER_ENDPOINT"],
+            batch_size=crawler.settings.getint("FRONTIER_BATCH_SIZE"),
+            logunser=crawler.settings.getbool("SCHEDULER_DEBUG"),
+            stats=crawler.stats,
+        )
+
+    def open(self, spider: Spider) -> Deferred:
+        """Connect to the frontier server."""
+        from twisted.internet import reactor
+
+        self.spider = spider
+        dfd = connectProtocol(
+            clientFromString(reactor, self.endpoint), FrontierClientProtocol()
+        )
+        dfd.addCallback(self._connected)
+        return dfd
+
+    def close(self, reason: str) -> Optional[Deferred]:
+        """Send the pending pushes, give back the fetched requests that have
+        not been popped, and disconnect."""
+        self._closing = True
+        self._flush_call.cancel()
+        self._wake_call.cancel()
+        if self._protocol is None:
+            return None
+        protocol = self._protocol
+        dfd = self._pop_dfd or succeed(None)
+        dfd.addCallback(lambda _: self._requeue())
+        dfd.addErrback(self._call_failed)
+        dfd.addBoth(lambda _: self._disconnect(protocol))
+        return dfd
+
+    def has_pending_requests(self) -> bool:
+        return bool(
+            self._local
+            or self._requests
+            or self._pushes
+            or self._pushing
+            or (self._protocol is not None and self._protocol.pending)
+        )
+
+    def enqueue_request(self, request: Request) -> bool:
+        """
+        Queue the request to be sent to the frontier server. Requests that
+        cannot be serialized are kept in memory instead.
+
+        Duplicate requests are filtered by the server, so ``True`` is
+        returned for them too. The number of filtered requests is added to
+        the ``dupefilter/filtered`` stat.
+        """
+        assert self.stats is not None
+        try:
+            data = _pickle_serialize(request.to_dict(spider=self.spider))
+        except ValueError as e:  # non serializable request
+            if self.logunser:
+                msg = (
+                    "Unable to serialize request: %(request)s - reason:"
+                    " %(reason)s - no more unserializable requests will be"
+                    " logged (stats being collected)"
+                )
+                logger.warning(
+                    msg,
+                    {"request": request, "reason": e},
+                    exc_info=True,
+                    extra={"spider": self.spider},
+                )
+                self.logunser = False
+            self.stats.inc_value("scheduler/unserializable", spider=self.spider)
+            self._local.append(request)
+            self.stats.inc_value("scheduler/enqueued/memory", spider=self.spider)
+        else:
+            fingerprint = (
+                None
+                if request.dont_filter
+                else self.crawler.request_fingerprinter.fingerprint(request)
+            )
+            slot = self.crawler.engine.downloader._get_slot_key(request, None)
+            self._pushes.append((slot, request.priority, fingerprint, data))
+            if len(self._pushes) >= self.batch_size:
+                self._flush()
+            else:
+                self._flush_call.schedule()
+            self.stats.inc_value("scheduler/enqueued/frontier", spider=self.spider)
+        self.stats.inc_value("scheduler/enqueued", spider=self.spider)
+        return True
+
+    def next_request(self) -> Optional[Request]:
+        """
+        Return a request fetched from the frontier server, or ``None`` if none
+        has been fetched yet. Requests are fetched in the background, and the
+        engine is woken up when they arrive.
+        """
+        assert self.stats is not None
+        if self._local:
+            request = self._local.popleft()
+            self.stats.inc_value("scheduler/dequeued/memory", spider=self.spider)
+        else:
+            self._prefetch()
+            if not self._requests:
+                return None
+            _, _, data = self._requests.popleft()
+            request = request_from_dict(pickle.loads(data), spider=self.spider)
+            self.stats.inc_value("scheduler/dequeued/frontier", spider=self.spider)
+        self.stats.inc_value("scheduler/dequeued", spider=self.spider)
+        return request
+
+    def __len__(self) -> int:
+        """
+        Return the number of requests in the frontier, as of the last answer
+        of the server, plus the requests held by this scheduler.
+        """
+        pending = self._protocol.pending if self._protocol is not None else 0
+        return pending + len(self._local) + len(self._requests) + len(self._pushes)
+
+    def _connected(self, protocol: FrontierClientProtocol) -> None:
+        self._protocol = protocol
+        protocol.closed.addCallback(self._connection_lost)
+        logger.info(
+            "Connected to the frontier at %(endpoint)s",
+            {"endpoint": self.endpoint},
+            extra={"spider": self.spider},
+        )
+
+    def _disconnect(self, protocol: FrontierClientProtocol) -> Deferred:
+        protocol.transport.loseConnection()
+        return protocol.closed
+
+    def _connection_lost(self, _: None) -> None:
+        protocol, self._protocol = self._protocol, None
+        if self._closing:
+            return
+        assert protocol is not None and protocol.reason is not None
+        logger.error(
+            "Lost the connection to the frontier at %(endpoint)s",
+            {"endpoint": self.endpoint},
+            exc_info=failure_to_exc_info(protocol.reason),
+            extra={"spider": self.spider},
+        )
+        self.crawler.engine.close_spider(self.spider, "frontier_connection_lost")
+
+    def _call(self, command: str, args: Any) -> Deferred:
+        assert self._protocol is not None
+        return self._protocol.call(command, args)
+
+    def _call_failed(self, failure: Failure) -> None:
+        if self._closing and self._protocol is None:
+            return
+        logger.error(
+            "Error while talking to the frontier at %(endpoint)s",
+            {"endpoint": self.endpoint},
+            exc_info=failure_to_exc_info(failure),
+            extra={"spider": self.spider},
+        )
+
+    def _flush(self) -> None:
+        if not self._pushes or self._protocol is None:
+            return
+        batch, self._pushes = self._pushes, []
+        self._pushing += 1
+        dfd = self._call("push", batch)
+        dfd.addCallback(self._pushed)
+        dfd.addErrback(self._call_failed)
+        dfd.addBoth(self._push_done)
+
+    def _push_done(self, _: None) -> None:
+        self._pushing -= 1
+
+    def _pushed(self, filtered: int) -> None:
+        assert self.stats is not None
+        if filtered:
+            self.stats.inc_value("dupefilter/filtered", filtered, spider=self.spider)
+
+    def _prefetch(self) -> None:
+        if (
+            self._protocol is None
+            or self._pop_dfd is not None
+            or len(self._requests) > self.batch_size // 2
+        ):
+            return
+        # so that the server sees the pushes before the pop
+        self._flush()
+        self._pop_dfd = self._call("pop", self.batch_size)
+        self._pop_dfd.addCallbacks(self._popped, self._pop_failed)
+
+    def _popped(self, result: Tuple[List[PopEntry], Optional[float]]) -> None:
+        self._pop_dfd = None
+        entries, wait = result
+        self._requests.extend(entries)
+        if self._closing:
+            return
+        if entries:
+            self._wake_call.schedule()
+        elif self._pushes or self._pushing:
+            # requests pushed after the pop was sent
+            self._prefetch()
+        elif wait is not None:
+            self._wake_call.schedule(wait)
+
+    def _pop_failed(self, failure: Failure) -> None:
+        self._pop_dfd = None
+        self._call_failed(failure)
+
+    def _requeue(self) -> Deferred:
+        self._flush()
+        entries = [(slot, prio, None, data) for slot, prio, data in self._requests]
+        self._requests.clear()
+        if entries:
+            assert self.stats is not None
+            self.stats.inc_value(
+                "scheduler/requeued/frontier", len(entries), spider=self.spider
+            )
+        return self._call("push", entries)
+
+    def _wake(self) -> None:
+        slot = getattr(self.crawler.engine, "slot", None)
+        if slot is not None:
+            slot.nextcall.schedule()
@@ -6,14 +6,18 @@ from abc import abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Type, TypeVar, cast
 
+from twisted.internet import task
 from twisted.internet.defer import Deferred
+from twisted.python.failure import Failure
 
 from scrapy.crawler import Crawler
 from scrapy.dupefilters import BaseDupeFilter
+from scrapy.exceptions import IgnoreRequest
 from scrapy.http.request import Request
 from scrapy.spiders import Spider
 from scrapy.statscollectors import StatsCollector
-from scrapy.utils.job import job_dir
+from scrapy.utils.job import job_dir, write_atomically
+from scrapy.utils.log import failure_to_exc_info
 from scrapy.utils.misc import create_instance, load_object
 
 if TYPE_CHECKING:
@@ -173,6 +177,13 @@ class Scheduler(BaseScheduler):
 
     :param crawler: The crawler object corresponding to the current crawl.
     :type crawler: :class:`scrapy.crawler.Crawler`
+
+    :param checkpoint_interval: Seconds between checkpoints of the disk queue
+                                and dupefilter state, ``0`` to save it only
+                                when closing. The value for the
+                                :setting:`JOBDIR_CHECKPOINT_INTERVAL` setting
+                                is used by default.
+    :type checkpoint_interval: float
     """
 
     def __init__(
@@ -185,6 +196,7 @@ class Scheduler(BaseScheduler):
         stats: Optional[StatsCollector] = None,
         pqclass=None,
         crawler: Optional[Crawler] = None,
+        checkpoint_interval: float = 0,
     ):
         self.df: BaseDupeFilter = dupefilter
         self.dqdir: Optional[str] = self._dqdir(jobdir)
@@ -194,6 +206,9 @@ class Scheduler(BaseScheduler):
         self.logunser: bool = logunser
         self.stats: Optional[StatsCollector] = stats
         self.crawler: Optional[Crawler] = crawler
+        self.checkpoint_interval: float = checkpoint_interval
+        self._checkpoint_task: Optional[task.LoopingCall] = None
+        self._checkpoint_sequence: int = 0
 
     @classmethod
     def from_crawler(cls: Type[SchedulerTV], crawler: Crawler) -> SchedulerTV:
@@ -210,6 +225,7 @@ class Scheduler(BaseScheduler):
             stats=crawler.stats,
             pqclass=load_object(crawler.settings["SCHEDULER_PRIORITY_QUEUE"]),
             crawler=crawler,
+            checkpoint_interval=crawler.settings.getfloat("JOBDIR_CHECKPOINT_INTERVAL"),
         )
 
     def has_pending_requests(self) -> bool:
@@ -219,11 +235,16 @@ class Scheduler(BaseScheduler):
         """
         (1) initialize the memory queue
         (2) initialize the disk queue if the ``jobdir`` attribute is a valid directory
-        (3) return the result of the dupefilter's ``open`` method
+        (3) start periodic checkpoints if ``checkpoint_interval`` is set
+        (4) return the result of the dupefilter's ``open`` method
         """
         self.spider = spider
         self.mqs = self._mq()
         self.dqs = self._dq() if self.dqdir else None
+        if self.dqs is not None and self.checkpoint_interval:
+            self._checkpoint_task = task.LoopingCall(self.checkpoint)
+            dfd = self._checkpoint_task.start(self.checkpoint_interval, now=False)
+            dfd.addErrback(self._checkpoint_failed)
         return self.df.open()
 
     def close(self, reason: str) -> Optional[Deferred]:
@@ -231,12 +252,41 @@ class Scheduler(BaseScheduler):
         (1) dump pending requests to disk if there is a disk queue
         (2) return the result of the dupefilter's ``close`` method
         """
+        if self._checkpoint_task is not None and self._checkpoint_task.running:
+            self._checkpoint_task.stop()
         if self.dqs is not None:
             state = self.dqs.close()
             assert isinstance(self.dqdir, str)
             self._write_dqs_state(self.dqdir, state)
+            if self.checkpoint_interval or self._checkpoint_sequence:
+                self._write_checkpoint_info(self.dqdir, closed=True)
         return self.df.close(reason)
 
+    def checkpoint(self) -> None:
+        """
+        Save the state of the disk queue and of the dupefilter without closing
+        them, so that a crawl that gets killed can be resumed from this point.
+
+        Called every ``checkpoint_interval`` seconds.
+        """
+        if self.dqs is None or not hasattr(self.dqs, "checkpoint"):
+            return
+        assert isinstance(self.dqdir, str)
+        self._write_dqs_state(self.dqdir, self.dqs.checkpoint())
+        if hasattr(self.df, "checkpoint"):
+            self.df.checkpoint()
+        self._checkpoint_sequence += 1
+        self._write_checkpoint_info(self.dqdir, closed=False)
+        assert self.stats is not None
+        self.stats.inc_value("scheduler/checkpoint_count", spider=self.spider)
+
+    def _checkpoint_failed(self, failure: Failure) -> None:
+        logger.error(
+            "Error while saving a checkpoint, no more checkpoints will be saved",
+            exc_info=failure_to_exc_info(failure),
+            extra={"spider": self.spider},
+        )
+
     def enqueue_request(self, request: Request) -> bool:
         """
         Unless the received request is filtered out by the Dupefilter, attempt to push
@@ -245,17 +295,22 @@ class Scheduler(BaseScheduler):
         Increment the appropriate stats, such as: ``scheduler/enqueued``,
         ``scheduler/enqueued/disk``, ``scheduler/enqueued/memory``.
 
-        Return ``True`` if the request was stored successfully, ``False`` otherwise.
+        Return ``True`` if the request was stored successfully, ``False`` otherwise,
+        e.g. if the priority queue raised :exc:`~scrapy.exceptions.IgnoreRequest`.
         """
         if not request.dont_filter and self.df.request_seen(request):
             self.df.log(request, self.spider)
             return False
-        dqok = self._dqpush(request)
+        try:
+            dqok = self._dqpush(request)
+            if not dqok:
+                self._mqpush(request)
+        except IgnoreRequest:
+            return False
         assert self.stats is not None
         if dqok:
             self.stats.inc_value("scheduler/enqueued/disk", spider=self.spider)
         else:
-            self._mqpush(request)
             self.stats.inc_value("scheduler/enqueued/memory", spider=self.spider)
         self.stats.inc_value("scheduler/enqueued", spider=self.spider)
         return True
@@ -342,6 +397,17 @@ class Scheduler(BaseScheduler):
             key=self.dqdir,
             startprios=state,
         )
+        info = self._read_checkpoint_info(self.dqdir)
+        if info:
+            self._checkpoint_sequence = info["sequence"]
+            if not info["closed"] and hasattr(q, "recover"):
+                logger.info(
+                    "The crawl was not closed properly, recovering it from "
+                    "checkpoint %(sequence)d",
+                    {"sequence": info["sequence"]},
+                    extra={"spider": self.spider},
+                )
+                q.recover()
         if q:
             logger.info(
                 "Resuming crawl (%(queuesize)d requests scheduled)",
@@ -367,5 +433,15 @@ class Scheduler(BaseScheduler):
             return cast(list, json.load(f))
 
     def _write_dqs_state(self, dqdir: str, state: list) -> None:
-        with Path(dqdir, "active.json").open("w", encoding="utf-8") as f:
-            json.dump(state, f)
+        write_atomically(Path(dqdir, "active.json"), json.dumps(state).encode())
+
+    def _read_checkpoint_info(self, dqdir: str) -> Optional[dict]:
+        path = Path(dqdir, "checkpoint.json")
+        if not path.exists():
+            return None
+        with path.open(encoding="utf-8") as f:
+            return cast(dict, json.load(f))
+
+    def _write_checkpoint_info(self, dqdir: str, closed: bool) -> None:
+        info = {"sequence": self._checkpoint_sequence, "closed": closed}
+        write_atomically(Path(dqdir, "checkpoint.json"), json.dumps(info).encode())
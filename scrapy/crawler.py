@@ -48,6 +48,7 @@ from scrapy.utils.reactor import (
     verify_installed_asyncio_event_loop,
     verify_installed_reactor,
 )
+from scrapy.utils.timing import ComponentTimer
 
 if TYPE_CHECKING:
     from scrapy.utils.request import RequestFingerprinter
@@ -80,6 +81,11 @@ class Crawler:
 
         self.stats: StatsCollector = load_object(self.settings["STATS_CLASS"])(self)
 
+        self._component_timer: Optional[ComponentTimer] = None
+        if self.settings.getbool("COMPONENT_TIMING_ENABLED"):
+            self._component_timer = ComponentTimer.from_crawler(self)
+            self.signals._timer = self._component_timer
+
         handler = LogCounterHandler(self, level=self.settings.get("LOG_LEVEL"))
         logging.root.addHandler(handler)
 
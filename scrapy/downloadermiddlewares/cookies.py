@@ -1,11 +1,18 @@
+import dbm
 import logging
+import pickle
 from collections import defaultdict
+from itertools import count
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from tldextract import TLDExtract
 
+from scrapy import signals
 from scrapy.exceptions import NotConfigured
 from scrapy.http import Response
 from scrapy.http.cookies import CookieJar
+from scrapy.utils.datatypes import LocalCache
 from scrapy.utils.httpobj import urlparse_cached
 from scrapy.utils.python import to_unicode
 
@@ -20,18 +27,123 @@ def _is_public_domain(domain):
     return not parts.domain
 
 
+class _SpillingCookieJars:
+    """Cookie jars by ``cookiejar`` meta key, created on first use.
+
+    Up to ``max_in_memory`` jars are kept in memory; the least recently used
+    ones are pickled into a temporary dbm file and loaded back when needed.
+
+    Each jar keeps its dbm key, so that spilling it again overwrites its old
+    record. dbm files do not always reuse the space of overwritten records,
+    so the file is rewritten with only the records still needed once most of
+    the data written to it is stale.
+    """
+
+    # bytes of stale records tolerated before rewriting the dbm file
+    compact_threshold = 1024 * 1024
+
+    def __init__(self, max_in_memory):
+        self.max_in_memory = max_in_memory
+        self._jars = LocalCache()
+        # dbm keys of the jars with a record on disk, by cookiejar meta key
+        self._db_keys = {}
+        # jars only on disk, and the size of their records
+        self._spilled = {}
+        self._next_db_key = count()
+        self._written = 0
+        self._db_names = count()
+        self._tmpdir = None
+        self._db = None
+        self._db_name = None
+
+    def __getitem__(self, key):
+        if key in self._jars:
+            self._jars.move_to_end(key)
+            return self._jars[key]
+        if key in self._spilled:
+            del self._spilled[key]
+            jar = pickle.loads(self._db[self._db_keys[key]])
+        else:
+            jar = CookieJar()
+        self._jars[key] = jar
+        while len(self._jars) > self.max_in_memory:
+            self._spill(*self._jars.popitem(last=False))
+        return jar
+
+    def _spill(self, key, jar):
+        if self._db is None:
+            self._tmpdir = TemporaryDirectory(prefix="scrapy-cookies-")
+            self._open_db()
+        db_key = self._db_keys.get(key)
+        if db_key is None:
+            db_key = self._db_keys[key] = str(next(self._next_db_key))
+        data = pickle.dumps(jar, protocol=4)
+        self._db[db_key] = data
+        self._spilled[key] = len(data)
+        self._written += len(data)
+        if self._written - sum(self._spilled.values()) > max(
+            self.compact_threshold, self._written // 2
+        ):
+            self._compact()
+
+    def _open_db(self):
+        self._db_name = f"jars-{next(self._db_names)}"
+        self._db = dbm.open(str(Path(self._tmpdir.name, self._db_name)), "c")
+
+    def _compact(self):
+        old_db, old_name = self._db, self._db_name
+        self._open_db()
+        # records of the jars in memory are stale and not copied
+        self._db_keys = {key: self._db_keys[key] for key in self._spilled}
+        for db_key in self._db_keys.values():
+            self._db[db_key] = old_db[db_key]
+        self._written = sum(self._spilled.values())
+        old_db.close()
+        tmpdir = Path(self._tmpdir.name)
+        for path in [*tmpdir.glob(old_name), *tmpdir.glob(f"{old_name}.*")]:
+            path.unlink()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._tmpdir.cleanup()
+            self._db = self._tmpdir = None
+        self._db_keys.clear()
+        self._spilled.clear()
+        self._written = 0
+
+    def __contains__(self, key):
+        return key in self._jars or key in self._spilled
+
+    def __len__(self):
+        return len(self._jars) + len(self._spilled)
+
+    def __iter__(self):
+        yield from list(self._jars)
+        yield from list(self._spilled)
+
+
 class CookiesMiddleware:
     """This middleware enables working with sites that need cookies"""
 
-    def __init__(self, debug=False):
-        self.jars = defaultdict(CookieJar)
+    def __init__(self, debug=False, max_jars_in_memory=0):
+        if max_jars_in_memory:
+            self.jars = _SpillingCookieJars(max_jars_in_memory)
+        else:
+            self.jars = defaultdict(CookieJar)
         self.debug = debug
 
     @classmethod
     def from_crawler(cls, crawler):
         if not crawler.settings.getbool("COOKIES_ENABLED"):
             raise NotConfigured
-        return cls(crawler.settings.getbool("COOKIES_DEBUG"))
+        o = cls(
+            crawler.settings.getbool("COOKIES_DEBUG"),
+            max_jars_in_memory=crawler.settings.getint("COOKIES_MAX_JARS_IN_MEMORY"),
+        )
+        if isinstance(o.jars, _SpillingCookieJars):
+            crawler.signals.connect(o.jars.close, signal=signals.engine_stopped)
+        return o
 
     def _process_cookies(self, cookies, *, jar, request):
         for cookie in cookies:
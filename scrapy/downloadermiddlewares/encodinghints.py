@@ -0,0 +1,40 @@
+"""
+Encoding Hints Middleware
+
+See documentation in docs/topics/downloader-middleware.rst
+"""
+from scrapy.exceptions import NotConfigured
+from scrapy.http import TextResponse
+from scrapy.utils.datatypes import LocalCache
+from scrapy.utils.httpobj import urlparse_cached
+
+
+class EncodingHintsMiddleware:
+    """Remembers the encoding that each host declares in its responses, and
+    uses it as the encoding hint of its responses that declare none."""
+
+    def __init__(self, max_hosts=10000):
+        self._hints = LocalCache(limit=max_hosts)
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool("ENCODING_HINTS_ENABLED"):
+            raise NotConfigured
+        return cls(crawler.settings.getint("ENCODING_HINTS_MAX_HOSTS"))
+
+    def process_response(self, request, response, spider):
+        if not isinstance(response, TextResponse):
+            return response
+        host = urlparse_cached(request).hostname
+        # byte order marks and the encoding argument only apply to one
+        # response, while headers and body declarations come from the site
+        declared = response._headers_encoding() or response._body_declared_encoding()
+        if declared:
+            self._hints[host] = declared
+            return response
+        hint = self._hints.get(host)
+        if hint is None or response.encoding_hint is not None:
+            return response
+        if response._encoding or response._bom_encoding():
+            return response
+        return response.replace(encoding=None, encoding_hint=hint)
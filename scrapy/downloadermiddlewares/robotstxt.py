@@ -4,31 +4,172 @@ enable this middleware and enable the ROBOTSTXT_OBEY setting.
 
 """
 
+import hashlib
 import logging
+import os
+import pickle
+from contextlib import suppress
+from pathlib import Path
+from time import time
+from typing import Optional, Tuple
 
 from twisted.internet.defer import Deferred, maybeDeferred
 
 from scrapy.exceptions import IgnoreRequest, NotConfigured
+from scrapy.extensions.httpcache import parse_cachecontrol
 from scrapy.http import Request
 from scrapy.http.request import NO_CALLBACK
+from scrapy.utils.datatypes import LocalCache
 from scrapy.utils.httpobj import urlparse_cached
+from scrapy.utils.job import write_atomically
 from scrapy.utils.log import failure_to_exc_info
 from scrapy.utils.misc import load_object
+from scrapy.utils.project import data_path
+from scrapy.utils.python import to_bytes
 
 logger = logging.getLogger(__name__)
 
 
+class RobotsTxtCache:
+    """Cache of robots.txt bodies by netloc.
+
+    Bodies are kept in memory, for up to ROBOTSTXT_CACHE_SIZE netlocs, and,
+    if ROBOTSTXT_CACHE_DIR is set, on disk, to be reused by other crawlers
+    and later crawls. They expire after the max-age of their Cache-Control header or,
+    without it, after ROBOTSTXT_CACHE_EXPIRATION_SECS.
+
+    The modification time of cache files is set to their expiration time, so
+    that expired files can be found without reading them.
+    """
+
+    def __init__(self, settings):
+        self.memory: LocalCache[str, Tuple[bytes, float]] = LocalCache(
+            limit=settings.getint("ROBOTSTXT_CACHE_SIZE")
+        )
+        self.expiration_secs = settings.getint("ROBOTSTXT_CACHE_EXPIRATION_SECS")
+        cachedir = settings.get("ROBOTSTXT_CACHE_DIR")
+        self.cachedir = data_path(cachedir, createdir=True) if cachedir else None
+        if self.cachedir:
+            self._remove_expired()
+
+    def get(self, netloc: str) -> Optional[bytes]:
+        entry = self.memory.get(netloc)
+        if entry is None and self.cachedir:
+            entry = self._read(netloc)
+            if entry is not None:
+                self.memory[netloc] = entry
+        if entry is None:
+            return None
+        body, expires = entry
+        if expires <= time():
+            del self.memory[netloc]
+            if self.cachedir:
+                self._remove(self._get_path(netloc))
+            return None
+        self.memory.move_to_end(netloc)
+        return body
+
+    def store(self, netloc: str, response) -> None:
+        expiration_secs = self._expiration_secs(response)
+        if expiration_secs <= 0:
+            return
+        now = time()
+        entry = (response.body, now + expiration_secs)
+        self.memory[netloc] = entry
+        if self.cachedir:
+            data = {
+                "netloc": netloc,
+                "body": response.body,
+                "fetched_at": now,
+                "expires_at": entry[1],
+            }
+            path = self._get_path(netloc)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                write_atomically(path, pickle.dumps(data, protocol=4))
+                os.utime(path, (now, entry[1]))
+            except OSError as e:
+                logger.warning(
+                    "Could not write the robots.txt cache file %(path)s: %(error)s",
+                    {"path": path, "error": e},
+                )
+
+    def _expiration_secs(self, response) -> float:
+        if response.status >= 500:
+            # a temporary error, the next crawl should try again
+            return 0
+        cc = parse_cachecontrol(response.headers.get(b"Cache-Control", b""))
+        if b"no-store" in cc:
+            return 0
+        try:
+            return int(cc[b"max-age"])
+        except (KeyError, TypeError, ValueError):
+            return self.expiration_secs
+
+    def _read(self, netloc: str) -> Optional[Tuple[bytes, float]]:
+        path = self._get_path(netloc)
+        try:
+            data = pickle.loads(path.read_bytes())
+            return data["body"], data["expires_at"]
+        except FileNotFoundError:
+            return None
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            ValueError,
+            KeyError,
+            TypeError,
+        ) as e:
+            # e.g. a file truncated by a crash or written by another program
+            logger.warning(
+                "Removing the invalid robots.txt cache file %(path)s: %(error)s",
+                {"path": path, "error": e},
+            )
+            self._remove(path)
+            return None
+
+    def _remove(self, path: Path) -> None:
+        with suppress(OSError):
+            path.unlink()
+
+    def _remove_expired(self) -> None:
+        now = time()
+        for path in Path(self.cachedir).glob("*/*"):
+            # temporary files of writes in progress
+            if path.suffix == ".tmp":
+                continue
+            with suppress(OSError):
+                if path.stat().st_mtime <= now:
+                    path.unlink()
+
+    def _get_path(self, netloc: str) -> Path:
+        key = hashlib.sha1(to_bytes(netloc)).hexdigest()
+        return Path(self.cachedir, key[0:2], key)
+
+
 class RobotsTxtMiddleware:
     DOWNLOAD_PRIORITY = 1000
 
     def __init__(self, crawler):
-        if not crawler.settings.getbool("ROBOTSTXT_OBEY"):
+        settings = crawler.settings
+        if not settings.getbool("ROBOTSTXT_OBEY"):
             raise NotConfigured
-        self._default_useragent = crawler.settings.get("USER_AGENT", "Scrapy")
-        self._robotstxt_useragent = crawler.settings.get("ROBOTSTXT_USER_AGENT", None)
+        self._default_useragent = settings.get("USER_AGENT", "Scrapy")
+        self._robotstxt_useragent = settings.get("ROBOTSTXT_USER_AGENT", None)
         self.crawler = crawler
-        self._parsers = {}
-        self._parserimpl = load_object(crawler.settings.get("ROBOTSTXT_PARSER"))
+        # Deferreds of the robots.txt files being downloaded, by netloc
+        self._pending = {}
+        self._cache = None
+        if settings.getbool("ROBOTSTXT_CACHE_ENABLED"):
+            self._cache = RobotsTxtCache(settings)
+        # parsers by netloc, least recently used first; they are only
+        # forgotten if the disk cache can load their robots.txt file again
+        limit = None
+        if self._cache is not None and self._cache.cachedir:
+            limit = settings.getint("ROBOTSTXT_CACHE_SIZE")
+        self._parsers = LocalCache(limit=limit)
+        self._parserimpl = load_object(settings.get("ROBOTSTXT_PARSER"))
 
         # check if parser dependencies are met, this should throw an error otherwise.
         self._parserimpl.from_crawler(self.crawler, b"")
@@ -66,32 +207,43 @@ class RobotsTxtMiddleware:
         url = urlparse_cached(request)
         netloc = url.netloc
 
-        if netloc not in self._parsers:
-            self._parsers[netloc] = Deferred()
-            robotsurl = f"{url.scheme}://{url.netloc}/robots.txt"
-            robotsreq = Request(
-                robotsurl,
-                priority=self.DOWNLOAD_PRIORITY,
-                meta={"dont_obey_robotstxt": True},
-                callback=NO_CALLBACK,
-            )
-            dfd = self.crawler.engine.download(robotsreq)
-            dfd.addCallback(self._parse_robots, netloc, spider)
-            dfd.addErrback(self._logerror, robotsreq, spider)
-            dfd.addErrback(self._robots_error, netloc)
-            self.crawler.stats.inc_value("robotstxt/request_count")
+        if netloc not in self._parsers and netloc not in self._pending:
+            body = self._cache.get(netloc) if self._cache else None
+            if body is not None:
+                self.crawler.stats.inc_value("robotstxt/cache_hit")
+                self._parsers[netloc] = self._parserimpl.from_crawler(
+                    self.crawler, body
+                )
+            else:
+                self._download_robots(url, netloc, spider)
 
-        if isinstance(self._parsers[netloc], Deferred):
+        if netloc in self._pending:
             d = Deferred()
 
             def cb(result):
                 d.callback(result)
                 return result
 
-            self._parsers[netloc].addCallback(cb)
+            self._pending[netloc].addCallback(cb)
             return d
+        self._parsers.move_to_end(netloc)
         return self._parsers[netloc]
 
+    def _download_robots(self, url, netloc, spider):
+        self._pending[netloc] = Deferred()
+        robotsurl = f"{url.scheme}://{url.netloc}/robots.txt"
+        robotsreq = Request(
+            robotsurl,
+            priority=self.DOWNLOAD_PRIORITY,
+            meta={"dont_obey_robotstxt": True},
+            callback=NO_CALLBACK,
+        )
+        dfd = self.crawler.engine.download(robotsreq)
+        dfd.addCallback(self._parse_robots, netloc, spider)
+        dfd.addErrback(self._logerror, robotsreq, spider)
+        dfd.addErrback(self._robots_error, netloc)
+        self.crawler.stats.inc_value("robotstxt/request_count")
+
     def _logerror(self, failure, request, spider):
         if failure.type is not IgnoreRequest:
             logger.error(
@@ -108,14 +260,14 @@ class RobotsTxtMiddleware:
             f"robotstxt/response_status_count/{response.status}"
         )
         rp = self._parserimpl.from_crawler(self.crawler, response.body)
-        rp_dfd = self._parsers[netloc]
+        if self._cache is not None:
+            self._cache.store(netloc, response)
         self._parsers[netloc] = rp
-        rp_dfd.callback(rp)
+        self._pending.pop(netloc).callback(rp)
 
     def _robots_error(self, failure, netloc):
         if failure.type is not IgnoreRequest:
             key = f"robotstxt/exception_count/{failure.type}"
             self.crawler.stats.inc_value(key)
-        rp_dfd = self._parsers[netloc]
         self._parsers[netloc] = None
-        rp_dfd.callback(None)
+        self._pending.pop(netloc).callback(None)
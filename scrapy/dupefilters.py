@@ -119,6 +119,11 @@ class RFPDupeFilter(BaseDupeFilter):
     def request_fingerprint(self, request: Request) -> str:
         return self.fingerprinter.fingerprint(request).hex()
 
+    def checkpoint(self) -> None:
+        """Write the fingerprints seen so far to disk."""
+        if self.file:
+            self.file.flush()
+
     def close(self, reason: str) -> None:
         if self.file:
             self.file.close()
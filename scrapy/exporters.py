@@ -4,18 +4,27 @@ Item Exporters are used to export/serialize items into different formats.
 
 import csv
 import io
+import logging
 import marshal
 import pickle
 import pprint
 from collections.abc import Mapping
+from functools import partial
+from types import MappingProxyType
 from xml.sax.saxutils import XMLGenerator
 
 from itemadapter import ItemAdapter, is_item
 
+from scrapy.exceptions import NotConfigured
 from scrapy.item import Item
+from scrapy.utils.deprecate import method_is_overridden
 from scrapy.utils.python import is_listlike, to_bytes, to_unicode
 from scrapy.utils.serialize import ScrapyJSONEncoder
 
+logger = logging.getLogger(__name__)
+
+_NO_FIELD_META = MappingProxyType({})
+
 __all__ = [
     "BaseItemExporter",
     "PprintItemExporter",
@@ -25,6 +34,7 @@ __all__ = [
     "JsonLinesItemExporter",
     "JsonItemExporter",
     "MarshalItemExporter",
+    "ParquetItemExporter",
 ]
 
 
@@ -32,6 +42,10 @@ class BaseItemExporter:
     def __init__(self, *, dont_fail=False, **kwargs):
         self._kwargs = kwargs
         self._configure(kwargs, dont_fail=dont_fail)
+        self._serializers = {}
+        self._serialize_field_overridden = method_is_overridden(
+            self.__class__, BaseItemExporter, "serialize_field"
+        )
 
     def _configure(self, options, dont_fail=False):
         """Configure the exporter by popping options from the ``options`` dict.
@@ -52,6 +66,10 @@ class BaseItemExporter:
         serializer = field.get("serializer", lambda x: x)
         return serializer(value)
 
+    @classmethod
+    def check_requirements(cls):
+        pass
+
     def start_exporting(self):
         pass
 
@@ -62,11 +80,43 @@ class BaseItemExporter:
         """Return the fields to export as an iterable of tuples
         (name, serialized_value)
         """
-        item = ItemAdapter(item)
-
         if include_empty is None:
             include_empty = self.export_empty_fields
 
+        if self.fields_to_export is None and not include_empty:
+            # Fast path for the default options: iterate the item values
+            # without going through ItemAdapter, and reuse the serializers of
+            # previous items of the same class.
+            if isinstance(item, dict):
+                # dicts have no field metadata, and their serializers are not
+                # cached because their keys can be anything
+                if not self._serialize_field_overridden:
+                    yield from item.items()
+                    return
+                for field_name, value in item.items():
+                    yield field_name, self.serialize_field(
+                        _NO_FIELD_META, field_name, value
+                    )
+                return
+            if isinstance(item, Item):
+                values = item._values
+            else:
+                values = ItemAdapter(item)
+            serializers = self._serializers
+            item_class = item.__class__
+            for field_name, value in values.items():
+                key = (item_class, field_name, field_name)
+                if key in serializers:
+                    serializer = serializers[key]
+                else:
+                    serializer = self._get_serializer(item, field_name, field_name)
+                if serializer is not None:
+                    value = serializer(value)
+                yield field_name, value
+            return
+
+        item = ItemAdapter(item)
+
         if self.fields_to_export is None:
             if include_empty:
                 field_iter = item.field_names()
@@ -91,31 +141,85 @@ class BaseItemExporter:
             else:
                 item_field, output_field = field_name
             if item_field in item:
-                field_meta = item.get_field_meta(item_field)
-                value = self.serialize_field(field_meta, output_field, item[item_field])
+                value = item[item_field]
+                serializer = self._get_serializer(item.item, item_field, output_field)
+                if serializer is not None:
+                    value = serializer(value)
             else:
                 value = default_value
 
             yield output_field, value
 
+    def _get_serializer(self, item, item_field, output_field):
+        """Return a callable that serializes the value of *item_field* in
+        *item*, and in later items of the same class, as *output_field*, or
+        ``None`` if the value does not need serializing.
+
+        Serializers are cached, except for dict items."""
+        key = (item.__class__, item_field, output_field)
+        try:
+            return self._serializers[key]
+        except KeyError:
+            pass
+        field_meta = ItemAdapter(item).get_field_meta(item_field)
+        if self._serialize_field_overridden:
+            serializer = partial(self.serialize_field, field_meta, output_field)
+        else:
+            serializer = field_meta.get("serializer")
+        if not isinstance(item, dict):
+            self._serializers[key] = serializer
+        return serializer
+
+
+class _WriteBuffer:
+    """Joins the data written to it into writes to *file* of at least *size*
+    bytes, so that each item does not cost a write to a file that may be
+    compressing or uploading its input."""
+
+    def __init__(self, file, size):
+        self.file = file
+        self.size = size
+        self._chunks = []
+        self._length = 0
+
+    def write(self, data):
+        if not self.size:
+            self.file.write(data)
+            return
+        self._chunks.append(data)
+        self._length += len(data)
+        if self._length >= self.size:
+            self.flush()
+
+    def flush(self):
+        if self._chunks:
+            self.file.write(b"".join(self._chunks))
+            self._chunks.clear()
+            self._length = 0
+
 
 class JsonLinesItemExporter(BaseItemExporter):
-    def __init__(self, file, **kwargs):
+    def __init__(self, file, *, buffer_size=0, **kwargs):
         super().__init__(dont_fail=True, **kwargs)
         self.file = file
+        self._buffer = _WriteBuffer(file, buffer_size)
         self._kwargs.setdefault("ensure_ascii", not self.encoding)
         self.encoder = ScrapyJSONEncoder(**self._kwargs)
 
     def export_item(self, item):
         itemdict = dict(self._get_serialized_fields(item))
         data = self.encoder.encode(itemdict) + "\n"
-        self.file.write(to_bytes(data, self.encoding))
+        self._buffer.write(to_bytes(data, self.encoding))
+
+    def finish_exporting(self):
+        self._buffer.flush()
 
 
 class JsonItemExporter(BaseItemExporter):
-    def __init__(self, file, **kwargs):
+    def __init__(self, file, *, buffer_size=0, **kwargs):
         super().__init__(dont_fail=True, **kwargs)
         self.file = file
+        self._buffer = _WriteBuffer(file, buffer_size)
         # there is a small difference between the behaviour or JsonItemExporter.indent
         # and ScrapyJSONEncoder.indent. ScrapyJSONEncoder.indent=None is needed to prevent
         # the addition of newlines everywhere
@@ -129,28 +233,29 @@ class JsonItemExporter(BaseItemExporter):
 
     def _beautify_newline(self):
         if self.indent is not None:
-            self.file.write(b"\n")
+            self._buffer.write(b"\n")
 
     def _add_comma_after_first(self):
         if self.first_item:
             self.first_item = False
         else:
-            self.file.write(b",")
+            self._buffer.write(b",")
             self._beautify_newline()
 
     def start_exporting(self):
-        self.file.write(b"[")
+        self._buffer.write(b"[")
         self._beautify_newline()
 
     def finish_exporting(self):
         self._beautify_newline()
-        self.file.write(b"]")
+        self._buffer.write(b"]")
+        self._buffer.flush()
 
     def export_item(self, item):
         itemdict = dict(self._get_serialized_fields(item))
         data = to_bytes(self.encoder.encode(itemdict), self.encoding)
         self._add_comma_after_first()
-        self.file.write(data)
+        self._buffer.write(data)
 
 
 class XmlItemExporter(BaseItemExporter):
@@ -354,3 +459,243 @@ class PythonItemExporter(BaseItemExporter):
     def export_item(self, item):
         result = dict(self._get_serialized_fields(item))
         return result
+
+
+class ParquetItemExporter(BaseItemExporter):
+    """Exports items in the `Apache Parquet`_ columnar format. Requires
+    pyarrow_.
+
+    Items are buffered as one list of values per column, and every
+    ``row_group_size`` items those columns are converted into typed Arrow
+    arrays and written to ``file`` as a Parquet row group.
+
+    The type of each column is taken from ``schema``, a
+    :class:`pyarrow.Schema` or a :class:`dict` of column names and
+    :class:`pyarrow.DataType` objects, in which case only those columns are
+    exported. Otherwise, it is taken from the ``arrow_type`` key of the
+    :ref:`field metadata <topics-items-fields>` of the column, or inferred
+    from the values of the first row group. Fields first found after the
+    first row group has been written are not exported. Values are cast to
+    the type of their column when needed. Values that cannot be cast are
+    exported as null, and a column whose first values have different types
+    is exported as strings; a warning is logged in both cases.
+
+    :param file: The file-like object to use for exporting the data. Its
+                 ``write`` method should accept :class:`bytes` (a disk file
+                 opened in binary mode, a :class:`~io.BytesIO` object, etc)
+
+    :param compression: The compression codec of the column data, e.g.
+                        ``"snappy"``, ``"zstd"``, ``"gzip"`` or ``"none"``.
+
+    .. _Apache Parquet: https://parquet.apache.org/
+    .. _pyarrow: https://arrow.apache.org/docs/python/
+    """
+
+    def __init__(
+        self,
+        file,
+        *,
+        row_group_size=10_000,
+        schema=None,
+        compression="snappy",
+        **kwargs,
+    ):
+        self.check_requirements()
+        import pyarrow
+        import pyarrow.parquet
+
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._conversion_errors = (
+            pyarrow.ArrowException,
+            OverflowError,
+            TypeError,
+            ValueError,
+        )
+        super().__init__(**kwargs)
+        self.file = file
+        self.row_group_size = row_group_size
+        self.compression = compression
+        if isinstance(schema, pyarrow.Schema):
+            schema = dict(zip(schema.names, schema.types))
+        self._types = dict(schema or {})
+        self._columns = {name: [] for name in self._types}
+        self._closed_schema = schema is not None
+        self._item_fields = {}
+        if isinstance(self.fields_to_export, Mapping):
+            self._item_fields = {v: k for k, v in self.fields_to_export.items()}
+        elif self.fields_to_export is not None:
+            for field in self.fields_to_export:
+                if not isinstance(field, str):
+                    self._item_fields[field[1]] = field[0]
+        self._row_count = 0
+        self._schema = None
+        self._writer = None
+        self._ignored_fields = set()
+
+    @classmethod
+    def check_requirements(cls):
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise NotConfigured("ParquetItemExporter requires installing pyarrow")
+
+    def export_item(self, item):
+        columns = self._columns
+        row_count = self._row_count
+        for name, value in self._get_serialized_fields(item):
+            column = columns.get(name)
+            if column is None:
+                if self._closed_schema:
+                    self._ignore_field(name)
+                    continue
+                column = columns[name] = [None] * row_count
+                self._add_field_type(item, name)
+            column.append(value)
+        self._row_count = row_count = row_count + 1
+        for column in columns.values():
+            if len(column) < row_count:
+                column.append(None)
+        if row_count >= self.row_group_size:
+            self._write_row_group()
+
+    def finish_exporting(self):
+        try:
+            if self._row_count or self._writer is None:
+                self._write_row_group()
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+
+    def serialize_field(self, field, name, value):
+        serializer = field.get("serializer", self._serialize_value)
+        return serializer(value)
+
+    def _serialize_value(self, value):
+        if value is None or isinstance(value, (str, bytes, int, float)):
+            return value
+        if is_item(value):
+            return {k: self._serialize_value(v) for k, v in ItemAdapter(value).items()}
+        if is_listlike(value):
+            return [self._serialize_value(v) for v in value]
+        return value
+
+    def _add_field_type(self, item, name):
+        item_field = self._item_fields.get(name, name)
+        try:
+            arrow_type = ItemAdapter(item).get_field_meta(item_field).get("arrow_type")
+        except KeyError:
+            return
+        if arrow_type is not None:
+            self._types[name] = arrow_type
+
+    def _ignore_field(self, name):
+        if name not in self._ignored_fields:
+            self._ignored_fields.add(name)
+            logger.warning(
+                "Field %(name)r is not part of the schema of the Parquet file, "
+                "its values will not be exported.",
+                {"name": name},
+            )
+
+    def _start_writer(self):
+        """Create the Parquet writer, with a schema made of the declared
+        column types and those inferred from the buffered values, and return
+        the Arrow arrays built while inferring."""
+        pa = self._pa
+        names = list(self._columns)
+        if self.fields_to_export is not None and not self._closed_schema:
+            order = {name: i for i, name in enumerate(self._output_names())}
+            names.sort(key=lambda name: order.get(name, len(order)))
+        arrays = {}
+        fields = []
+        for name in names:
+            arrow_type = self._types.get(name)
+            if arrow_type is None:
+                array = self._to_array(name)
+                if pa.types.is_null(array.type):
+                    array = array.cast(pa.string())
+                arrays[name] = array
+                arrow_type = array.type
+            fields.append(pa.field(name, arrow_type))
+        self._schema = pa.schema(fields)
+        self._columns = {name: self._columns[name] for name in names}
+        self._closed_schema = True
+        self._writer = self._pq.ParquetWriter(
+            self.file, self._schema, compression=self.compression
+        )
+        return arrays
+
+    def _output_names(self):
+        if isinstance(self.fields_to_export, Mapping):
+            return self.fields_to_export.values()
+        return (
+            name if isinstance(name, str) else name[1] for name in self.fields_to_export
+        )
+
+    def _to_array(self, name, arrow_type=None):
+        """Return the buffered values of column *name* as an Arrow array of
+        *arrow_type*, or of the type inferred from them if ``None``.
+
+        Values that pyarrow does not convert to *arrow_type* directly, e.g.
+        integers in a column whose type was inferred as string from a first
+        row group with no values, are cast to it, and those that cannot be
+        cast are replaced by null. If no type can be inferred, the column is
+        a string column."""
+        pa = self._pa
+        values = self._columns[name]
+        try:
+            return pa.array(values, type=arrow_type)
+        except self._conversion_errors:
+            pass
+        if arrow_type is None:
+            logger.warning(
+                "Field %(name)r has values of different types, it will be "
+                "exported as strings.",
+                {"name": name},
+            )
+            arrow_type = pa.string()
+        try:
+            return pa.array(values).cast(arrow_type)
+        except self._conversion_errors:
+            pass
+        converted = []
+        invalid = 0
+        for value in values:
+            try:
+                value = self._convert_value(value, arrow_type)
+            except self._conversion_errors:
+                value = None
+                invalid += 1
+            converted.append(value)
+        if invalid:
+            logger.warning(
+                "%(count)d values of field %(name)r cannot be converted to "
+                "%(type)s, they are exported as null.",
+                {"count": invalid, "name": name, "type": arrow_type},
+            )
+        return pa.array(converted, type=arrow_type)
+
+    def _convert_value(self, value, arrow_type):
+        pa = self._pa
+        try:
+            array = pa.array([value], type=arrow_type)
+        except self._conversion_errors:
+            array = pa.array([value]).cast(arrow_type)
+        return array[0].as_py()
+
+    def _write_row_group(self):
+        arrays = self._start_writer() if self._writer is None else {}
+        if not self._row_count:
+            return
+        for field in self._schema:
+            if field.name not in arrays:
+                arrays[field.name] = self._to_array(field.name, field.type)
+        table = self._pa.Table.from_arrays(
+            [arrays[name] for name in self._schema.names], schema=self._schema
+        )
+        self._writer.write_table(table, row_group_size=self._row_count)
+        for column in self._columns.values():
+            column.clear()
+        self._row_count = 0
@@ -4,13 +4,15 @@ Feed Exports extension
 See documentation in docs/topics/feed-exports.rst
 """
 
+import io
 import logging
 import re
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path, PureWindowsPath
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryFile
 from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import unquote, urlparse
 
@@ -161,7 +163,89 @@ class FileFeedStorage:
         file.close()
 
 
+class _S3MultipartUploadFile(io.RawIOBase):
+    """Write-only file that uploads its content to S3 while it is written.
+
+    Data is spooled to a temporary file until it reaches *part_size* bytes,
+    and that file is then uploaded as a part of an S3 multipart upload, in a
+    pool of *concurrency* threads, so that at most *concurrency* parts are
+    uploaded at a time. Writing never waits for uploads: parts written faster
+    than they are uploaded wait in their temporary files, and only parts not
+    uploaded yet use disk space.
+    """
+
+    def __init__(self, storage, part_size, concurrency, tempdir):
+        self._storage = storage
+        self._part_size = part_size
+        self._tempdir = tempdir
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="feed-s3-upload"
+        )
+        self._upload_id = None
+        self._parts = []
+        self._part = TemporaryFile(prefix="feed-", dir=tempdir)
+        self._part_bytes = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        written = self._part.write(data)
+        self._part_bytes += written
+        if self._part_bytes >= self._part_size:
+            self._submit_part()
+        return written
+
+    def _submit_part(self):
+        if self._upload_id is None:
+            self._upload_id = self._executor.submit(
+                self._storage._create_multipart_upload
+            )
+        self._part.seek(0)
+        self._parts.append(
+            self._executor.submit(self._upload_part, len(self._parts) + 1, self._part)
+        )
+        self._part = TemporaryFile(prefix="feed-", dir=self._tempdir)
+        self._part_bytes = 0
+
+    def _upload_part(self, number, file):
+        try:
+            return self._storage._upload_part(self._upload_id.result(), number, file)
+        finally:
+            file.close()
+
+    def complete(self):
+        """Upload the remaining data and complete the upload. Blocks until
+        every part has been uploaded."""
+        try:
+            if self._upload_id is None:
+                # Less than a part was written, a multipart upload is not
+                # needed.
+                self._part.seek(0)
+                self._storage._upload_file(self._part)
+                return
+            if self._part_bytes:
+                self._submit_part()
+            try:
+                parts = [part.result() for part in self._parts]
+                self._storage._complete_multipart_upload(
+                    self._upload_id.result(), parts
+                )
+            except Exception:
+                # parts still being uploaded could be stored after the abort
+                wait(self._parts)
+                if self._upload_id.exception() is None:
+                    self._storage._abort_multipart_upload(self._upload_id.result())
+                raise
+        finally:
+            self._part.close()
+            self._executor.shutdown()
+
+
 class S3FeedStorage(BlockingFeedStorage):
+    # Amazon S3 rejects multipart uploads with smaller parts, but the last one.
+    _MIN_PART_SIZE = 5 * 1024 * 1024
+
     def __init__(
         self,
         uri,
@@ -173,6 +257,8 @@ class S3FeedStorage(BlockingFeedStorage):
         feed_options=None,
         session_token=None,
         region_name=None,
+        part_size=0,
+        part_concurrency=4,
     ):
         if not is_botocore_available():
             raise NotConfigured("missing botocore library")
@@ -185,6 +271,16 @@ class S3FeedStorage(BlockingFeedStorage):
         self.acl = acl
         self.endpoint_url = endpoint_url
         self.region_name = region_name
+        if 0 < part_size < self._MIN_PART_SIZE:
+            logger.warning(
+                "FEED_STORAGE_S3_PART_SIZE (%(part_size)s) is lower than the "
+                "minimum part size of Amazon S3, using %(min_part_size)s "
+                "instead.",
+                {"part_size": part_size, "min_part_size": self._MIN_PART_SIZE},
+            )
+            part_size = self._MIN_PART_SIZE
+        self.part_size = part_size
+        self.part_concurrency = part_concurrency
 
         if IS_BOTO3_AVAILABLE:
             import boto3.session
@@ -238,10 +334,31 @@ class S3FeedStorage(BlockingFeedStorage):
             endpoint_url=crawler.settings["AWS_ENDPOINT_URL"] or None,
             region_name=crawler.settings["AWS_REGION_NAME"] or None,
             feed_options=feed_options,
+            part_size=crawler.settings.getint("FEED_STORAGE_S3_PART_SIZE"),
+            part_concurrency=crawler.settings.getint(
+                "FEED_STORAGE_S3_PART_CONCURRENCY"
+            ),
+        )
+
+    def open(self, spider):
+        if not self.part_size:
+            return super().open(spider)
+        path = spider.crawler.settings["FEED_TEMPDIR"]
+        if path and not Path(path).is_dir():
+            raise OSError("Not a Directory: " + str(path))
+        return _S3MultipartUploadFile(
+            self, self.part_size, max(1, self.part_concurrency), path
         )
 
     def _store_in_thread(self, file):
+        if isinstance(file, _S3MultipartUploadFile):
+            file.complete()
+            return
         file.seek(0)
+        self._upload_file(file)
+        file.close()
+
+    def _upload_file(self, file):
         if IS_BOTO3_AVAILABLE:
             kwargs = {"ExtraArgs": {"ACL": self.acl}} if self.acl else {}
             self.s3_client.upload_fileobj(
@@ -252,7 +369,36 @@ class S3FeedStorage(BlockingFeedStorage):
             self.s3_client.put_object(
                 Bucket=self.bucketname, Key=self.keyname, Body=file, **kwargs
             )
-        file.close()
+
+    def _create_multipart_upload(self):
+        kwargs = {"ACL": self.acl} if self.acl else {}
+        response = self.s3_client.create_multipart_upload(
+            Bucket=self.bucketname, Key=self.keyname, **kwargs
+        )
+        return response["UploadId"]
+
+    def _upload_part(self, upload_id, number, file):
+        response = self.s3_client.upload_part(
+            Bucket=self.bucketname,
+            Key=self.keyname,
+            UploadId=upload_id,
+            PartNumber=number,
+            Body=file,
+        )
+        return {"ETag": response["ETag"], "PartNumber": number}
+
+    def _complete_multipart_upload(self, upload_id, parts):
+        self.s3_client.complete_multipart_upload(
+            Bucket=self.bucketname,
+            Key=self.keyname,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    def _abort_multipart_upload(self, upload_id):
+        self.s3_client.abort_multipart_upload(
+            Bucket=self.bucketname, Key=self.keyname, UploadId=upload_id
+        )
 
 
 class GCSFeedStorage(BlockingFeedStorage):
@@ -604,9 +750,21 @@ class FeedExporter:
         return d
 
     def _exporter_supported(self, format):
-        if format in self.exporters:
-            return True
-        logger.error("Unknown feed format: %(format)s", {"format": format})
+        if format not in self.exporters:
+            logger.error("Unknown feed format: %(format)s", {"format": format})
+            return False
+        # exporters do not need to subclass BaseItemExporter
+        check_requirements = getattr(self.exporters[format], "check_requirements", None)
+        try:
+            if check_requirements is not None:
+                check_requirements()
+        except NotConfigured as e:
+            logger.error(
+                "Disabled feed format: %(format)s. Reason: %(reason)s",
+                {"format": format, "reason": str(e)},
+            )
+            return False
+        return True
 
     def _settings_are_valid(self):
         """
@@ -8,7 +8,7 @@ import gc
 
 from scrapy import signals
 from scrapy.exceptions import NotConfigured
-from scrapy.utils.trackref import live_refs
+from scrapy.utils.trackref import _iter_live_counts
 
 
 class MemoryDebugger:
@@ -28,9 +28,9 @@ class MemoryDebugger:
         self.stats.set_value(
             "memdebug/gc_garbage_count", len(gc.garbage), spider=spider
         )
-        for cls, wdict in live_refs.items():
-            if not wdict:
+        for cls, count in _iter_live_counts():
+            if not count:
                 continue
             self.stats.set_value(
-                f"memdebug/live_refs/{cls.__name__}", len(wdict), spider=spider
+                f"memdebug/live_refs/{cls.__name__}", count, spider=spider
             )
@@ -1,15 +1,91 @@
 """
 Extension for processing data before they are exported to feeds.
 """
-from bz2 import BZ2File
+import bz2
+import lzma
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from gzip import GzipFile
-from io import IOBase
-from lzma import LZMAFile
-from typing import Any, BinaryIO, Dict, List
+from io import BytesIO, IOBase
+from typing import Any, BinaryIO, Callable, Deque, Dict, List, Optional
 
 from scrapy.utils.misc import load_object
 
 
+class _BlockCompressor:
+    """
+    Splits received data into blocks of at least ``block_size`` bytes,
+    compresses each block independently in a pool of ``workers`` threads, and
+    writes the compressed blocks to ``file`` in order.
+
+    The caller thread only joins data into blocks and writes the compressed
+    blocks that are ready, unless ``2 * workers`` blocks are already waiting,
+    in which case it waits for the oldest one.
+    """
+
+    block_size = 1024 * 1024
+
+    def __init__(
+        self, file: BinaryIO, compress: Callable[[bytes], bytes], workers: int
+    ) -> None:
+        self.file = file
+        self._compress = compress
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="feed-compression"
+        )
+        self._max_pending = 2 * workers
+        self._pending: Deque = deque()
+        self._chunks: List[bytes] = []
+        self._size = 0
+        self._empty = True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._size += len(data)
+        if self._size >= self.block_size:
+            self._submit()
+        return len(data)
+
+    def close(self) -> None:
+        try:
+            if self._chunks or self._empty:
+                self._submit()
+            self._write_compressed(wait=True)
+        finally:
+            self._executor.shutdown()
+
+    def _submit(self) -> None:
+        block = b"".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        self._empty = False
+        self._pending.append(self._executor.submit(self._compress, block))
+        self._write_compressed()
+
+    def _write_compressed(self, wait: bool = False) -> None:
+        pending = self._pending
+        while pending and (
+            wait or pending[0].done() or len(pending) > self._max_pending
+        ):
+            self.file.write(pending.popleft().result())
+
+
+def _gzip_compress(
+    data: bytes, compresslevel: int, mtime: Optional[float], filename: str
+) -> bytes:
+    buffer = BytesIO()
+    with GzipFile(
+        fileobj=buffer,
+        mode="wb",
+        compresslevel=compresslevel,
+        mtime=mtime,
+        filename=filename,
+    ) as member:
+        member.write(data)
+    return buffer.getvalue()
+
+
 class GzipPlugin:
     """
     Compresses received data using `gzip <https://en.wikipedia.org/wiki/Gzip>`_.
@@ -19,8 +95,14 @@ class GzipPlugin:
     - `gzip_compresslevel`
     - `gzip_mtime`
     - `gzip_filename`
+    - `gzip_workers`
 
     See :py:class:`gzip.GzipFile` for more info about parameters.
+
+    If `gzip_workers` is set to a number greater than ``0``, data is
+    compressed in blocks of 1 MiB in that many threads, each block as a
+    separate gzip member. Standard gzip tools decompress such multi-member
+    files as a whole.
     """
 
     def __init__(self, file: BinaryIO, feed_options: Dict[str, Any]) -> None:
@@ -29,6 +111,20 @@ class GzipPlugin:
         compress_level = self.feed_options.get("gzip_compresslevel", 9)
         mtime = self.feed_options.get("gzip_mtime")
         filename = self.feed_options.get("gzip_filename")
+        workers = self.feed_options.get("gzip_workers", 0)
+        if workers:
+            if filename is None:
+                filename = getattr(self.file, "name", "")
+                if not isinstance(filename, (str, bytes)):
+                    filename = ""
+            compress = partial(
+                _gzip_compress,
+                compresslevel=compress_level,
+                mtime=mtime,
+                filename=filename,
+            )
+            self.gzipfile = _BlockCompressor(self.file, compress, workers)
+            return
         self.gzipfile = GzipFile(
             fileobj=self.file,
             mode="wb",
@@ -52,15 +148,26 @@ class Bz2Plugin:
     Accepted ``feed_options`` parameters:
 
     - `bz2_compresslevel`
+    - `bz2_workers`
 
     See :py:class:`bz2.BZ2File` for more info about parameters.
+
+    If `bz2_workers` is set to a number greater than ``0``, data is
+    compressed in blocks of 1 MiB in that many threads, each block as a
+    separate bz2 stream. Standard bzip2 tools decompress such multi-stream
+    files as a whole.
     """
 
     def __init__(self, file: BinaryIO, feed_options: Dict[str, Any]) -> None:
         self.file = file
         self.feed_options = feed_options
         compress_level = self.feed_options.get("bz2_compresslevel", 9)
-        self.bz2file = BZ2File(
+        workers = self.feed_options.get("bz2_workers", 0)
+        if workers:
+            compress = partial(bz2.compress, compresslevel=compress_level)
+            self.bz2file = _BlockCompressor(self.file, compress, workers)
+            return
+        self.bz2file = bz2.BZ2File(
             filename=self.file, mode="wb", compresslevel=compress_level
         )
 
@@ -82,11 +189,18 @@ class LZMAPlugin:
     - `lzma_check`
     - `lzma_preset`
     - `lzma_filters`
+    - `lzma_workers`
 
     .. note::
         ``lzma_filters`` cannot be used in pypy version 7.3.1 and older.
 
     See :py:class:`lzma.LZMAFile` for more info about parameters.
+
+    If `lzma_workers` is set to a number greater than ``0``, data is
+    compressed in blocks of 1 MiB in that many threads, each block as a
+    separate xz stream. Standard xz tools decompress such multi-stream files
+    as a whole. This is only supported for the default ``lzma.FORMAT_XZ``
+    format.
     """
 
     def __init__(self, file: BinaryIO, feed_options: Dict[str, Any]) -> None:
@@ -97,7 +211,23 @@ class LZMAPlugin:
         check = self.feed_options.get("lzma_check", -1)
         preset = self.feed_options.get("lzma_preset")
         filters = self.feed_options.get("lzma_filters")
-        self.lzmafile = LZMAFile(
+        workers = self.feed_options.get("lzma_workers", 0)
+        if workers:
+            if format not in (None, lzma.FORMAT_XZ):
+                raise ValueError(
+                    "The lzma_workers feed option requires the lzma.FORMAT_XZ "
+                    "lzma_format."
+                )
+            compress = partial(
+                lzma.compress,
+                format=lzma.FORMAT_XZ,
+                check=check,
+                preset=preset,
+                filters=filters,
+            )
+            self.lzmafile = _BlockCompressor(self.file, compress, workers)
+            return
+        self.lzmafile = lzma.LZMAFile(
             filename=self.file,
             mode="wb",
             format=format,
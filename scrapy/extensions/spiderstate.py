@@ -1,16 +1,24 @@
+import logging
 import pickle
 from pathlib import Path
 
+from twisted.internet import task
+
 from scrapy import signals
 from scrapy.exceptions import NotConfigured
-from scrapy.utils.job import job_dir
+from scrapy.utils.job import job_dir, write_atomically
+from scrapy.utils.log import failure_to_exc_info
+
+logger = logging.getLogger(__name__)
 
 
 class SpiderState:
     """Store and load spider state during a scraping job"""
 
-    def __init__(self, jobdir=None):
+    def __init__(self, jobdir=None, checkpoint_interval=0):
         self.jobdir = jobdir
+        self.checkpoint_interval = checkpoint_interval
+        self.task = None
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -18,15 +26,16 @@ class SpiderState:
         if not jobdir:
             raise NotConfigured
 
-        obj = cls(jobdir)
+        obj = cls(jobdir, crawler.settings.getfloat("JOBDIR_CHECKPOINT_INTERVAL"))
         crawler.signals.connect(obj.spider_closed, signal=signals.spider_closed)
         crawler.signals.connect(obj.spider_opened, signal=signals.spider_opened)
         return obj
 
     def spider_closed(self, spider):
+        if self.task and self.task.running:
+            self.task.stop()
         if self.jobdir:
-            with Path(self.statefn).open("wb") as f:
-                pickle.dump(spider.state, f, protocol=4)
+            self.save(spider)
 
     def spider_opened(self, spider):
         if self.jobdir and Path(self.statefn).exists():
@@ -34,6 +43,21 @@ class SpiderState:
                 spider.state = pickle.load(f)
         else:
             spider.state = {}
+        if self.jobdir and self.checkpoint_interval:
+            self.task = task.LoopingCall(self.save, spider)
+            dfd = self.task.start(self.checkpoint_interval, now=False)
+            dfd.addErrback(self._save_failed, spider)
+
+    def _save_failed(self, failure, spider):
+        logger.error(
+            "Error while saving the spider state, no more checkpoints of it "
+            "will be saved",
+            exc_info=failure_to_exc_info(failure),
+            extra={"spider": spider},
+        )
+
+    def save(self, spider):
+        write_atomically(self.statefn, pickle.dumps(spider.state, protocol=4))
 
     @property
     def statefn(self) -> str:
@@ -1,8 +1,11 @@
+import heapq
 import re
 import time
+import warnings
 from http.cookiejar import CookieJar as _CookieJar
 from http.cookiejar import DefaultCookiePolicy
 
+from scrapy.exceptions import ScrapyDeprecationWarning
 from scrapy.utils.httpobj import urlparse_cached
 from scrapy.utils.python import to_unicode
 
@@ -11,11 +14,71 @@ from scrapy.utils.python import to_unicode
 IPV4_RE = re.compile(r"\.\d+$", re.ASCII)
 
 
+class _ExpiringCookieJar(_CookieJar):
+    """An http.cookiejar.CookieJar that keeps a heap of the expiration times
+    of its cookies, so that clearing expired cookies does not need to scan
+    all of them."""
+
+    def __init__(self, policy=None):
+        super().__init__(policy)
+        self._cookies_lock = _DummyLock()
+        # (expires, domain, path, name) of persistent cookies
+        self._expirations = []
+        self._compact_at = 64
+
+    def set_cookie(self, cookie):
+        super().set_cookie(cookie)
+        if cookie.expires is not None:
+            entry = (cookie.expires, cookie.domain, cookie.path, cookie.name)
+            heapq.heappush(self._expirations, entry)
+            if len(self._expirations) >= self._compact_at:
+                self._compact_expirations()
+
+    def _compact_expirations(self):
+        # Cookies that are set again, e.g. on every response, leave entries
+        # of their previous expiration time behind.
+        self._expirations = [
+            (cookie.expires, cookie.domain, cookie.path, cookie.name)
+            for cookie in self
+            if cookie.expires is not None
+        ]
+        heapq.heapify(self._expirations)
+        self._compact_at = max(64, 2 * len(self._expirations))
+
+    def clear_expired_cookies(self):
+        now = time.time()
+        expirations = self._expirations
+        while expirations and expirations[0][0] <= now:
+            expires, domain, path, name = heapq.heappop(expirations)
+            try:
+                cookie = self._cookies[domain][path][name]
+            except KeyError:  # already removed
+                continue
+            if cookie.expires != expires:  # replaced by a newer cookie
+                continue
+            paths = self._cookies[domain]
+            del paths[path][name]
+            # drop empty containers too, a jar may see many domains
+            if not paths[path]:
+                del paths[path]
+                if not paths:
+                    del self._cookies[domain]
+
+
 class CookieJar:
-    def __init__(self, policy=None, check_expired_frequency=10000):
+    def __init__(self, policy=None, check_expired_frequency=None):
         self.policy = policy or DefaultCookiePolicy()
-        self.jar = _CookieJar(self.policy)
-        self.jar._cookies_lock = _DummyLock()
+        self.jar = _ExpiringCookieJar(self.policy)
+        if check_expired_frequency is not None:
+            warnings.warn(
+                "The check_expired_frequency parameter of CookieJar is "
+                "deprecated and has no effect: expired cookies are cleared on "
+                "every add_cookie_header() call.",
+                ScrapyDeprecationWarning,
+                stacklevel=2,
+            )
+        else:
+            check_expired_frequency = 10000
         self.check_expired_frequency = check_expired_frequency
         self.processed = 0
 
@@ -52,9 +115,7 @@ class CookieJar:
                 wreq.add_unredirected_header("Cookie", "; ".join(attrs))
 
         self.processed += 1
-        if self.processed % self.check_expired_frequency == 0:
-            # This is still quite inefficient for large number of cookies
-            self.jar.clear_expired_cookies()
+        self.jar.clear_expired_cookies()
 
     @property
     def _cookies(self):
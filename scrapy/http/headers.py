@@ -1,10 +1,20 @@
 from collections.abc import Mapping
+from typing import Dict, Tuple
 
 from w3lib.http import headers_dict_to_raw
 
 from scrapy.utils.datatypes import CaseInsensitiveDict, CaselessDict
 from scrapy.utils.python import to_unicode
 
+# Normalized header names are interned in these caches, so that header names
+# are only title-cased and encoded the first time they are seen, and all
+# Headers objects share the same key objects. The caches stop growing once
+# they reach _NORMKEY_CACHE_SIZE entries, which is more than enough for the
+# header names found in practice.
+_NORMKEY_CACHE_SIZE = 2048
+_bytes_normkeys: Dict[bytes, bytes] = {}
+_str_normkeys: Dict[Tuple[str, str], bytes] = {}
+
 
 class Headers(CaselessDict):
     """Case insensitive http headers dictionary"""
@@ -14,15 +24,34 @@ class Headers(CaselessDict):
         super().__init__(seq)
 
     def update(self, seq):
+        if type(seq) is type(self):
+            # keys and values are already normalized
+            dict.update(self, ((k, list(v)) for k, v in dict.items(seq)))
+            return
         seq = seq.items() if isinstance(seq, Mapping) else seq
         iseq = {}
         for k, v in seq:
             iseq.setdefault(self.normkey(k), []).extend(self.normvalue(v))
-        super().update(iseq)
+        dict.update(self, iseq)
 
     def normkey(self, key):
         """Normalize key to bytes"""
-        return self._tobytes(key.title())
+        if isinstance(key, bytes):
+            try:
+                return _bytes_normkeys[key]
+            except KeyError:
+                normkey = key.title()
+                if len(_bytes_normkeys) < _NORMKEY_CACHE_SIZE:
+                    _bytes_normkeys[key] = normkey
+                return normkey
+        cache_key = (key, self.encoding)
+        try:
+            return _str_normkeys[cache_key]
+        except KeyError:
+            normkey = self._tobytes(key.title())
+            if len(_str_normkeys) < _NORMKEY_CACHE_SIZE:
+                _str_normkeys[cache_key] = normkey
+            return normkey
 
     def normvalue(self, value):
         """Normalize values to bytes"""
@@ -76,10 +105,10 @@ class Headers(CaselessDict):
         self[key] = lst
 
     def items(self):
-        return ((k, self.getlist(k)) for k in self.keys())
+        return ((k, v) for k, v in dict.items(self))
 
     def values(self):
-        return [self[k] for k in self.keys()]
+        return [v[-1] if v else None for v in dict.values(self)]
 
     def to_string(self):
         return headers_dict_to_raw(self)
@@ -49,6 +49,29 @@ class Request(object_ref):
     executed by the Downloader, thus generating a :class:`Response`.
     """
 
+    # Requests can be kept in memory by the million during broad crawls, so
+    # their common attributes live in slots and the containers that are empty
+    # for most requests (headers, cookies, meta, cb_kwargs and flags) are only
+    # created when first accessed. ``__dict__`` is kept for subclasses and for
+    # code setting custom attributes on requests.
+    __slots__ = (
+        "_encoding",
+        "method",
+        "_url",
+        "_body",
+        "priority",
+        "callback",
+        "errback",
+        "_cookies",
+        "_headers",
+        "dont_filter",
+        "_meta",
+        "_cb_kwargs",
+        "_flags",
+        "__dict__",
+        "__weakref__",
+    )
+
     attributes: Tuple[str, ...] = (
         "url",
         "callback",
@@ -105,13 +128,43 @@ class Request(object_ref):
         self.callback = callback
         self.errback = errback
 
-        self.cookies = cookies or {}
-        self.headers = Headers(headers or {}, encoding=encoding)
+        self._cookies = cookies or None
+        self._headers = Headers(headers, encoding=encoding) if headers else None
         self.dont_filter = dont_filter
 
         self._meta = dict(meta) if meta else None
         self._cb_kwargs = dict(cb_kwargs) if cb_kwargs else None
-        self.flags = [] if flags is None else list(flags)
+        self._flags = list(flags) if flags else None
+
+    @property
+    def headers(self) -> Headers:
+        if self._headers is None:
+            self._headers = Headers(encoding=self.encoding)
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: Headers) -> None:
+        self._headers = value
+
+    @property
+    def cookies(self) -> Union[dict, List[dict]]:
+        if self._cookies is None:
+            self._cookies = {}
+        return self._cookies
+
+    @cookies.setter
+    def cookies(self, value: Union[dict, List[dict]]) -> None:
+        self._cookies = value
+
+    @property
+    def flags(self) -> List[str]:
+        if self._flags is None:
+            self._flags = []
+        return self._flags
+
+    @flags.setter
+    def flags(self, value: List[str]) -> None:
+        self._flags = value
 
     @property
     def cb_kwargs(self) -> dict:
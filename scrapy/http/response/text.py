@@ -36,21 +36,16 @@ class TextResponse(Response):
     _DEFAULT_ENCODING = "ascii"
     _cached_decoded_json = _NONE
 
-    attributes: Tuple[str, ...] = Response.attributes + ("encoding",)
+    attributes: Tuple[str, ...] = Response.attributes + ("encoding", "encoding_hint")
 
     def __init__(self, *args: Any, **kwargs: Any):
         self._encoding = kwargs.pop("encoding", None)
+        self.encoding_hint: Optional[str] = kwargs.pop("encoding_hint", None)
         self._cached_benc: Optional[str] = None
         self._cached_ubody: Optional[str] = None
         self._cached_selector: Optional[Selector] = None
         super().__init__(*args, **kwargs)
 
-    def _set_url(self, url):
-        if isinstance(url, str):
-            self._url = to_unicode(url, self.encoding)
-        else:
-            super()._set_url(url)
-
     def _set_body(self, body):
         self._body = b""  # used by encoding detection
         if isinstance(body, str):
@@ -108,26 +103,31 @@ class TextResponse(Response):
 
     def _body_inferred_encoding(self):
         if self._cached_benc is None:
-            content_type = to_unicode(
-                self.headers.get(b"Content-Type", b""), encoding="latin-1"
-            )
-            benc, ubody = html_to_unicode(
-                content_type,
-                self.body,
-                auto_detect_fun=self._auto_detect_fun,
-                default_encoding=self._DEFAULT_ENCODING,
-            )
-            self._cached_benc = benc
-            self._cached_ubody = ubody
+            self._cached_benc, self._cached_ubody = self._decode_inferred()
         return self._cached_benc
 
-    def _auto_detect_fun(self, text):
-        for enc in (self._DEFAULT_ENCODING, "utf-8", "cp1252"):
+    def _decode_inferred(self) -> Tuple[str, str]:
+        # The first candidate that decodes the body without errors is used,
+        # and its decoding is kept as the response text, so that the body is
+        # only decoded once.
+        for enc in self._inferred_candidates():
             try:
-                text.decode(enc)
+                ubody = self.body.decode(enc)
             except UnicodeError:
                 continue
-            return resolve_encoding(enc)
+            return resolve_encoding(enc), ubody
+        benc = self._DEFAULT_ENCODING
+        return benc, self.body.decode(benc, "replace")
+
+    def _inferred_candidates(self) -> Generator[str, None, None]:
+        yield self._DEFAULT_ENCODING
+        yield "utf-8"
+        # Unlike UTF-8, single-byte encodings like cp1252 decode almost any
+        # body without errors, so a hint is tried before them.
+        hint = self.encoding_hint and resolve_encoding(self.encoding_hint)
+        if hint and hint not in ("utf-8", "cp1252"):
+            yield hint
+        yield "cp1252"
 
     @memoizemethod_noargs
     def _body_declared_encoding(self):
@@ -6,6 +6,7 @@ This package contains a collection of Link Extractors.
 For more info see docs/topics/link-extractors.rst
 """
 import re
+from functools import partial
 
 # common file extensions that are not followed if they occur in links
 IGNORED_EXTENSIONS = [
@@ -95,6 +96,40 @@ def _matches(url, regexs):
     return any(r.search(url) for r in regexs)
 
 
+# patterns that cannot be embedded into a bigger pattern: global inline flags
+# and references to groups, whose numbers change once patterns are merged
+_unmergeable_re = re.compile(r"\(\?[aiLmsux]+\)|\\[0-9]|\(\?P=|\(\?\(")
+
+
+def _matcher(regexs):
+    """Return a callable that returns a true value if the given string matches
+    any of the given compiled regexes.
+
+    When possible, the regexes are merged into a single one, so that each
+    string is searched once instead of once per regex.
+    """
+    if len(regexs) == 1:
+        return regexs[0].search
+    flags = {r.flags for r in regexs}
+    if (
+        len(flags) == 1
+        # in verbose patterns, a trailing comment would swallow the closing
+        # parenthesis of the group wrapping them
+        and not regexs[0].flags & re.VERBOSE
+        and all(
+            isinstance(r.pattern, str) and not _unmergeable_re.search(r.pattern)
+            for r in regexs
+        )
+    ):
+        try:
+            merged = re.compile("|".join(f"(?:{r.pattern})" for r in regexs), *flags)
+        except re.error:
+            pass
+        else:
+            return merged.search
+    return partial(_matches, regexs=regexs)
+
+
 def _is_valid_url(url):
     return url.split("://", 1)[0] in {"http", "https", "file", "ftp"}
 
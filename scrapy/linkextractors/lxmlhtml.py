@@ -9,20 +9,25 @@ from urllib.parse import urljoin, urlparse
 from lxml import etree
 from parsel.csstranslator import HTMLTranslator
 from w3lib.html import strip_html5_whitespace
-from w3lib.url import canonicalize_url, safe_url_string
+from w3lib.url import safe_url_string
 
 from scrapy.link import Link
 from scrapy.linkextractors import (
     IGNORED_EXTENSIONS,
     _is_valid_url,
-    _matches,
+    _matcher,
     _re_type,
     re,
 )
 from scrapy.utils.misc import arg_to_iter, rel_has_nofollow
 from scrapy.utils.python import unique as unique_list
 from scrapy.utils.response import get_base_url
-from scrapy.utils.url import url_has_any_extension, url_is_from_any_domain
+from scrapy.utils.url import (
+    _canonicalize_url,
+    _host_is_from_any_domain,
+    parse_url,
+    url_has_any_extension,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +49,7 @@ def _identity(x):
 
 
 def _canonicalize_link_url(link):
-    return canonicalize_url(link.url, keep_fragments=True)
+    return _canonicalize_url(link.url, keep_fragments=True)
 
 
 class LxmlParserLinkExtractor:
@@ -76,29 +81,50 @@ class LxmlParserLinkExtractor:
                     continue
                 yield (el, attrib, attribs[attrib])
 
+    def _make_absolute(self, attr_val, base_url):
+        # pseudo lxml.html.HtmlElement.make_links_absolute(base_url)
+        try:
+            if self.strip:
+                attr_val = strip_html5_whitespace(attr_val)
+            return urljoin(base_url, attr_val)
+        except ValueError:
+            return None  # skipping bogus links
+
+    def _make_safe(self, url, response_url, response_encoding):
+        try:
+            url = safe_url_string(url, encoding=response_encoding)
+        except ValueError:
+            logger.debug(f"Skipping extraction of link with bad URL {url!r}")
+            return None
+        # to fix relative links after process_value
+        return urljoin(response_url, url)
+
     def _extract_links(self, selector, response_url, response_encoding, base_url):
         links = []
+        # Link-dense documents link to the same URLs over and over (menus,
+        # pagination, footers), so every distinct URL is only made absolute
+        # and safe once per document.
+        absolute_urls = {}
+        safe_urls = {}
         # hacky way to get the underlying lxml parsed document
         for el, attr, attr_val in self._iter_links(selector.root):
-            # pseudo lxml.html.HtmlElement.make_links_absolute(base_url)
             try:
-                if self.strip:
-                    attr_val = strip_html5_whitespace(attr_val)
-                attr_val = urljoin(base_url, attr_val)
-            except ValueError:
-                continue  # skipping bogus links
-            else:
-                url = self.process_attr(attr_val)
-                if url is None:
-                    continue
+                url = absolute_urls[attr_val]
+            except KeyError:
+                url = absolute_urls[attr_val] = self._make_absolute(attr_val, base_url)
+            if url is None:
+                continue
+            url = self.process_attr(url)
+            if url is None:
+                continue
             try:
-                url = safe_url_string(url, encoding=response_encoding)
-            except ValueError:
-                logger.debug(f"Skipping extraction of link with bad URL {url!r}")
+                url = safe_urls[url]
+            except KeyError:
+                url = safe_urls[url] = self._make_safe(
+                    url, response_url, response_encoding
+                )
+            if url is None:
                 continue
-
-            # to fix relative links after process_value
-            url = urljoin(response_url, url)
             link = Link(
                 url,
                 _collect_string_content(el) or "",
@@ -164,6 +190,8 @@ class LxmlLinkExtractor:
 
         self.allow_domains = set(arg_to_iter(allow_domains))
         self.deny_domains = set(arg_to_iter(deny_domains))
+        self._allow_domains = {d.lower() for d in self.allow_domains}
+        self._deny_domains = {d.lower() for d in self.deny_domains}
 
         self.restrict_xpaths = tuple(arg_to_iter(restrict_xpaths))
         self.restrict_xpaths += tuple(
@@ -178,48 +206,55 @@ class LxmlLinkExtractor:
             x if isinstance(x, _re_type) else re.compile(x)
             for x in arg_to_iter(restrict_text)
         ]
+        self._allow_matcher = _matcher(self.allow_res)
+        self._deny_matcher = _matcher(self.deny_res)
+        self._restrict_text_matcher = _matcher(self.restrict_text)
 
     def _link_allowed(self, link):
         if not _is_valid_url(link.url):
             return False
-        if self.allow_res and not _matches(link.url, self.allow_res):
+        if self.allow_res and not self._allow_matcher(link.url):
             return False
-        if self.deny_res and _matches(link.url, self.deny_res):
+        if self.deny_res and self._deny_matcher(link.url):
             return False
         parsed_url = urlparse(link.url)
-        if self.allow_domains and not url_is_from_any_domain(
-            parsed_url, self.allow_domains
-        ):
-            return False
-        if self.deny_domains and url_is_from_any_domain(parsed_url, self.deny_domains):
+        if not self._domain_allowed(parsed_url):
             return False
         if self.deny_extensions and url_has_any_extension(
             parsed_url, self.deny_extensions
         ):
             return False
-        if self.restrict_text and not _matches(link.text, self.restrict_text):
+        if self.restrict_text and not self._restrict_text_matcher(link.text):
             return False
         return True
 
-    def matches(self, url):
-        if self.allow_domains and not url_is_from_any_domain(url, self.allow_domains):
+    def _domain_allowed(self, url):
+        if not (self.allow_domains or self.deny_domains):
+            return True
+        host = parse_url(url).netloc.lower()
+        if self.allow_domains and not (
+            host and _host_is_from_any_domain(host, self._allow_domains)
+        ):
             return False
-        if self.deny_domains and url_is_from_any_domain(url, self.deny_domains):
+        if self.deny_domains and (
+            host and _host_is_from_any_domain(host, self._deny_domains)
+        ):
             return False
+        return True
 
-        allowed = (
-            (regex.search(url) for regex in self.allow_res)
-            if self.allow_res
-            else [True]
-        )
-        denied = (regex.search(url) for regex in self.deny_res) if self.deny_res else []
-        return any(allowed) and not any(denied)
+    def matches(self, url):
+        if not self._domain_allowed(url):
+            return False
+
+        if self.allow_res and not self._allow_matcher(url):
+            return False
+        return not (self.deny_res and self._deny_matcher(url))
 
     def _process_links(self, links):
         links = [x for x in links if self._link_allowed(x)]
         if self.canonicalize:
             for link in links:
-                link.url = canonicalize_url(link.url)
+                link.url = _canonicalize_url(link.url)
         links = self.link_extractor._process_links(links)
         return links
 
@@ -30,6 +30,7 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from scrapy.crawler import Crawler
+    from scrapy.utils.timing import ComponentTimer
 
 
 logger = logging.getLogger(__name__)
@@ -83,7 +84,11 @@ class MiddlewareManager:
             },
             extra={"crawler": crawler},
         )
-        return cls(*middlewares)
+        mwman = cls(*middlewares)
+        timer = getattr(crawler, "_component_timer", None)
+        if timer is not None:
+            mwman._instrument(timer)
+        return mwman
 
     @classmethod
     def from_crawler(cls, crawler: Crawler) -> Self:
@@ -95,6 +100,20 @@ class MiddlewareManager:
         if hasattr(mw, "close_spider"):
             self.methods["close_spider"].appendleft(mw.close_spider)
 
+    def _instrument(self, timer: ComponentTimer) -> None:
+        """Replace the registered methods with ones that record their
+        timing through *timer*."""
+
+        def wrap(method: Any) -> Any:
+            if method is None:
+                return None
+            if isinstance(method, tuple):
+                return tuple(timer.wrap(m) for m in method)
+            return timer.wrap(method)
+
+        for methodname, methods in self.methods.items():
+            self.methods[methodname] = deque(wrap(method) for method in methods)
+
     def _process_parallel(self, methodname: str, obj: Any, *args: Any) -> Deferred:
         methods = cast(Iterable[Callable], self.methods[methodname])
         return process_parallel(methods, obj, *args)
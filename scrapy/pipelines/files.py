@@ -16,11 +16,13 @@ from ftplib import FTP
 from io import BytesIO
 from os import PathLike
 from pathlib import Path
-from typing import DefaultDict, Optional, Set, Union
+from threading import Thread
+from typing import DefaultDict, List, Optional, Set, Union
 from urllib.parse import urlparse
 
 from itemadapter import ItemAdapter
 from twisted.internet import defer, threads
+from twisted.python.threadpool import ThreadPool
 
 from scrapy.exceptions import IgnoreRequest, NotConfigured
 from scrapy.http import Request
@@ -46,6 +48,79 @@ class FileException(Exception):
     """General media error exception"""
 
 
+class _StoreThreadPool:
+    """Pool of threads for the blocking I/O of a media store.
+
+    It is separate from the reactor thread pool, which is also used for DNS
+    resolution, and media pipelines set its size from the MEDIA_STORE_THREADS
+    setting. Its threads are started on first use.
+    """
+
+    def __init__(self, size: int = 10):
+        self.size = size
+        self._pool: Optional[ThreadPool] = None
+        self._shutdown_trigger = None
+
+    def resize(self, size: int) -> None:
+        self.size = size
+        if self._pool is not None:
+            self._pool.adjustPoolsize(maxthreads=size)
+
+    def defer(self, info, kind: str, func, *args, **kwargs) -> defer.Deferred:
+        """Run ``func(*args, **kwargs)`` in the pool and return a Deferred
+        with its result. If ``info`` is given, the time the call waited for a
+        thread and its total duration are added to the spider stats, as
+        ``media_store/queue_wait_time`` and ``media_store/<kind>_time``."""
+        from twisted.internet import reactor
+
+        if self._pool is None:
+            self._pool = ThreadPool(0, self.size, "scrapy-media-store")
+            # The pool is stopped on reactor shutdown, daemon threads only
+            # matter if the reactor never shuts down, e.g. in tests.
+            self._pool.threadFactory = functools.partial(Thread, daemon=True)
+            self._pool.start()
+            self._shutdown_trigger = reactor.addSystemEventTrigger(
+                "during", "shutdown", self._stop_on_shutdown
+            )
+        submitted = time.monotonic()
+
+        def run():
+            return time.monotonic(), func(*args, **kwargs)
+
+        def record(result):
+            started, result = result
+            spider = getattr(info, "spider", None)
+            stats = getattr(getattr(spider, "crawler", None), "stats", None)
+            if stats is not None:
+                wait, duration = started - submitted, time.monotonic() - submitted
+                prefix = "media_store/"
+                stats.inc_value(f"{prefix}{kind}_count", spider=spider)
+                stats.inc_value(f"{prefix}{kind}_time", duration, spider=spider)
+                stats.max_value(f"{prefix}{kind}_time_max", duration, spider=spider)
+                stats.inc_value(f"{prefix}queue_wait_time", wait, spider=spider)
+                stats.max_value(f"{prefix}queue_wait_time_max", wait, spider=spider)
+            return result
+
+        return threads.deferToThreadPool(reactor, self._pool, run).addCallback(record)
+
+    def stop(self) -> None:
+        """Stop the threads of the pool, once they finish their current
+        calls."""
+        from twisted.internet import reactor
+
+        if self._pool is None:
+            return
+        if self._shutdown_trigger is not None:
+            reactor.removeSystemEventTrigger(self._shutdown_trigger)
+            self._shutdown_trigger = None
+        self._pool.stop()
+        self._pool = None
+
+    def _stop_on_shutdown(self) -> None:
+        self._shutdown_trigger = None
+        self.stop()
+
+
 class FSFilesStore:
     def __init__(self, basedir: Union[str, PathLike]):
         basedir = _to_string(basedir)
@@ -54,15 +129,21 @@ class FSFilesStore:
         self.basedir = basedir
         self._mkdir(Path(self.basedir))
         self.created_directories: DefaultDict[str, Set[str]] = defaultdict(set)
+        self._threads = _StoreThreadPool()
 
     def persist_file(
         self, path: Union[str, PathLike], buf, info, meta=None, headers=None
     ):
         absolute_path = self._get_filesystem_path(path)
         self._mkdir(absolute_path.parent, info)
-        absolute_path.write_bytes(buf.getvalue())
+        return self._threads.defer(
+            info, "persist", absolute_path.write_bytes, buf.getvalue()
+        )
 
     def stat_file(self, path: Union[str, PathLike], info):
+        return self._threads.defer(info, "stat", self._stat_file, path)
+
+    def _stat_file(self, path: Union[str, PathLike]):
         absolute_path = self._get_filesystem_path(path)
         try:
             last_modified = absolute_path.stat().st_mtime
@@ -119,6 +200,7 @@ class S3FilesStore:
         if not uri.startswith("s3://"):
             raise ValueError(f"Incorrect URI scheme in {uri}, expected 's3'")
         self.bucket, self.prefix = uri[5:].split("/", 1)
+        self._threads = _StoreThreadPool()
 
     def stat_file(self, path, info):
         def _onsuccess(boto_key):
@@ -127,12 +209,12 @@ class S3FilesStore:
             modified_stamp = time.mktime(last_modified.timetuple())
             return {"checksum": checksum, "last_modified": modified_stamp}
 
-        return self._get_boto_key(path).addCallback(_onsuccess)
+        return self._get_boto_key(path, info).addCallback(_onsuccess)
 
-    def _get_boto_key(self, path):
+    def _get_boto_key(self, path, info=None):
         key_name = f"{self.prefix}{path}"
-        return threads.deferToThread(
-            self.s3_client.head_object, Bucket=self.bucket, Key=key_name
+        return self._threads.defer(
+            info, "stat", self.s3_client.head_object, Bucket=self.bucket, Key=key_name
         )
 
     def persist_file(self, path, buf, info, meta=None, headers=None):
@@ -142,7 +224,9 @@ class S3FilesStore:
         extra = self._headers_to_botocore_kwargs(self.HEADERS)
         if headers:
             extra.update(self._headers_to_botocore_kwargs(headers))
-        return threads.deferToThread(
+        return self._threads.defer(
+            info,
+            "persist",
             self.s3_client.put_object,
             Bucket=self.bucket,
             Key=key_name,
@@ -225,6 +309,7 @@ class GCSFilesStore:
                 "No 'storage.objects.create' permission for GSC bucket %(bucket)s. Saving files will be impossible!",
                 {"bucket": bucket},
             )
+        self._threads = _StoreThreadPool()
 
     def stat_file(self, path, info):
         def _onsuccess(blob):
@@ -235,9 +320,9 @@ class GCSFilesStore:
             return {}
 
         blob_path = self._get_blob_path(path)
-        return threads.deferToThread(self.bucket.get_blob, blob_path).addCallback(
-            _onsuccess
-        )
+        return self._threads.defer(
+            info, "stat", self.bucket.get_blob, blob_path
+        ).addCallback(_onsuccess)
 
     def _get_content_type(self, headers):
         if headers and "Content-Type" in headers:
@@ -252,7 +337,9 @@ class GCSFilesStore:
         blob = self.bucket.blob(blob_path)
         blob.cache_control = self.CACHE_CONTROL
         blob.metadata = {k: str(v) for k, v in (meta or {}).items()}
-        return threads.deferToThread(
+        return self._threads.defer(
+            info,
+            "persist",
             blob.upload_from_string,
             data=buf.getvalue(),
             content_type=self._get_content_type(headers),
@@ -275,10 +362,13 @@ class FTPFilesStore:
         self.username = u.username or self.FTP_USERNAME
         self.password = u.password or self.FTP_PASSWORD
         self.basedir = u.path.rstrip("/")
+        self._threads = _StoreThreadPool()
 
     def persist_file(self, path, buf, info, meta=None, headers=None):
         path = f"{self.basedir}/{path}"
-        return threads.deferToThread(
+        return self._threads.defer(
+            info,
+            "persist",
             ftp_store_file,
             path=path,
             file=buf,
@@ -306,7 +396,7 @@ class FTPFilesStore:
             except Exception:
                 return {}
 
-        return threads.deferToThread(_stat_file, path)
+        return self._threads.defer(info, "stat", _stat_file, path)
 
 
 class FilesPipeline(MediaPipeline):
@@ -363,6 +453,10 @@ class FilesPipeline(MediaPipeline):
         self.files_result_field = settings.get(
             resolve("FILES_RESULT_FIELD"), self.FILES_RESULT_FIELD
         )
+        store_threads = getattr(self.store, "_threads", None)
+        if store_threads is not None:
+            store_threads.resize(settings.getint("MEDIA_STORE_THREADS", 10))
+        self._persisting: Optional[List[defer.Deferred]] = None
 
         super().__init__(download_func=download_func, settings=settings)
 
@@ -490,32 +584,85 @@ class FilesPipeline(MediaPipeline):
 
         try:
             path = self.file_path(request, response=response, info=info, item=item)
-            checksum = self.file_downloaded(response, request, info, item=item)
-        except FileException as exc:
+            checksum = self._call_persisting(
+                self.file_downloaded, response, request, info, item=item
+            )
+        except Exception as exc:
+            self._file_processing_failed(exc, request, referer, info)
+
+        result = {
+            "url": request.url,
+            "path": path,
+            "checksum": checksum,
+            "status": status,
+        }
+        if isinstance(checksum, defer.Deferred):
+            # e.g. files being stored, or images processed in another process
+            return checksum.addCallbacks(
+                lambda checksum: dict(result, checksum=checksum),
+                lambda f: self._file_processing_failed(f.value, request, referer, info),
+            )
+        return result
+
+    def _file_processing_failed(self, exc, request, referer, info):
+        exc_info = (type(exc), exc, exc.__traceback__)
+        if isinstance(exc, FileException):
             logger.warning(
                 "File (error): Error processing file from %(request)s "
                 "referred in <%(referer)s>: %(errormsg)s",
                 {"request": request, "referer": referer, "errormsg": str(exc)},
                 extra={"spider": info.spider},
-                exc_info=True,
+                exc_info=exc_info,
             )
-            raise
-        except Exception as exc:
-            logger.error(
-                "File (unknown-error): Error processing file from %(request)s "
-                "referred in <%(referer)s>",
-                {"request": request, "referer": referer},
-                exc_info=True,
+            raise exc
+        logger.error(
+            "File (unknown-error): Error processing file from %(request)s "
+            "referred in <%(referer)s>",
+            {"request": request, "referer": referer},
+            exc_info=exc_info,
+            extra={"spider": info.spider},
+        )
+        raise FileException(str(exc)) from exc
+
+    def _call_persisting(self, func, *args, **kwargs):
+        """Call *func* and return its result, once the files that it passes
+        to :meth:`_persist_file` are stored.
+
+        The result is a :class:`~twisted.internet.defer.Deferred` if files
+        are being stored, which fails if storing any of them fails."""
+        outer, self._persisting = self._persisting, []
+        try:
+            result = func(*args, **kwargs)
+            persisting = self._persisting
+        finally:
+            self._persisting = outer
+        if not persisting:
+            return result
+        dfd = defer.gatherResults(persisting, consumeErrors=True)
+        dfd.addErrback(lambda f: f.value.subFailure)
+        return dfd.addCallback(lambda _: result)
+
+    def _persist_file(self, path, buf, info, meta=None, headers=None):
+        dfd = self.store.persist_file(path, buf, info, meta=meta, headers=headers)
+        if not isinstance(dfd, defer.Deferred):
+            return
+        if self._persisting is not None:
+            self._persisting.append(dfd)
+            return
+        # not called by file_downloaded, nothing waits for the file
+        dfd.addErrback(
+            lambda f: logger.error(
+                self.__class__.__name__ + ".store.persist_file",
+                exc_info=failure_to_exc_info(f),
                 extra={"spider": info.spider},
             )
-            raise FileException(str(exc))
+        )
 
-        return {
-            "url": request.url,
-            "path": path,
-            "checksum": checksum,
-            "status": status,
-        }
+    def close_spider(self, spider):
+        store_threads = getattr(self.store, "_threads", None)
+        if store_threads is not None:
+            # items wait for their files, so no store call is in progress
+            store_threads.stop()
 
     def inc_stats(self, spider, status):
         spider.crawler.stats.inc_value("file_count", spider=spider)
@@ -531,7 +678,7 @@ class FilesPipeline(MediaPipeline):
         buf = BytesIO(response.body)
         checksum = md5sum(buf)
         buf.seek(0)
-        self.store.persist_file(path, buf, info)
+        self._persist_file(path, buf, info)
         return checksum
 
     def item_completed(self, results, item, info):
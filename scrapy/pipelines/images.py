@@ -5,11 +5,15 @@ See documentation in topics/media-pipeline.rst
 """
 import functools
 import hashlib
+import multiprocessing
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import suppress
 from io import BytesIO
 
 from itemadapter import ItemAdapter
+from twisted.internet import defer
+from twisted.python.failure import Failure
 
 from scrapy.exceptions import DropItem, NotConfigured, ScrapyDeprecationWarning
 from scrapy.http import Request
@@ -18,7 +22,8 @@ from scrapy.pipelines.files import FileException, FilesPipeline
 
 # TODO: from scrapy.pipelines.media import MediaPipeline
 from scrapy.settings import Settings
-from scrapy.utils.misc import md5sum
+from scrapy.utils.deprecate import method_is_overridden
+from scrapy.utils.misc import load_object, md5sum
 from scrapy.utils.python import get_func_args, to_bytes
 
 
@@ -38,6 +43,90 @@ class ImageException(FileException):
     """General image error exception"""
 
 
+def _convert_to_rgb(Image, image):
+    if image.format in ("PNG", "WEBP") and image.mode == "RGBA":
+        background = Image.new("RGBA", image.size, (255, 255, 255))
+        background.paste(image, image)
+        image = background.convert("RGB")
+    elif image.mode == "P":
+        image = image.convert("RGBA")
+        background = Image.new("RGBA", image.size, (255, 255, 255))
+        background.paste(image, image)
+        image = background.convert("RGB")
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+    return image
+
+
+def _resampling_filter(Image):
+    try:
+        # Image.Resampling.LANCZOS was added in Pillow 9.1.0
+        # remove this try except block,
+        # when updating the minimum requirements for Pillow.
+        return Image.Resampling.LANCZOS
+    except AttributeError:
+        return Image.ANTIALIAS
+
+
+def _process_image(body, thumbs, min_width, min_height):
+    """Decode an image and encode it, and each of its ``thumbs``, as JPEG.
+
+    It runs in the image processing executor, maybe in another process, so
+    it only takes and returns picklable values: the image size, its JPEG
+    encoding (``None`` if ``body`` can be stored as is) and a list of
+    ``(thumb_id, thumb_size, thumb_jpeg)`` tuples.
+    """
+    from PIL import Image
+
+    image = Image.open(BytesIO(body))
+    width, height = image.size
+    if width < min_width or height < min_height:
+        raise ImageException(
+            "Image too small " f"({width}x{height} < " f"{min_width}x{min_height})"
+        )
+
+    if image.format == "JPEG" and image.mode == "RGB":
+        # The body is stored as is, only thumbnails need pixels, so the
+        # decoder can downscale the image to (no less than) the largest one.
+        full_jpeg = None
+        if thumbs:
+            draft_size = (
+                max(size[0] for size in thumbs.values()),
+                max(size[1] for size in thumbs.values()),
+            )
+            image.draft("RGB", draft_size)
+    else:
+        image = _convert_to_rgb(Image, image)
+        buf = BytesIO()
+        image.save(buf, "JPEG")
+        full_jpeg = buf.getvalue()
+
+    thumb_results = []
+    for thumb_id, size in thumbs.items():
+        thumb = image.copy()
+        thumb.thumbnail(size, _resampling_filter(Image))
+        buf = BytesIO()
+        thumb.save(buf, "JPEG")
+        thumb_results.append((thumb_id, thumb.size, buf.getvalue()))
+    return (width, height), full_jpeg, thumb_results
+
+
+def _future_to_deferred(future):
+    from twisted.internet import reactor
+
+    dfd = defer.Deferred()
+
+    def fire(future):
+        exc = future.exception()
+        if exc is None:
+            dfd.callback(future.result())
+        else:
+            dfd.errback(Failure(exc))
+
+    future.add_done_callback(lambda future: reactor.callFromThread(fire, future))
+    return dfd
+
+
 class ImagesPipeline(FilesPipeline):
     """Abstract pipeline that implement the image thumbnail generation logic"""
 
@@ -91,6 +180,13 @@ class ImagesPipeline(FilesPipeline):
 
         self._deprecated_convert_image = None
 
+        self._executor = None
+        self._executor_cls = settings.get("IMAGES_EXECUTOR")
+        self._executor_workers = settings.getint("IMAGES_EXECUTOR_WORKERS") or None
+        self._executor_jobs = defer.DeferredSemaphore(
+            settings.getint("IMAGES_EXECUTOR_MAX_JOBS", 16)
+        )
+
     @classmethod
     def from_settings(cls, settings):
         s3store = cls.STORE_SCHEMES["s3"]
@@ -115,9 +211,72 @@ class ImagesPipeline(FilesPipeline):
         store_uri = settings["IMAGES_STORE"]
         return cls(store_uri, settings=settings)
 
+    def close_spider(self, spider):
+        super().close_spider(spider)
+        if self._executor is not None:
+            # items wait for their images, so no job is pending, and the
+            # workers may exit in the background
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     def file_downloaded(self, response, request, info, *, item=None):
+        if self._executor_cls and not any(
+            method_is_overridden(type(self), ImagesPipeline, method)
+            for method in ("image_downloaded", "get_images", "convert_image")
+        ):
+            return self._process_image_in_executor(response, request, info, item)
         return self.image_downloaded(response, request, info, item=item)
 
+    def _get_executor(self):
+        if self._executor is None:
+            executor_cls = load_object(self._executor_cls)
+            kwargs = {"max_workers": self._executor_workers}
+            if issubclass(executor_cls, ProcessPoolExecutor):
+                # Forking a process that runs threads, e.g. those of the
+                # reactor thread pool, is not safe.
+                kwargs["mp_context"] = multiprocessing.get_context("spawn")
+            self._executor = executor_cls(**kwargs)
+        return self._executor
+
+    def _process_image_in_executor(self, response, request, info, item):
+        def submit():
+            future = self._get_executor().submit(
+                _process_image,
+                response.body,
+                self.thumbs,
+                self.min_width,
+                self.min_height,
+            )
+            return _future_to_deferred(future)
+
+        def persist(result):
+            (width, height), full_jpeg, thumbs = result
+            path = self.file_path(request, response=response, info=info, item=item)
+            buf = BytesIO(response.body if full_jpeg is None else full_jpeg)
+            checksum = md5sum(buf)
+            buf.seek(0)
+            self._persist_image(path, buf, info, width, height)
+            for thumb_id, (thumb_width, thumb_height), thumb_jpeg in thumbs:
+                thumb_path = self.thumb_path(
+                    request, thumb_id, response=response, info=info, item=item
+                )
+                self._persist_image(
+                    thumb_path, BytesIO(thumb_jpeg), info, thumb_width, thumb_height
+                )
+            return checksum
+
+        dfd = self._executor_jobs.run(submit)
+        return dfd.addCallback(lambda result: self._call_persisting(persist, result))
+
+    def _persist_image(self, path, buf, info, width, height):
+        self._persist_file(
+            path,
+            buf,
+            info,
+            meta={"width": width, "height": height},
+            headers={"Content-Type": "image/jpeg"},
+        )
+
     def image_downloaded(self, response, request, info, *, item=None):
         checksum = None
         for path, image, buf in self.get_images(response, request, info, item=item):
@@ -125,13 +284,7 @@ class ImagesPipeline(FilesPipeline):
                 buf.seek(0)
                 checksum = md5sum(buf)
             width, height = image.size
-            self.store.persist_file(
-                path,
-                buf,
-                info,
-                meta={"width": width, "height": height},
-                headers={"Content-Type": "image/jpeg"},
-            )
+            self._persist_image(path, buf, info, width, height)
         return checksum
 
     def get_images(self, response, request, info, *, item=None):
@@ -184,28 +337,11 @@ class ImagesPipeline(FilesPipeline):
                 stacklevel=2,
             )
 
-        if image.format in ("PNG", "WEBP") and image.mode == "RGBA":
-            background = self._Image.new("RGBA", image.size, (255, 255, 255))
-            background.paste(image, image)
-            image = background.convert("RGB")
-        elif image.mode == "P":
-            image = image.convert("RGBA")
-            background = self._Image.new("RGBA", image.size, (255, 255, 255))
-            background.paste(image, image)
-            image = background.convert("RGB")
-        elif image.mode != "RGB":
-            image = image.convert("RGB")
+        image = _convert_to_rgb(self._Image, image)
 
         if size:
             image = image.copy()
-            try:
-                # Image.Resampling.LANCZOS was added in Pillow 9.1.0
-                # remove this try except block,
-                # when updating the minimum requirements for Pillow.
-                resampling_filter = self._Image.Resampling.LANCZOS
-            except AttributeError:
-                resampling_filter = self._Image.ANTIALIAS
-            image.thumbnail(size, resampling_filter)
+            image.thumbnail(size, _resampling_filter(self._Image))
         elif response_body is not None and image.format == "JPEG":
             return image, response_body
 
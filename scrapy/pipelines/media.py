@@ -9,7 +9,7 @@ from twisted.python.failure import Failure
 
 from scrapy.http.request import NO_CALLBACK
 from scrapy.settings import Settings
-from scrapy.utils.datatypes import SequenceExclude
+from scrapy.utils.datatypes import LocalCache, SequenceExclude
 from scrapy.utils.defer import defer_result, mustbe_deferred
 from scrapy.utils.deprecate import ScrapyDeprecationWarning
 from scrapy.utils.log import failure_to_exc_info
@@ -26,10 +26,11 @@ class MediaPipeline:
     LOG_FAILED_RESULTS = True
 
     class SpiderInfo:
-        def __init__(self, spider):
+        def __init__(self, spider, cache_size=None):
             self.spider = spider
             self.downloading = set()
-            self.downloaded = {}
+            # results by request fingerprint, least recently used first
+            self.downloaded = LocalCache(limit=cache_size)
             self.waiting = defaultdict(list)
 
     def __init__(self, download_func=None, settings=None):
@@ -43,6 +44,7 @@ class MediaPipeline:
         )
         self.allow_redirects = settings.getbool(resolve("MEDIA_ALLOW_REDIRECTS"), False)
         self._handle_statuses(self.allow_redirects)
+        self.cache_size = settings.getint(resolve("MEDIA_CACHE_SIZE"), 100_000)
 
         # Check if deprecated methods are being used and make them compatible
         self._make_compatible()
@@ -83,7 +85,7 @@ class MediaPipeline:
         return pipe
 
     def open_spider(self, spider):
-        self.spiderinfo = self.SpiderInfo(spider)
+        self.spiderinfo = self.SpiderInfo(spider, cache_size=self.cache_size)
 
     def process_item(self, item, spider):
         info = self.spiderinfo
@@ -104,6 +106,8 @@ class MediaPipeline:
 
         # Return cached result if request was already seen
         if fp in info.downloaded:
+            info.downloaded.move_to_end(fp)
+            self._inc_stats(info, "media_cache/hit")
             return defer_result(info.downloaded[fp]).addCallbacks(cb, eb)
 
         # Otherwise, wait for result
@@ -236,10 +240,20 @@ class MediaPipeline:
                 setattr(result.value, "__context__", None)
 
         info.downloading.remove(fp)
+        if info.downloaded.limit and len(info.downloaded) >= info.downloaded.limit:
+            # the least recently used result is evicted, if the request is
+            # seen again the media pipeline checks again (e.g. with
+            # media_to_download) if the media is stored
+            self._inc_stats(info, "media_cache/evicted")
         info.downloaded[fp] = result  # cache result
         for wad in info.waiting.pop(fp):
             defer_result(result).chainDeferred(wad)
 
+    def _inc_stats(self, info, key):
+        # pipelines not created with from_crawler have no stats
+        if hasattr(self, "crawler"):
+            self.crawler.stats.inc_value(key, spider=info.spider)
+
     # Overridable Interface
     def media_to_download(self, request, info, *, item=None):
         """Check request before starting download"""
@@ -1,10 +1,23 @@
 import hashlib
+import json
 import logging
-
+from heapq import heappop, heappush
+from itertools import count
+from pathlib import Path
+from time import time
+from weakref import WeakKeyDictionary
+
+from scrapy import signals
+from scrapy.exceptions import IgnoreRequest
+from scrapy.utils.job import write_atomically
 from scrapy.utils.misc import create_instance
 
 logger = logging.getLogger(__name__)
 
+# requests accepted so far for each download slot with a budget, shared by the
+# memory and disk queues of each crawler
+_budget_usage = WeakKeyDictionary()
+
 
 def _path_safe(text):
     """
@@ -48,6 +61,10 @@ class ScrapyPriorityQueue:
     previously closed leaving some priority buckets non-empty, those priorities
     should be passed in startprios.
 
+    With :setting:`JOBDIR_CHECKPOINT_INTERVAL`, the priorities of the internal
+    queues are also recorded in a ``queues.log`` file under ``key`` as they
+    are created, so that :meth:`recover` can find them if the crawl is killed
+    before the next checkpoint.
     """
 
     @classmethod
@@ -60,6 +77,7 @@ class ScrapyPriorityQueue:
         self.key = key
         self.queues = {}
         self.curprio = None
+        self._registry = _registry_path(crawler, key, "queues.log")
         self.init_prios(startprios)
 
     def init_prios(self, startprios):
@@ -86,6 +104,8 @@ class ScrapyPriorityQueue:
         priority = self.priority(request)
         if priority not in self.queues:
             self.queues[priority] = self.qfactory(priority)
+            if self._registry:
+                _register(self._registry, priority)
         q = self.queues[priority]
         q.push(request)  # this may fail (eg. serialization error)
         if self.curprio is None or priority < self.curprio:
@@ -122,10 +142,61 @@ class ScrapyPriorityQueue:
             q.close()
         return active
 
+    def checkpoint(self):
+        """Save the state of the internal queues that support it, without
+        closing them, and return the same state as :meth:`close`."""
+        for q in self.queues.values():
+            if hasattr(q, "checkpoint"):
+                q.checkpoint()
+        if self._registry:
+            _write_registry(self._registry, self.queues)
+        return list(self.queues)
+
+    def recover(self):
+        """Open the internal queues created after the last checkpoint, and
+        let all internal queues recover the items pushed after it."""
+        if self._registry:
+            for priority in _read_registry(self._registry):
+                if priority not in self.queues:
+                    self.queues[priority] = self.qfactory(priority)
+        for priority, q in list(self.queues.items()):
+            if hasattr(q, "recover"):
+                q.recover()
+            if not q:
+                del self.queues[priority]
+                q.close()
+        self.curprio = min(self.queues) if self.queues else None
+
     def __len__(self):
         return sum(len(x) for x in self.queues.values()) if self.queues else 0
 
 
+def _registry_path(crawler, key, name):
+    if not key or not crawler.settings.getfloat("JOBDIR_CHECKPOINT_INTERVAL"):
+        return None
+    return Path(key, name)
+
+
+def _register(path, entry):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def _write_registry(path, entries):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = "".join(json.dumps(entry) + "\n" for entry in entries)
+    write_atomically(path, data.encode("utf-8"))
+
+
+def _read_registry(path):
+    if not path.exists():
+        return []
+    with path.open(encoding="utf-8") as f:
+        # the last line may be incomplete
+        return [json.loads(line) for line in f if line.endswith("\n")]
+
+
 class DownloaderInterface:
     def __init__(self, crawler):
         self.downloader = crawler.engine.downloader
@@ -176,6 +247,7 @@ class DownloaderAwarePriorityQueue:
         self.crawler = crawler
 
         self.pqueues = {}  # slot -> priority queue
+        self._registry = _registry_path(crawler, key, "slots.log")
         for slot, startprios in (slot_startprios or {}).items():
             self.pqueues[slot] = self.pqfactory(slot, startprios)
 
@@ -204,6 +276,8 @@ class DownloaderAwarePriorityQueue:
         slot = self._downloader_interface.get_slot_key(request)
         if slot not in self.pqueues:
             self.pqueues[slot] = self.pqfactory(slot)
+            if self._registry:
+                _register(self._registry, slot)
         queue = self.pqueues[slot]
         queue.push(request)
 
@@ -226,8 +300,237 @@ class DownloaderAwarePriorityQueue:
         self.pqueues.clear()
         return active
 
+    def checkpoint(self):
+        """See :meth:`ScrapyPriorityQueue.checkpoint`."""
+        active = {slot: queue.checkpoint() for slot, queue in self.pqueues.items()}
+        if self._registry:
+            _write_registry(self._registry, self.pqueues)
+        return active
+
+    def recover(self):
+        """See :meth:`ScrapyPriorityQueue.recover`."""
+        if self._registry:
+            for slot in _read_registry(self._registry):
+                if slot not in self.pqueues:
+                    self.pqueues[slot] = self.pqfactory(slot)
+        for slot, queue in list(self.pqueues.items()):
+            queue.recover()
+            if not queue:
+                del self.pqueues[slot]
+
     def __len__(self):
         return sum(len(x) for x in self.pqueues.values()) if self.pqueues else 0
 
     def __contains__(self, slot):
         return slot in self.pqueues
+
+
+class SlotFairPriorityQueue(DownloaderAwarePriorityQueue):
+    """PriorityQueue for broad crawls, which keeps a queue per download slot.
+
+    Only slots that can start a download right away are dequeued: slots
+    whose :setting:`DOWNLOAD_DELAY` has not passed since their last download,
+    and slots without free concurrency, are skipped until they can. Ready
+    slots are dequeued in turns, weighted by their concurrency, so a slot
+    with many requests cannot starve the others.
+
+    At most :setting:`SCHEDULER_SLOT_BUDGET` requests are accepted per slot,
+    or the ``budget`` of the slot in :setting:`DOWNLOAD_SLOTS`; :meth:`push`
+    raises :exc:`~scrapy.exceptions.IgnoreRequest` for further requests.
+    """
+
+    def __init__(self, crawler, downstream_queue_cls, key, slot_startprios=()):
+        super().__init__(crawler, downstream_queue_cls, key, slot_startprios)
+        self._downloader = self._downloader_interface.downloader
+        self._stats = crawler.stats
+        self._default_budget = crawler.settings.getint("SCHEDULER_SLOT_BUDGET")
+        self._budgets_path = Path(key, "budgets.json") if key else None
+        self._used = _budget_usage.setdefault(crawler, {})
+        self._used.update(self._read_budgets())
+        # (virtual time, sequence, slot) for every non-empty slot that may be
+        # ready, where the virtual time of a slot grows by 1 / concurrency with
+        # every request dequeued from it
+        self._turns = []
+        # (ready time, sequence, turn) for slots waiting for their download
+        # delay, and {slot: turn} for slots waiting for a download to finish
+        self._delayed = []
+        self._busy = {}
+        self._sequence = count()
+        self._vtime = 0.0
+        self._len = 0
+        self._wake_call = None
+        self._reset_turns()
+        crawler.signals.connect(
+            self._slot_freed, signal=signals.request_left_downloader
+        )
+
+    def _reset_turns(self):
+        self._turns = [(0.0, next(self._sequence), slot) for slot in self.pqueues]
+        self._delayed = []
+        self._busy = {}
+        self._len = sum(len(queue) for queue in self.pqueues.values())
+
+    def push(self, request):
+        slot = self._downloader_interface.get_slot_key(request)
+        budget = self._budget(slot)
+        if budget:
+            used = self._used.get(slot, 0)
+            if used >= budget:
+                logger.debug(
+                    "Dropped %(request)s, the budget of %(budget)d requests of "
+                    "slot %(slot)r is exhausted",
+                    {"request": request, "budget": budget, "slot": slot},
+                )
+                self._stats.inc_value("scheduler/slot_budget_exceeded")
+                raise IgnoreRequest(f"Budget of download slot {slot!r} exhausted")
+        queue = self.pqueues.get(slot)
+        new = queue is None
+        if new:
+            queue = self.pqueues[slot] = self.pqfactory(slot)
+            if self._registry:
+                _register(self._registry, slot)
+        try:
+            queue.push(request)  # this may fail (eg. serialization error)
+        except BaseException:
+            if new:
+                del self.pqueues[slot]
+                queue.close()
+            raise
+        if new:
+            heappush(self._turns, (self._vtime, next(self._sequence), slot))
+        if budget:
+            self._used[slot] = used + 1
+        self._len += 1
+
+    def pop(self):
+        turn = self._next_turn()
+        if turn is None:
+            return None
+        vtime, _, slot = turn
+        queue = self.pqueues[slot]
+        request = queue.pop()
+        self._len -= 1
+        self._vtime = vtime
+        if queue:
+            vtime += 1 / self._concurrency(slot)
+            heappush(self._turns, (vtime, next(self._sequence), slot))
+        else:
+            del self.pqueues[slot]
+            queue.close()
+        return request
+
+    def peek(self):
+        """Returns the next object to be returned by :meth:`pop`,
+        but without removing it from the queue.
+
+        Raises :exc:`NotImplementedError` if the underlying queue class does
+        not implement a ``peek`` method, which is optional for queues.
+        """
+        turn = self._next_turn()
+        if turn is None:
+            return None
+        heappush(self._turns, turn)
+        return self.pqueues[turn[2]].peek()
+
+    def close(self):
+        if self._wake_call is not None and self._wake_call.active():
+            self._wake_call.cancel()
+        self.crawler.signals.disconnect(
+            self._slot_freed, signal=signals.request_left_downloader
+        )
+        self._write_budgets()
+        self._turns.clear()
+        self._delayed.clear()
+        self._busy.clear()
+        self._len = 0
+        return super().close()
+
+    def checkpoint(self):
+        """See :meth:`ScrapyPriorityQueue.checkpoint`."""
+        self._write_budgets()
+        return super().checkpoint()
+
+    def recover(self):
+        """See :meth:`ScrapyPriorityQueue.recover`."""
+        super().recover()
+        self._reset_turns()
+
+    def __len__(self):
+        return self._len
+
+    def _next_turn(self):
+        """Remove and return the turn of the first slot that can start a
+        download right away, and wake up the engine when the first delayed
+        slot will be ready if there is none.
+
+        Slots that cannot start a download are set aside, so that they are
+        not checked again on every call: delayed slots until their delay
+        passes, busy slots until a download of theirs finishes."""
+        now = time()
+        while self._delayed and self._delayed[0][0] <= now:
+            heappush(self._turns, heappop(self._delayed)[2])
+        while self._turns:
+            turn = heappop(self._turns)
+            wait = self._wait(turn[2], now)
+            if wait == 0:
+                return turn
+            if wait is None:
+                self._busy[turn[2]] = turn
+            else:
+                heappush(self._delayed, (now + wait, next(self._sequence), turn))
+        if self._delayed:
+            self._wake_engine_in(self._delayed[0][0] - now)
+        return None
+
+    def _slot_freed(self, request, spider):
+        turn = self._busy.pop(self._downloader_interface.get_slot_key(request), None)
+        if turn is not None:
+            heappush(self._turns, turn)
+
+    def _wait(self, slot_key, now):
+        """Return the seconds until the download slot can start a download,
+        ``0`` if it can right away, or ``None`` if it has to finish a
+        download first."""
+        slot = self._downloader.slots.get(slot_key)
+        if slot is None:
+            return 0
+        if slot.queue or slot.free_transfer_slots() <= 0:
+            return None
+        return max(slot.lastseen + slot.delay - now, 0)
+
+    def _concurrency(self, slot_key):
+        slot = self._downloader.slots.get(slot_key)
+        if slot is not None:
+            return slot.concurrency
+        slot_settings = self._downloader.per_slot_settings.get(slot_key, {})
+        return slot_settings.get("concurrency", self._downloader.domain_concurrency)
+
+    def _budget(self, slot_key):
+        slot_settings = self._downloader.per_slot_settings.get(slot_key, {})
+        return slot_settings.get("budget", self._default_budget)
+
+    def _wake_engine_in(self, seconds):
+        from twisted.internet import reactor
+
+        if self._wake_call is not None and self._wake_call.active():
+            if self._wake_call.getTime() <= reactor.seconds() + seconds:
+                return
+            self._wake_call.cancel()
+        self._wake_call = reactor.callLater(seconds, self._wake_engine)
+
+    def _wake_engine(self):
+        slot = getattr(self.crawler.engine, "slot", None)
+        if slot is not None:
+            slot.nextcall.schedule()
+
+    def _read_budgets(self):
+        if self._budgets_path is None or not self._budgets_path.exists():
+            return {}
+        with self._budgets_path.open(encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_budgets(self):
+        if self._budgets_path is None or not self._used:
+            return
+        self._budgets_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomically(self._budgets_path, json.dumps(self._used).encode())
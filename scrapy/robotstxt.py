@@ -1,11 +1,21 @@
 import logging
+import re
 import sys
 from abc import ABCMeta, abstractmethod
 
+from scrapy.utils.datatypes import LocalCache
 from scrapy.utils.python import to_unicode
 
 logger = logging.getLogger(__name__)
 
+# the path of an absolute URL, without its query and fragment
+_URL_PATH = re.compile(r"[^:/?#]+://[^/?#]*([^?#]*)").match
+
+# Rule values with these may match beyond a prefix of the path: a query
+# string, the end of the URL, a wildcard, or escapes that change length once
+# decoded. Parsers also handle rules ending in index.html as a special case.
+_NON_PREFIX_RULE = re.compile(r"[?$%]|\*.*[^*\s]|index\.html\s*$").search
+
 
 def decode_robotstxt(robotstxt_body, spider, to_native_str_type=False):
     try:
@@ -26,6 +36,48 @@ def decode_robotstxt(robotstxt_body, spider, to_native_str_type=False):
     return robotstxt_body
 
 
+class _PathPrefixDecisions:
+    """Cache of the decisions of a robots.txt parser by URL path prefix.
+
+    When all the rules of a robots.txt file are path prefixes, whether a URL
+    is allowed only depends on the first characters of its path, as many as
+    the longest rule may have once percent-encoded, so URLs sharing those
+    characters get the same decision and the parser is only asked once.
+    """
+
+    def __init__(self, robotstxt_body, limit=10000):
+        self.prefix_length = self._get_prefix_length(robotstxt_body)
+        self.decisions = LocalCache(limit=limit)
+
+    @staticmethod
+    def _get_prefix_length(robotstxt_body):
+        body = robotstxt_body.decode("utf-8", errors="replace")
+        # parsers always allow /robots.txt itself
+        prefix_length = len("/robots.txt") + 1
+        for line in body.splitlines():
+            line = line.partition("#")[0]
+            field, sep, value = line.partition(":")
+            if field.strip().lower() in ("user-agent", "sitemap", "host"):
+                continue
+            if _NON_PREFIX_RULE(line):
+                return None
+            value = (value if sep else line).strip()
+            # each byte takes at most 3 characters once percent-encoded (%XX)
+            prefix_length = max(prefix_length, 3 * len(value.encode("utf-8")))
+        return prefix_length
+
+    def allowed(self, url, user_agent, parser_allowed):
+        match = _URL_PATH(url) if self.prefix_length else None
+        if match is None or "%" in match[1]:
+            return parser_allowed(url, user_agent)
+        key = (user_agent, match[1][: self.prefix_length])
+        try:
+            return self.decisions[key]
+        except KeyError:
+            allowed = self.decisions[key] = parser_allowed(url, user_agent)
+            return allowed
+
+
 class RobotParser(metaclass=ABCMeta):
     @classmethod
     @abstractmethod
@@ -59,6 +111,7 @@ class PythonRobotParser(RobotParser):
         from urllib.robotparser import RobotFileParser
 
         self.spider = spider
+        self._decisions = _PathPrefixDecisions(robotstxt_body)
         robotstxt_body = decode_robotstxt(
             robotstxt_body, spider, to_native_str_type=True
         )
@@ -72,6 +125,9 @@ class PythonRobotParser(RobotParser):
         return o
 
     def allowed(self, url, user_agent):
+        return self._decisions.allowed(url, user_agent, self._allowed)
+
+    def _allowed(self, url, user_agent):
         user_agent = to_unicode(user_agent)
         url = to_unicode(url)
         return self.rp.can_fetch(user_agent, url)
@@ -82,6 +138,7 @@ class ReppyRobotParser(RobotParser):
         from reppy.robots import Robots
 
         self.spider = spider
+        self._decisions = _PathPrefixDecisions(robotstxt_body)
         self.rp = Robots.parse("", robotstxt_body)
 
     @classmethod
@@ -91,6 +148,9 @@ class ReppyRobotParser(RobotParser):
         return o
 
     def allowed(self, url, user_agent):
+        return self._decisions.allowed(url, user_agent, self._allowed)
+
+    def _allowed(self, url, user_agent):
         return self.rp.allowed(url, user_agent)
 
 
@@ -99,6 +159,7 @@ class RerpRobotParser(RobotParser):
         from robotexclusionrulesparser import RobotExclusionRulesParser
 
         self.spider = spider
+        self._decisions = _PathPrefixDecisions(robotstxt_body)
         self.rp = RobotExclusionRulesParser()
         robotstxt_body = decode_robotstxt(robotstxt_body, spider)
         self.rp.parse(robotstxt_body)
@@ -110,6 +171,9 @@ class RerpRobotParser(RobotParser):
         return o
 
     def allowed(self, url, user_agent):
+        return self._decisions.allowed(url, user_agent, self._allowed)
+
+    def _allowed(self, url, user_agent):
         user_agent = to_unicode(user_agent)
         url = to_unicode(url)
         return self.rp.is_allowed(user_agent, url)
@@ -120,6 +184,7 @@ class ProtegoRobotParser(RobotParser):
         from protego import Protego
 
         self.spider = spider
+        self._decisions = _PathPrefixDecisions(robotstxt_body)
         robotstxt_body = decode_robotstxt(robotstxt_body, spider)
         self.rp = Protego.parse(robotstxt_body)
 
@@ -130,6 +195,9 @@ class ProtegoRobotParser(RobotParser):
         return o
 
     def allowed(self, url, user_agent):
+        return self._decisions.allowed(url, user_agent, self._allowed)
+
+    def _allowed(self, url, user_agent):
         user_agent = to_unicode(user_agent)
         url = to_unicode(url)
         return self.rp.can_fetch(url, user_agent)
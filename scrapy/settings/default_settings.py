@@ -38,6 +38,8 @@ CLOSESPIDER_ERRORCOUNT = 0
 
 COMMANDS_MODULE = ""
 
+COMPONENT_TIMING_ENABLED = False
+
 COMPRESSION_ENABLED = True
 
 CONCURRENT_ITEMS = 100
@@ -48,6 +50,7 @@ CONCURRENT_REQUESTS_PER_IP = 0
 
 COOKIES_ENABLED = True
 COOKIES_DEBUG = False
+COOKIES_MAX_JARS_IN_MEMORY = 0
 
 DEFAULT_ITEM_CLASS = "scrapy.item.Item"
 
@@ -109,6 +112,7 @@ DOWNLOADER_MIDDLEWARES_BASE = {
     "scrapy.downloadermiddlewares.retry.RetryMiddleware": 550,
     "scrapy.downloadermiddlewares.ajaxcrawl.AjaxCrawlMiddleware": 560,
     "scrapy.downloadermiddlewares.redirect.MetaRefreshMiddleware": 580,
+    "scrapy.downloadermiddlewares.encodinghints.EncodingHintsMiddleware": 585,
     "scrapy.downloadermiddlewares.httpcompression.HttpCompressionMiddleware": 590,
     "scrapy.downloadermiddlewares.redirect.RedirectMiddleware": 600,
     "scrapy.downloadermiddlewares.cookies.CookiesMiddleware": 700,
@@ -126,6 +130,9 @@ EDITOR = "vi"
 if sys.platform == "win32":
     EDITOR = "%s -m idlelib.idle"
 
+ENCODING_HINTS_ENABLED = False
+ENCODING_HINTS_MAX_HOSTS = 10000
+
 EXTENSIONS = {}
 
 EXTENSIONS_BASE = {
@@ -166,16 +173,23 @@ FEED_EXPORTERS_BASE = {
     "xml": "scrapy.exporters.XmlItemExporter",
     "marshal": "scrapy.exporters.MarshalItemExporter",
     "pickle": "scrapy.exporters.PickleItemExporter",
+    "parquet": "scrapy.exporters.ParquetItemExporter",
 }
 FEED_EXPORT_INDENT = 0
 
 FEED_STORAGE_FTP_ACTIVE = False
 FEED_STORAGE_GCS_ACL = ""
 FEED_STORAGE_S3_ACL = ""
+FEED_STORAGE_S3_PART_CONCURRENCY = 4
+FEED_STORAGE_S3_PART_SIZE = 0
 
 FILES_STORE_S3_ACL = "private"
 FILES_STORE_GCS_ACL = ""
 
+FRONTIER_BATCH_SIZE = 100
+FRONTIER_ENDPOINT = "tcp:host=127.0.0.1:port=6810"
+FRONTIER_LISTEN = "tcp:port=6810:interface=127.0.0.1"
+
 FTP_USER = "anonymous"
 FTP_PASSWORD = "guest"
 FTP_PASSIVE_MODE = True
@@ -198,6 +212,9 @@ HTTPCACHE_GZIP = False
 HTTPPROXY_ENABLED = True
 HTTPPROXY_AUTH_ENCODING = "latin-1"
 
+IMAGES_EXECUTOR = None
+IMAGES_EXECUTOR_MAX_JOBS = 16
+IMAGES_EXECUTOR_WORKERS = 0
 IMAGES_STORE_S3_ACL = "private"
 IMAGES_STORE_GCS_ACL = ""
 
@@ -206,6 +223,8 @@ ITEM_PROCESSOR = "scrapy.pipelines.ItemPipelineManager"
 ITEM_PIPELINES = {}
 ITEM_PIPELINES_BASE = {}
 
+JOBDIR_CHECKPOINT_INTERVAL = 0
+
 LOG_ENABLED = True
 LOG_ENCODING = "utf-8"
 LOG_FORMATTER = "scrapy.logformatter.LogFormatter"
@@ -227,6 +246,9 @@ MAIL_FROM = "scrapy@localhost"
 MAIL_PASS = None
 MAIL_USER = None
 
+MEDIA_CACHE_SIZE = 100_000
+MEDIA_STORE_THREADS = 10
+
 MEMDEBUG_ENABLED = False  # enable memory debugging
 MEMDEBUG_NOTIFY = []  # send memory debugging report by mail at engine shutdown
 
@@ -276,6 +298,10 @@ RETRY_EXCEPTIONS = [
     "scrapy.core.downloader.handlers.http11.TunnelError",
 ]
 
+ROBOTSTXT_CACHE_DIR = ""
+ROBOTSTXT_CACHE_ENABLED = False
+ROBOTSTXT_CACHE_EXPIRATION_SECS = 86400
+ROBOTSTXT_CACHE_SIZE = 10000
 ROBOTSTXT_OBEY = False
 ROBOTSTXT_PARSER = "scrapy.robotstxt.ProtegoRobotParser"
 ROBOTSTXT_USER_AGENT = None
@@ -284,10 +310,12 @@ SCHEDULER = "scrapy.core.scheduler.Scheduler"
 SCHEDULER_DISK_QUEUE = "scrapy.squeues.PickleLifoDiskQueue"
 SCHEDULER_MEMORY_QUEUE = "scrapy.squeues.LifoMemoryQueue"
 SCHEDULER_PRIORITY_QUEUE = "scrapy.pqueues.ScrapyPriorityQueue"
+SCHEDULER_SLOT_BUDGET = 0
 
 SCRAPER_SLOT_MAX_ACTIVE_SIZE = 5000000
 
 SPIDER_LOADER_CLASS = "scrapy.spiderloader.SpiderLoader"
+SPIDER_LOADER_INDEX_FILE = "spider_index.json"
 SPIDER_LOADER_WARN_ONLY = False
 
 SPIDER_MIDDLEWARES = {}
@@ -304,6 +332,8 @@ SPIDER_MIDDLEWARES_BASE = {
 
 SPIDER_MODULES = []
 
+START_REQUESTS_BATCH_SIZE = 16
+
 STATS_CLASS = "scrapy.statscollectors.MemoryStatsCollector"
 STATS_DUMP = True
 
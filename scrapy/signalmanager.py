@@ -1,14 +1,20 @@
-from typing import Any, List, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from pydispatch import dispatcher
 from twisted.internet.defer import Deferred
 
 from scrapy.utils import signal as _signal
 
+if TYPE_CHECKING:
+    from scrapy.utils.timing import ComponentTimer
+
 
 class SignalManager:
     def __init__(self, sender: Any = dispatcher.Anonymous):
         self.sender: Any = sender
+        self._timer: Optional[ComponentTimer] = None
 
     def connect(self, receiver: Any, signal: Any, **kwargs: Any) -> None:
         """
@@ -44,6 +50,8 @@ class SignalManager:
         through the :meth:`connect` method).
         """
         kwargs.setdefault("sender", self.sender)
+        if self._timer is not None:
+            kwargs["_timer"] = self._timer
         return _signal.send_catch_log(signal, **kwargs)
 
     def send_catch_log_deferred(self, signal: Any, **kwargs: Any) -> Deferred:
@@ -58,6 +66,8 @@ class SignalManager:
         through the :meth:`connect` method).
         """
         kwargs.setdefault("sender", self.sender)
+        if self._timer is not None:
+            kwargs["_timer"] = self._timer
         return _signal.send_catch_log_deferred(signal, **kwargs)
 
     def disconnect_all(self, signal: Any, **kwargs: Any) -> None:
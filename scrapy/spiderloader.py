@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import json
+import logging
+import os
 import traceback
 import warnings
 from collections import defaultdict
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from pkgutil import iter_modules
 from types import ModuleType
-from typing import TYPE_CHECKING, DefaultDict, Dict, List, Tuple, Type
+from typing import TYPE_CHECKING, Any, DefaultDict, Dict, List, Optional, Tuple, Type
 
 from zope.interface import implementer
 
@@ -12,12 +19,15 @@ from scrapy import Request, Spider
 from scrapy.interfaces import ISpiderLoader
 from scrapy.settings import BaseSettings
 from scrapy.utils.misc import walk_modules
+from scrapy.utils.project import data_path
 from scrapy.utils.spider import iter_spider_classes
 
 if TYPE_CHECKING:
     # typing.Self requires Python 3.11
     from typing_extensions import Self
 
+logger = logging.getLogger(__name__)
+
 
 @implementer(ISpiderLoader)
 class SpiderLoader:
@@ -101,3 +111,127 @@ class SpiderLoader:
         Return a list with the names of all spiders available in the project.
         """
         return list(self._spiders.keys())
+
+
+@implementer(ISpiderLoader)
+class IndexedSpiderLoader(SpiderLoader):
+    """
+    SpiderLoader that only imports the module of the spider being loaded.
+
+    The name and location of every spider are kept in an index file (see
+    :setting:`SPIDER_LOADER_INDEX_FILE`), together with the modification time
+    and size of every module file found in :setting:`SPIDER_MODULES`. When any
+    of those files is added, removed or modified, all spider modules are
+    imported as :class:`SpiderLoader` does, and the index is rebuilt.
+    """
+
+    def __init__(self, settings: BaseSettings):
+        self.spider_modules: List[str] = settings.getlist("SPIDER_MODULES")
+        self.warn_only: bool = settings.getbool("SPIDER_LOADER_WARN_ONLY")
+        self._spiders: Dict[str, Type[Spider]] = {}
+        self._found: DefaultDict[str, List[Tuple[str, str]]] = defaultdict(list)
+        self._index_path = Path(data_path(settings["SPIDER_LOADER_INDEX_FILE"]))
+        files = self._get_module_files()
+        index = self._read_index()
+        if (
+            files is not None
+            and index is not None
+            and index["spider_modules"] == self.spider_modules
+            and index["files"] == files
+        ):
+            for name, locations in index["spiders"].items():
+                self._found[name] = [(mod, cls) for mod, cls in locations]
+            self._check_name_duplicates()
+        else:
+            self._load_all_spiders()
+            if files is not None:
+                self._write_index(files)
+
+    def _get_module_files(self) -> Optional[Dict[str, List[int]]]:
+        """Return the modification time and size of the file of every module
+        that _load_all_spiders() would import, without importing them, or
+        None if those files cannot be found."""
+        files: Dict[str, List[int]] = {}
+        specs = []
+        for name in self.spider_modules:
+            try:
+                spec = find_spec(name)
+            except (ImportError, ValueError):
+                return None
+            if spec is None:
+                return None
+            specs.append(spec)
+        while specs:
+            spec = specs.pop()
+            if not spec.has_location or spec.origin is None:
+                return None
+            try:
+                stat = os.stat(spec.origin)
+            except OSError:
+                return None
+            files[spec.origin] = [stat.st_mtime_ns, stat.st_size]
+            for info in iter_modules(
+                spec.submodule_search_locations or [], prefix=f"{spec.name}."
+            ):
+                finder = info.module_finder
+                subspec = finder.find_spec(info.name)  # type: ignore[call-arg]
+                if subspec is None:
+                    return None
+                specs.append(subspec)
+        return files
+
+    def _read_index(self) -> Optional[Dict[str, Any]]:
+        try:
+            with self._index_path.open(encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_index(self, files: Dict[str, List[int]]) -> None:
+        index = {
+            "spider_modules": self.spider_modules,
+            "files": files,
+            "spiders": self._found,
+        }
+        tmp_path = self._index_path.with_name(f"{self._index_path.name}.tmp")
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(index, f)
+            tmp_path.replace(self._index_path)
+        except OSError as e:
+            logger.debug(
+                "Could not write the spider index %(path)s: %(error)s",
+                {"path": self._index_path, "error": e},
+            )
+
+    def load(self, spider_name: str) -> Type[Spider]:
+        if spider_name not in self._spiders and spider_name in self._found:
+            for module_name, _ in self._found[spider_name]:
+                try:
+                    module = import_module(module_name)
+                except ImportError:
+                    if not self.warn_only:
+                        raise
+                    warnings.warn(
+                        f"\n{traceback.format_exc()}Could not load spiders "
+                        f"from module '{module_name}'. "
+                        "See above traceback for details.",
+                        category=RuntimeWarning,
+                    )
+                    continue
+                for spcls in iter_spider_classes(module):
+                    if spcls.name == spider_name:
+                        self._spiders[spider_name] = spcls
+        return super().load(spider_name)
+
+    def find_by_request(self, request: Request) -> List[str]:
+        for name in self._found:
+            try:
+                self.load(name)
+            except KeyError:
+                pass
+        return super().find_by_request(request)
+
+    def list(self) -> List[str]:
+        return list(self._found)
@@ -9,15 +9,31 @@ import warnings
 
 from scrapy import signals
 from scrapy.http import Request
+from scrapy.utils.deprecate import method_is_overridden
 from scrapy.utils.httpobj import urlparse_cached
+from scrapy.utils.url import _host_is_from_any_domain
 
 logger = logging.getLogger(__name__)
 
 
 class OffsiteMiddleware:
+    _allowed_domains = None
+    _host_regex = None
+
     def __init__(self, stats):
         self.stats = stats
 
+    @property
+    def host_regex(self):
+        # only built when needed if allowed domains are looked up in a set
+        if self._host_regex is None:
+            self._host_regex = self.get_host_regex(self._spider)
+        return self._host_regex
+
+    @host_regex.setter
+    def host_regex(self, host_regex):
+        self._host_regex = host_regex
+
     @classmethod
     def from_crawler(cls, crawler):
         o = cls(crawler.stats)
@@ -50,16 +66,19 @@ class OffsiteMiddleware:
         return False
 
     def should_follow(self, request, spider):
-        regex = self.host_regex
         # hostname can be None for wrong urls (like javascript links)
         host = urlparse_cached(request).hostname or ""
+        if self._allowed_domains is not None:
+            return _host_is_from_any_domain(host, self._allowed_domains)
+        regex = self.host_regex
         return bool(regex.search(host))
 
-    def get_host_regex(self, spider):
-        """Override this method to implement a different offsite policy"""
+    def _get_allowed_domains(self, spider):
+        """Return the valid entries of the allowed_domains attribute of the
+        spider, or None if any domain is allowed."""
         allowed_domains = getattr(spider, "allowed_domains", None)
         if not allowed_domains:
-            return re.compile("")  # allow all by default
+            return None
         url_pattern = re.compile(r"^https?://.*$")
         port_pattern = re.compile(r":\d+$")
         domains = []
@@ -79,12 +98,33 @@ class OffsiteMiddleware:
                 )
                 warnings.warn(message, PortWarning)
             else:
-                domains.append(re.escape(domain))
-        regex = rf'^(.*\.)?({"|".join(domains)})$'
+                domains.append(domain)
+        return domains
+
+    def get_host_regex(self, spider):
+        """Override this method to implement a different offsite policy"""
+        domains = self._get_allowed_domains(spider)
+        if domains is None:
+            return re.compile("")  # allow all by default
+        regex = rf'^(.*\.)?({"|".join(re.escape(d) for d in domains)})$'
         return re.compile(regex)
 
     def spider_opened(self, spider):
-        self.host_regex = self.get_host_regex(spider)
+        self._spider = spider
+        self._allowed_domains = None
+        self._host_regex = None
+        cls = type(self)
+        if not method_is_overridden(
+            cls, OffsiteMiddleware, "get_host_regex"
+        ) and not method_is_overridden(cls, OffsiteMiddleware, "should_follow"):
+            domains = self._get_allowed_domains(spider)
+            # with no valid domain, get_host_regex() still matches some hosts
+            if domains:
+                # Looking up every parent domain of a host in a set scales to
+                # any number of allowed domains, unlike get_host_regex().
+                self._allowed_domains = set(domains)
+        if self._allowed_domains is None:
+            self.host_regex = self.get_host_regex(spider)
         self.domains_seen = set()
 
 
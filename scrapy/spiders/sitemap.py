@@ -3,7 +3,8 @@ import re
 
 from scrapy.http import Request, XmlResponse
 from scrapy.spiders import Spider
-from scrapy.utils.gz import gunzip, gzip_magic_number
+from scrapy.utils.deprecate import method_is_overridden
+from scrapy.utils.gz import gunzip_chunks, gzip_magic_number
 from scrapy.utils.sitemap import Sitemap, sitemap_urls_from_robots
 
 logger = logging.getLogger(__name__)
@@ -41,7 +42,10 @@ class SitemapSpider(Spider):
             for url in sitemap_urls_from_robots(response.text, base_url=response.url):
                 yield Request(url, callback=self._parse_sitemap)
         else:
-            body = self._get_sitemap_body(response)
+            if method_is_overridden(type(self), SitemapSpider, "_get_sitemap_body"):
+                body = self._get_sitemap_body(response)
+            else:
+                body = self._get_sitemap_chunks(response)
             if body is None:
                 logger.warning(
                     "Ignoring invalid sitemap: %(response)s",
@@ -68,10 +72,21 @@ class SitemapSpider(Spider):
         """Return the sitemap body contained in the given response,
         or None if the response is not a sitemap.
         """
+        chunks = self._get_sitemap_chunks(response)
+        if chunks is not None:
+            return b"".join(chunks)
+
+    def _get_sitemap_chunks(self, response):
+        """Return an iterable over the sitemap body contained in the given
+        response, or None if the response is not a sitemap.
+
+        Gzipped sitemaps are decompressed chunk by chunk while they are
+        parsed, instead of all at once.
+        """
         if isinstance(response, XmlResponse):
-            return response.body
+            return [response.body]
         if gzip_magic_number(response):
-            return gunzip(response.body)
+            return gunzip_chunks(response.body)
         # actual gzipped sitemap files are decompressed above ;
         # if we are here (response body is not gzipped)
         # and have a response for .xml.gz,
@@ -82,7 +97,7 @@ class SitemapSpider(Spider):
         # merely XML gzip-compressed on the fly,
         # in other word, here, we have plain XML
         if response.url.endswith(".xml") or response.url.endswith(".xml.gz"):
-            return response.body
+            return [response.body]
 
 
 def regex(x):
@@ -2,16 +2,23 @@
 Scheduler queues
 """
 
+import json
+import logging
 import marshal
+import os
 import pickle
+import struct
 from os import PathLike
 from pathlib import Path
 from typing import Union
 
 from queuelib import queue
 
+from scrapy.utils.job import write_atomically
 from scrapy.utils.request import request_from_dict
 
+logger = logging.getLogger(__name__)
+
 
 def _with_mkdir(queue_class):
     class DirectoriesCreated(queue_class):
@@ -24,6 +31,97 @@ def _with_mkdir(queue_class):
     return DirectoriesCreated
 
 
+class _CheckpointFifoDiskQueue(queue.FifoDiskQueue):
+    """A FIFO disk queue that can save its state while open, and recover it
+    from its chunk files if the crawl was killed afterwards."""
+
+    def _loadinfo(self, chunksize):
+        info = super()._loadinfo(chunksize)
+        # chunks read to the end after the last checkpoint have been removed
+        tnum = info["tail"][0]
+        chunks = [int(p.name[1:]) for p in Path(self.path).glob("q*")]
+        while chunks and tnum < max(chunks) and not self._chunkpath(tnum).exists():
+            tnum += 1
+            info["tail"] = [tnum, 0, 0]
+        return info
+
+    def _saveinfo(self, info):
+        info["head_offset"] = self._chunkpath(info["head"][0]).stat().st_size
+        write_atomically(self._infopath(), json.dumps(info).encode())
+
+    def _chunkpath(self, number):
+        return Path(self.path, f"q{number:05d}")
+
+    def checkpoint(self):
+        self._saveinfo(self.info)
+
+    def recover(self):
+        """Count the items pushed after the last checkpoint."""
+        hnum, hpos = self.info["head"]
+        offset = self.info.get("head_offset")
+        if offset is None:  # saved by queuelib, count the whole chunk
+            hpos = offset = 0
+        while self._chunkpath(hnum).exists():
+            with self._chunkpath(hnum).open("rb") as f:
+                f.seek(offset)
+                while True:
+                    szhdr = f.read(self.szhdr_size)
+                    if len(szhdr) < self.szhdr_size:
+                        break
+                    (size,) = struct.unpack(self.szhdr_format, szhdr)
+                    f.seek(size, os.SEEK_CUR)
+                    hpos += 1
+            if hpos < self.chunksize:
+                break
+            hnum, hpos, offset = hnum + 1, 0, 0
+        tnum, tcnt, _ = self.info["tail"]
+        self.info["head"] = [hnum, hpos]
+        self.info["size"] = (hnum - tnum) * self.chunksize + hpos - tcnt
+        if Path(self.headf.name) != self._chunkpath(hnum):
+            self.headf.close()
+            self.headf = self._openchunk(hnum, "ab+")
+
+
+class _CheckpointLifoDiskQueue(queue.LifoDiskQueue):
+    """A LIFO disk queue that can save its state while open, and recover it
+    from its file if the crawl was killed afterwards."""
+
+    _checkpointed = False
+
+    def push(self, string):
+        super().push(string)
+        if self._checkpointed:
+            # so that killing the process does not lose buffered items
+            self.f.flush()
+
+    def checkpoint(self):
+        self._checkpointed = True
+        self.f.seek(0)
+        self.f.write(struct.pack(self.SIZE_FORMAT, self.size))
+        self.f.seek(0, os.SEEK_END)
+        self.f.flush()
+
+    def recover(self):
+        """Count the items in the file, which ends with the size of its last
+        item."""
+        end = position = self.f.seek(0, os.SEEK_END)
+        size = 0
+        while position > self.SIZE_SIZE:
+            self.f.seek(position - self.SIZE_SIZE)
+            (length,) = struct.unpack(self.SIZE_FORMAT, self.f.read(self.SIZE_SIZE))
+            position -= self.SIZE_SIZE + length
+            size += 1
+        self.f.seek(end)
+        if position != self.SIZE_SIZE:
+            logger.warning(
+                "Could not count the requests in %(path)s, keeping the "
+                "count of the last checkpoint",
+                {"path": self.path},
+            )
+            return
+        self.size = size
+
+
 def _serializable_queue(queue_class, serialize, deserialize):
     class SerializableQueue(queue_class):
         def push(self, obj):
@@ -123,16 +221,16 @@ def _pickle_serialize(obj):
 
 
 _PickleFifoSerializationDiskQueue = _serializable_queue(
-    _with_mkdir(queue.FifoDiskQueue), _pickle_serialize, pickle.loads
+    _with_mkdir(_CheckpointFifoDiskQueue), _pickle_serialize, pickle.loads
 )
 _PickleLifoSerializationDiskQueue = _serializable_queue(
-    _with_mkdir(queue.LifoDiskQueue), _pickle_serialize, pickle.loads
+    _with_mkdir(_CheckpointLifoDiskQueue), _pickle_serialize, pickle.loads
 )
 _MarshalFifoSerializationDiskQueue = _serializable_queue(
-    _with_mkdir(queue.FifoDiskQueue), marshal.dumps, marshal.loads
+    _with_mkdir(_CheckpointFifoDiskQueue), marshal.dumps, marshal.loads
 )
 _MarshalLifoSerializationDiskQueue = _serializable_queue(
-    _with_mkdir(queue.LifoDiskQueue), marshal.dumps, marshal.loads
+    _with_mkdir(_CheckpointLifoDiskQueue), marshal.dumps, marshal.loads
 )
 
 # public queue classes
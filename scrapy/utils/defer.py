@@ -328,6 +328,24 @@ def deferred_from_coro(o: _T) -> Union[Deferred, _T]:
     return o
 
 
+async def _maybe_await(o: Any) -> Any:
+    """Await *o* if it is a :class:`~twisted.internet.defer.Deferred` or an
+    awaitable object, return it as is otherwise.
+
+    With the asyncio reactor, Deferreds are awaited by wrapping them into
+    :class:`asyncio.Future` objects. Otherwise the coroutine must be run with
+    :func:`~twisted.internet.defer.ensureDeferred`, e.g. through
+    :func:`deferred_from_coro`.
+    """
+    if isinstance(o, Deferred):
+        if not is_asyncio_reactor_installed():
+            return await o
+        return await deferred_to_future(o)
+    if asyncio.isfuture(o) or inspect.isawaitable(o):
+        return await o
+    return o
+
+
 def deferred_f_from_coro_f(coro_f: Callable[..., Coroutine]) -> Callable:
     """Converts a coroutine function into a function that returns a Deferred.
 
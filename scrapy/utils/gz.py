@@ -1,7 +1,7 @@
 import struct
 from gzip import GzipFile
 from io import BytesIO
-from typing import List
+from typing import Iterator
 
 from scrapy.http import Response
 
@@ -11,21 +11,28 @@ def gunzip(data: bytes) -> bytes:
 
     This is resilient to CRC checksum errors.
     """
+    return b"".join(gunzip_chunks(data))
+
+
+def gunzip_chunks(data: bytes, chunk_size: int = 8196) -> Iterator[bytes]:
+    """Like :func:`gunzip`, but decompress the given data incrementally,
+    yielding chunks of at most *chunk_size* bytes."""
     f = GzipFile(fileobj=BytesIO(data))
-    output_list: List[bytes] = []
+    has_output = False
     chunk = b"."
     while chunk:
         try:
-            chunk = f.read1(8196)
-            output_list.append(chunk)
+            chunk = f.read1(chunk_size)
         except (OSError, EOFError, struct.error):
             # complete only if there is some data, otherwise re-raise
             # see issue 87 about catching struct.error
-            # some pages are quite small so output_list is empty
-            if output_list:
+            # some pages are quite small so there is no output yet
+            if has_output:
                 break
             raise
-    return b"".join(output_list)
+        has_output = True
+        if chunk:
+            yield chunk
 
 
 def gzip_magic_number(response: Response) -> bool:
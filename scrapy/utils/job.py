@@ -1,5 +1,6 @@
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from scrapy.settings import BaseSettings
 
@@ -9,3 +10,13 @@ def job_dir(settings: BaseSettings) -> Optional[str]:
     if path and not Path(path).exists():
         Path(path).mkdir(parents=True)
     return path
+
+
+def write_atomically(path: Union[str, os.PathLike], data: bytes) -> None:
+    """Replace the contents of the file at *path* with *data*, so that a crash
+    leaves either the old or the new contents, never a mix of both."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
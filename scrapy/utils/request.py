@@ -23,17 +23,18 @@ from urllib.parse import urlunparse
 from weakref import WeakKeyDictionary
 
 from w3lib.http import basic_auth_header
-from w3lib.url import canonicalize_url
 
 from scrapy import Request, Spider
 from scrapy.exceptions import ScrapyDeprecationWarning
 from scrapy.utils.httpobj import urlparse_cached
 from scrapy.utils.misc import load_object
 from scrapy.utils.python import to_bytes, to_unicode
+from scrapy.utils.url import _canonicalize_url
 
 if TYPE_CHECKING:
     from scrapy.crawler import Crawler
 
+
 _deprecated_fingerprint_cache: "WeakKeyDictionary[Request, Dict[Tuple[Optional[Tuple[bytes, ...]], bool], str]]"
 _deprecated_fingerprint_cache = WeakKeyDictionary()
 
@@ -146,7 +147,7 @@ def request_fingerprint(
         fp = hashlib.sha1()
         fp.update(to_bytes(request.method))
         fp.update(
-            to_bytes(canonicalize_url(request.url, keep_fragments=keep_fragments))
+            to_bytes(_canonicalize_url(request.url, keep_fragments=keep_fragments))
         )
         fp.update(request.body or b"")
         if processed_include_headers:
@@ -222,7 +223,7 @@ def fingerprint(
                     ]
         fingerprint_data = {
             "method": to_unicode(request.method),
-            "url": canonicalize_url(request.url, keep_fragments=keep_fragments),
+            "url": _canonicalize_url(request.url, keep_fragments=keep_fragments),
             "body": (request.body or b"").hex(),
             "headers": headers,
         }
@@ -231,6 +232,31 @@ def fingerprint(
     return cache[cache_key]
 
 
+_fingerprint_2_11_cache: "WeakKeyDictionary[Request, bytes]"
+_fingerprint_2_11_cache = WeakKeyDictionary()
+
+
+def _fingerprint_2_11(request: Request) -> bytes:
+    """Return a 128-bit BLAKE2b hash of the method, the canonical URL and the
+    body of *request*.
+
+    Unlike :func:`fingerprint`, it does not build a JSON document to hash and
+    it does not support including headers or URL fragments.
+    """
+    try:
+        return _fingerprint_2_11_cache[request]
+    except KeyError:
+        pass
+    fp = hashlib.blake2b(digest_size=16)
+    fp.update(to_bytes(request.method))
+    fp.update(b" ")
+    fp.update(to_bytes(_canonicalize_url(request.url)))
+    fp.update(b"\n")
+    fp.update(request.body)
+    result = _fingerprint_2_11_cache[request] = fp.digest()
+    return result
+
+
 class RequestFingerprinterProtocol(Protocol):
     def fingerprint(self, request: Request) -> bytes:
         ...
@@ -244,7 +270,9 @@ class RequestFingerprinter:
     <scrapy.http.Request.url>` and the values of :attr:`request.method
     <scrapy.http.Request.method>` and :attr:`request.body
     <scrapy.http.Request.body>`. It then generates an `SHA1
-    <https://en.wikipedia.org/wiki/SHA-1>`_ hash.
+    <https://en.wikipedia.org/wiki/SHA-1>`_ hash, or a 128-bit `BLAKE2b
+    <https://en.wikipedia.org/wiki/BLAKE_(hash_function)#BLAKE2>`_ hash with
+    the ``'2.11'`` implementation.
 
     .. seealso:: :setting:`REQUEST_FINGERPRINTER_IMPLEMENTATION`.
     """
@@ -279,12 +307,14 @@ class RequestFingerprinter:
             self._fingerprint = _request_fingerprint_as_bytes
         elif implementation == "2.7":
             self._fingerprint = fingerprint
+        elif implementation == "2.11":
+            self._fingerprint = _fingerprint_2_11
         else:
             raise ValueError(
                 f"Got an invalid value on setting "
                 f"'REQUEST_FINGERPRINTER_IMPLEMENTATION': "
-                f"{implementation!r}. Valid values are '2.6' (deprecated) "
-                f"and '2.7'."
+                f"{implementation!r}. Valid values are '2.6' (deprecated), "
+                f"'2.7' and '2.11'."
             )
 
     def fingerprint(self, request: Request) -> bytes:
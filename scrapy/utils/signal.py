@@ -18,6 +18,7 @@ from twisted.python.failure import Failure
 from scrapy.exceptions import StopDownload
 from scrapy.utils.defer import maybeDeferred_coro
 from scrapy.utils.log import failure_to_exc_info
+from scrapy.utils.timing import _callable_name
 
 logger = logging.getLogger(__name__)
 
@@ -38,14 +39,26 @@ def send_catch_log(
         else (dont_log,)
     )
     dont_log += (StopDownload,)
+    timer = named.pop("_timer", None)
     spider = named.get("spider", None)
     responses: List[Tuple[TypingAny, TypingAny]] = []
     for receiver in liveReceivers(getAllReceivers(sender, signal)):
         result: TypingAny
         try:
-            response = robustApply(
-                receiver, signal=signal, sender=sender, *arguments, **named
-            )
+            if timer is None:
+                response = robustApply(
+                    receiver, signal=signal, sender=sender, *arguments, **named
+                )
+            else:
+                response = timer.call(
+                    _callable_name(receiver),
+                    robustApply,
+                    receiver,
+                    signal=signal,
+                    sender=sender,
+                    *arguments,
+                    **named,
+                )
             if isinstance(response, Deferred):
                 logger.error(
                     "Cannot return deferreds from signal handler: %(receiver)s",
@@ -90,12 +103,25 @@ def send_catch_log_deferred(
         return failure
 
     dont_log = named.pop("dont_log", None)
+    timer = named.pop("_timer", None)
     spider = named.get("spider", None)
     dfds = []
     for receiver in liveReceivers(getAllReceivers(sender, signal)):
-        d = maybeDeferred_coro(
-            robustApply, receiver, signal=signal, sender=sender, *arguments, **named
-        )
+        if timer is None:
+            d = maybeDeferred_coro(
+                robustApply, receiver, signal=signal, sender=sender, *arguments, **named
+            )
+        else:
+            d = maybeDeferred_coro(
+                timer.call,
+                _callable_name(receiver),
+                robustApply,
+                receiver,
+                signal=signal,
+                sender=sender,
+                *arguments,
+                **named,
+            )
         d.addErrback(logerror, receiver)
         d.addBoth(lambda result: (receiver, result))
         dfds.append(d)
@@ -4,26 +4,70 @@ Module for processing Sitemaps.
 Note: The main purpose of this module is to provide support for the
 SitemapSpider, its API is subject to change without notice.
 """
-from typing import Any, Dict, Generator, Iterator, Optional
+from itertools import chain
+from typing import Any, Dict, Generator, Iterable, Iterator, Optional, Union
 from urllib.parse import urljoin
 
 import lxml.etree
 
+# size of the slices in which a sitemap given as a single str or bytes object
+# is fed to the parser, so that parsed entries can be freed as we go
+_FEED_SIZE = 64 * 1024
+
 
 class Sitemap:
     """Class to parse Sitemap (type=urlset) and Sitemap Index
-    (type=sitemapindex) files"""
+    (type=sitemapindex) files
 
-    def __init__(self, xmltext: str):
-        xmlp = lxml.etree.XMLParser(
-            recover=True, remove_comments=True, resolve_entities=False
-        )
-        self._root = lxml.etree.fromstring(xmltext, parser=xmlp)
+    *xmltext* can be the whole document or an iterable of chunks of it, e.g.
+    the output of :func:`scrapy.utils.gz.gunzip_chunks`. The document is
+    parsed incrementally while iterating, and every entry is discarded once
+    it has been yielded, so memory usage does not grow with the number of
+    entries. As a consequence, a Sitemap object can only be iterated once.
+    """
+
+    def __init__(self, xmltext: Union[str, bytes, Iterable[bytes]]):
+        elements = self._iter_elements(xmltext)
+        first = next(elements, None)
+        if first is None:
+            raise lxml.etree.XMLSyntaxError(
+                "Document is empty", None, 1, 1, None  # type: ignore[arg-type]
+            )
+        self._root = first.getroottree().getroot()
+        self._elements = chain((first,), elements)
         rt = self._root.tag
         self.type = self._root.tag.split("}", 1)[1] if "}" in rt else rt
 
+    @staticmethod
+    def _iter_elements(xmltext: Union[str, bytes, Iterable[bytes]]) -> Iterator[Any]:
+        """Yield every element of the document as soon as it is complete"""
+        if isinstance(xmltext, (str, bytes)):
+            chunks: Iterable[Any] = (
+                xmltext[i : i + _FEED_SIZE] for i in range(0, len(xmltext), _FEED_SIZE)
+            )
+        else:
+            chunks = xmltext
+        parser = lxml.etree.XMLPullParser(
+            events=("end",),
+            recover=True,
+            remove_comments=True,
+            resolve_entities=False,
+        )
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                yield elem
+        parser.close()
+        for _, elem in parser.read_events():
+            yield elem
+
     def __iter__(self) -> Iterator[Dict[str, Any]]:
-        for elem in self._root.getchildren():
+        root = self._root
+        for elem in self._elements:
+            if elem.getparent() is not root:
+                continue
+
+            # elem is a complete child of the root element
             d: Dict[str, Any] = {}
             for el in elem.getchildren():
                 tag = el.tag
@@ -35,6 +79,10 @@ class Sitemap:
                 else:
                     d[name] = el.text.strip() if el.text else ""
 
+            elem.clear()
+            while elem.getprevious() is not None:
+                del root[0]
+
             if "loc" in d:
                 yield d
 
@@ -0,0 +1,152 @@
+"""Timing of middleware, item pipeline and signal handler calls
+
+See documentation in docs/topics/settings.rst (COMPONENT_TIMING_ENABLED)
+"""
+from __future__ import annotations
+
+import logging
+from bisect import bisect
+from functools import wraps
+from inspect import isasyncgenfunction, isgenerator
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Iterator, List, Tuple
+
+from scrapy import signals
+
+if TYPE_CHECKING:
+    # typing.Self requires Python 3.11
+    from typing_extensions import Self
+
+    from scrapy import Spider
+    from scrapy.crawler import Crawler
+
+
+logger = logging.getLogger(__name__)
+
+_BUCKET_LIMITS = (0.001, 0.01, 0.1, 1.0)
+_BUCKET_NAMES = ("under_1ms", "under_10ms", "under_100ms", "under_1s", "over_1s")
+
+
+def _callable_name(func: Any) -> str:
+    func = getattr(func, "__wrapped__", func)
+    qualname = getattr(func, "__qualname__", None) or type(func).__qualname__
+    module = getattr(func, "__module__", None) or type(func).__module__
+    return f"{module}.{qualname}"
+
+
+class ComponentTimer:
+    """Records how long calls to components take, into the stats collector.
+
+    For each timed component method, the ``timing/<name>/count``,
+    ``timing/<name>/time`` (seconds) and ``timing/<name>/max_time`` stats are
+    kept, together with a histogram of call times in
+    ``timing/<name>/under_1ms`` and similar stats.
+
+    Times are exclusive: when a timed call runs another one, e.g. a signal
+    handler sent from a middleware, the inner call only counts for the inner
+    component. When a method returns a generator, the time spent producing
+    its items counts as part of the call. Time spent waiting for Deferreds,
+    coroutines and asynchronous generators is not recorded, only the time
+    spent until they are returned.
+    """
+
+    def __init__(self, crawler: Crawler):
+        self.stats = crawler.stats
+        # time spent in nested timed calls, for each call being timed
+        self._nested: List[float] = []
+        self._keys: Dict[str, Tuple[str, str, str, Tuple[str, ...]]] = {}
+        crawler.signals.connect(self.spider_closed, signal=signals.spider_closed)
+
+    @classmethod
+    def from_crawler(cls, crawler: Crawler) -> Self:
+        return cls(crawler)
+
+    def wrap(self, func: Callable) -> Callable:
+        """Return a function that calls *func* and records its timing."""
+        if isasyncgenfunction(func):
+            # the wrapper would not be an async generator function anymore
+            return func
+        name = _callable_name(func)
+
+        @wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            return self.call(name, func, *args, **kwargs)
+
+        return timed
+
+    def call(self, name: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Call *func* and record its timing as *name*."""
+        self._nested.append(0.0)
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            self._record(name, self._stop(start))
+            raise
+        elapsed = self._stop(start)
+        if isgenerator(result):
+            return self._iterate(name, result, elapsed)
+        self._record(name, elapsed)
+        return result
+
+    def _stop(self, start: float) -> float:
+        elapsed = perf_counter() - start
+        nested = self._nested.pop()
+        if self._nested:
+            self._nested[-1] += elapsed
+        return elapsed - nested
+
+    def _iterate(
+        self, name: str, iterator: Iterator, elapsed: float
+    ) -> Generator[Any, None, None]:
+        try:
+            while True:
+                self._nested.append(0.0)
+                start = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += self._stop(start)
+                yield item
+        finally:
+            self._record(name, elapsed)
+
+    def _record(self, name: str, elapsed: float) -> None:
+        try:
+            count_key, time_key, max_key, bucket_keys = self._keys[name]
+        except KeyError:
+            prefix = f"timing/{name}"
+            count_key, time_key, max_key, bucket_keys = self._keys[name] = (
+                f"{prefix}/count",
+                f"{prefix}/time",
+                f"{prefix}/max_time",
+                tuple(f"{prefix}/{bucket}" for bucket in _BUCKET_NAMES),
+            )
+        self.stats.inc_value(count_key)
+        self.stats.inc_value(time_key, elapsed, start=0.0)
+        self.stats.max_value(max_key, elapsed)
+        self.stats.inc_value(bucket_keys[bisect(_BUCKET_LIMITS, elapsed)])
+
+    def spider_closed(self, spider: Spider) -> None:
+        rows = []
+        for name, (count_key, time_key, max_key, _) in self._keys.items():
+            count = self.stats.get_value(count_key, 0)
+            total = self.stats.get_value(time_key, 0.0)
+            rows.append((total, count, self.stats.get_value(max_key, 0.0), name))
+        if not rows:
+            return
+        rows.sort(reverse=True)
+        lines = [f"{'time (ms)':>12} {'calls':>9} {'mean (ms)':>10} {'max (ms)':>10}"]
+        for total, count, max_time, name in rows:
+            mean = total / count * 1000 if count else 0.0
+            lines.append(
+                f"{total * 1000:12.3f} {count:9d} {mean:10.3f} {max_time * 1000:10.3f}"
+                f"  {name}"
+            )
+        logger.info(
+            "Component timing:\n%(table)s",
+            {"table": "\n".join(lines)},
+            extra={"spider": spider},
+        )
@@ -7,12 +7,16 @@ subclass from object_ref (instead of object).
 About performance: This library has a minimal performance impact when enabled,
 and no performance penalty at all when disabled (as object_ref becomes just an
 alias to object in that case).
+
+Keeping a weak reference and a timestamp for every live object can be too much
+when millions of objects are alive (e.g. requests in the scheduler of a broad
+crawl). Use track_instances(False) to only count live objects instead.
 """
 
 from collections import defaultdict
 from operator import itemgetter
 from time import time
-from typing import TYPE_CHECKING, Any, DefaultDict, Iterable
+from typing import TYPE_CHECKING, Any, DefaultDict, Iterable, Tuple
 from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
@@ -22,6 +26,8 @@ if TYPE_CHECKING:
 
 NoneType = type(None)
 live_refs: DefaultDict[type, WeakKeyDictionary] = defaultdict(WeakKeyDictionary)
+live_counts: DefaultDict[type, int] = defaultdict(int)
+_track_instances: bool = True
 
 
 class object_ref:
@@ -31,22 +37,60 @@ class object_ref:
 
     def __new__(cls, *args: Any, **kwargs: Any) -> "Self":
         obj = object.__new__(cls)
-        live_refs[cls][obj] = time()
+        if _track_instances:
+            live_refs[cls][obj] = time()
+        else:
+            live_counts[cls] += 1
         return obj
 
 
+def _forget(obj: object_ref) -> None:
+    live_counts[type(obj)] -= 1
+
+
+def track_instances(enabled: bool = True) -> None:
+    """Choose between keeping a record of every live instance (the default)
+    or only counting live instances per class.
+
+    Counting has no per-instance memory overhead, but :func:`get_oldest` and
+    :func:`iter_all` cannot find any object and the age of the oldest object
+    of each class is not reported.
+    """
+    global _track_instances
+    if enabled == _track_instances:
+        return
+    _track_instances = enabled
+    if enabled:
+        del object_ref.__del__  # type: ignore[attr-defined]
+        live_counts.clear()
+    else:
+        for cls, wdict in live_refs.items():
+            live_counts[cls] += len(wdict)
+        live_refs.clear()
+        object_ref.__del__ = _forget  # type: ignore[attr-defined]
+
+
+def _iter_live_counts() -> Iterable[Tuple[type, int]]:
+    if _track_instances:
+        return ((cls, len(wdict)) for cls, wdict in live_refs.items())
+    return iter(live_counts.items())
+
+
 # using Any as it's hard to type type(None)
 def format_live_refs(ignore: Any = NoneType) -> str:
     """Return a tabular representation of tracked objects"""
     s = "Live References\n\n"
     now = time()
-    for cls, wdict in sorted(live_refs.items(), key=lambda x: x[0].__name__):
-        if not wdict:
+    for cls, count in sorted(_iter_live_counts(), key=lambda x: x[0].__name__):
+        if not count:
             continue
         if issubclass(cls, ignore):
             continue
-        oldest = min(wdict.values())
-        s += f"{cls.__name__:<30} {len(wdict):6}   oldest: {int(now - oldest)}s ago\n"
+        s += f"{cls.__name__:<30} {count:6}"
+        if _track_instances:
+            oldest = min(live_refs[cls].values())
+            s += f"   oldest: {int(now - oldest)}s ago"
+        s += "\n"
     return s
 
 
@@ -6,7 +6,8 @@ Some of the functions that used to be imported from this module have been moved
 to the w3lib.url module. Always import those from there instead.
 """
 import re
-from typing import TYPE_CHECKING, Iterable, Optional, Type, Union, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Container, Iterable, Optional, Type, Union, cast
 from urllib.parse import ParseResult, urldefrag, urlparse, urlunparse
 
 # scrapy.utils.url was moved to w3lib.url and import * ensures this
@@ -23,13 +24,36 @@ if TYPE_CHECKING:
 UrlT = Union[str, bytes, ParseResult]
 
 
+@lru_cache(maxsize=10000)
+def _canonicalize_url(url: str, keep_fragments: bool = False) -> str:
+    # The same URLs are canonicalized over and over in most crawls: links to
+    # the same pages are found in many responses, deduplicated by link
+    # extractors and then fingerprinted for the dupefilter. canonicalize_url()
+    # is by far the most expensive part of both.
+    return canonicalize_url(url, keep_fragments=keep_fragments)
+
+
+def _host_is_from_any_domain(host: str, domains: Container[str]) -> bool:
+    """Return True if the host is any of the given domains or a subdomain of
+    any of them
+
+    Domains are looked up once per label of the host, so with a set of
+    domains the cost does not depend on how many domains there are.
+    """
+    while True:
+        if host in domains:
+            return True
+        _, dot, host = host.partition(".")
+        if not dot:
+            return False
+
+
 def url_is_from_any_domain(url: UrlT, domains: Iterable[str]) -> bool:
     """Return True if the url belongs to any of the given domains"""
     host = parse_url(url).netloc.lower()
     if not host:
         return False
-    domains = [d.lower() for d in domains]
-    return any((host == d) or (host.endswith(f".{d}")) for d in domains)
+    return _host_is_from_any_domain(host, {d.lower() for d in domains})
 
 
 def url_is_from_spider(url: UrlT, spider: Type["Spider"]) -> bool:
@@ -41,8 +65,7 @@ def url_is_from_spider(url: UrlT, spider: Type["Spider"]) -> bool:
 
 def url_has_any_extension(url: UrlT, extensions: Iterable[str]) -> bool:
     """Return True if the url ends with one of the extensions provided"""
-    lowercase_path = parse_url(url).path.lower()
-    return any(lowercase_path.endswith(ext) for ext in extensions)
+    return parse_url(url).path.lower().endswith(tuple(extensions))
 
 
 def parse_url(url: UrlT, encoding: Optional[str] = None) -> ParseResult:
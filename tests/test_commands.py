@@ -4,6 +4,7 @@ import json
 import os
 import platform
 import re
+import socket
 import subprocess
 import sys
 import tempfile
@@ -1015,6 +1016,19 @@ class BenchCommandTest(CommandTest):
         self.assertNotIn("Unhandled Error", log)
 
 
+class FrontierCommandTest(CommandTest):
+    def test_listen_error(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            sock.listen()
+            port = sock.getsockname()[1]
+            p, _, log = self.proc(
+                "frontier", "--listen", f"tcp:port={port}:interface=127.0.0.1"
+            )
+        self.assertEqual(p.returncode, 1)
+        self.assertIn("Could not listen on", log)
+
+
 class ViewCommandTest(CommandTest):
     def test_methods(self):
         command = view.Command()
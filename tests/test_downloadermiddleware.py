@@ -2,7 +2,7 @@ import asyncio
 from unittest import mock
 
 from pytest import mark
-from twisted.internet import defer
+from twisted.internet import defer, reactor
 from twisted.internet.defer import Deferred
 from twisted.python.failure import Failure
 from twisted.trial.unittest import TestCase
@@ -149,6 +149,7 @@ class ProcessRequestInvalidOutput(ManagerTestCase):
         dfd = self.mwman.download(download_func, req, self.spider)
         results = []
         dfd.addBoth(results.append)
+        self._wait(dfd)
         self.assertIsInstance(results[0], Failure)
         self.assertIsInstance(results[0].value, _InvalidOutput)
 
@@ -168,6 +169,7 @@ class ProcessResponseInvalidOutput(ManagerTestCase):
         dfd = self.mwman.download(download_func, req, self.spider)
         results = []
         dfd.addBoth(results.append)
+        self._wait(dfd)
         self.assertIsInstance(results[0], Failure)
         self.assertIsInstance(results[0].value, _InvalidOutput)
 
@@ -190,6 +192,7 @@ class ProcessExceptionInvalidOutput(ManagerTestCase):
         dfd = self.mwman.download(download_func, req, self.spider)
         results = []
         dfd.addBoth(results.append)
+        self._wait(dfd)
         self.assertIsInstance(results[0], Failure)
         self.assertIsInstance(results[0].value, _InvalidOutput)
 
@@ -222,6 +225,65 @@ class MiddlewareUsingDeferreds(ManagerTestCase):
         self.assertFalse(download_func.called)
 
 
+class SynchronousChainTest(ManagerTestCase):
+    def test_synchronous_chain_fires_immediately(self):
+        req = Request("http://example.com/index.html")
+        resp = Response(req.url)
+        dfd = self.mwman.download(lambda **kwargs: resp, req, self.spider)
+        results = []
+        dfd.addBoth(results.append)
+        self.assertIs(results[0], resp)
+        self.assertIsNone(
+            self.crawler.stats.get_value("downloader/middleware_resumed_count")
+        )
+
+    def test_resume_after_deferred(self):
+        calls = []
+        resp = Response("http://example.com/index.html")
+
+        class DeferredMiddleware:
+            def process_request(self, request, spider):
+                calls.append("deferred")
+                d = Deferred()
+                reactor.callLater(0, d.callback, None)
+                return d
+
+            def process_response(self, request, response, spider):
+                calls.append("deferred response")
+                return defer.succeed(response)
+
+        class LaterMiddleware:
+            def process_request(self, request, spider):
+                calls.append("later")
+
+            def process_response(self, request, response, spider):
+                calls.append("later response")
+                return response
+
+        self.mwman._add_middleware(DeferredMiddleware())
+        self.mwman._add_middleware(LaterMiddleware())
+        req = Request("http://example.com/index.html")
+
+        def download_func(**kwargs):
+            calls.append("download")
+            return resp
+
+        dfd = self.mwman.download(download_func, req, self.spider)
+        results = []
+        dfd.addBoth(results.append)
+        self.assertEqual(calls, ["deferred"])
+        self._wait(dfd)
+
+        self.assertIs(results[0], resp)
+        self.assertEqual(
+            calls,
+            ["deferred", "later", "download", "later response", "deferred response"],
+        )
+        self.assertEqual(
+            self.crawler.stats.get_value("downloader/middleware_resumed_count"), 2
+        )
+
+
 @mark.usefixtures("reactor_pytest")
 class MiddlewareUsingCoro(ManagerTestCase):
     """Middlewares using asyncio coroutines should work"""
@@ -265,3 +327,34 @@ class MiddlewareUsingCoro(ManagerTestCase):
 
         self.assertIs(results[0], resp)
         self.assertFalse(download_func.called)
+
+    @mark.only_asyncio()
+    def test_asyncdef_mixed_chain_asyncio(self):
+        resp = Response("http://example.com/index.html")
+        resp2 = Response("http://example.com/other.html")
+
+        class CoroRequestMiddleware:
+            async def process_request(self, request, spider):
+                await asyncio.sleep(0.01)
+                raise ValueError
+
+            async def process_response(self, request, response, spider):
+                await asyncio.sleep(0.01)
+                return resp2
+
+        class LegacyExceptionMiddleware:
+            def process_exception(self, request, exception, spider):
+                assert isinstance(exception, ValueError)
+                return defer.succeed(resp)
+
+        self.mwman._add_middleware(LegacyExceptionMiddleware())
+        self.mwman._add_middleware(CoroRequestMiddleware())
+        req = Request("http://example.com/index.html")
+        download_func = mock.MagicMock()
+        dfd = self.mwman.download(download_func, req, self.spider)
+        results = []
+        dfd.addBoth(results.append)
+        self._wait(dfd)
+
+        self.assertIs(results[0], resp2)
+        self.assertFalse(download_func.called)
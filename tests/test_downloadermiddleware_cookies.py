@@ -1,4 +1,5 @@
 import logging
+from pathlib import Path
 from unittest import TestCase
 
 import pytest
@@ -312,6 +313,54 @@ class CookiesMiddlewareTest(TestCase):
         assert self.mw.process_request(req6, self.spider) is None
         self.assertEqual(req6.headers.get("Cookie"), None)
 
+    def test_max_jars_in_memory(self):
+        crawler = get_crawler(settings_dict={"COOKIES_MAX_JARS_IN_MEMORY": 2})
+        mw = CookiesMiddleware.from_crawler(crawler)
+        for i in range(5):
+            req = Request("http://scrapytest.org/", meta={"cookiejar": i})
+            assert mw.process_request(req, self.spider) is None
+            headers = {"Set-Cookie": f"C{i}=value{i}; path=/"}
+            res = Response("http://scrapytest.org/", headers=headers, request=req)
+            assert mw.process_response(req, res, self.spider) is res
+        self.assertEqual(len(mw.jars), 5)
+        self.assertEqual(len(mw.jars._jars), 2)
+        self.assertEqual(sorted(mw.jars), [0, 1, 2, 3, 4])
+
+        for i in range(5):
+            req = Request("http://scrapytest.org/", meta={"cookiejar": i})
+            assert mw.process_request(req, self.spider) is None
+            self.assertEqual(req.headers.get("Cookie"), f"C{i}=value{i}".encode())
+        self.assertEqual(len(mw.jars), 5)
+        self.assertEqual(len(mw.jars._jars), 2)
+        mw.jars.close()
+
+    def test_max_jars_in_memory_file_size(self):
+        crawler = get_crawler(settings_dict={"COOKIES_MAX_JARS_IN_MEMORY": 1})
+        mw = CookiesMiddleware.from_crawler(crawler)
+        self.addCleanup(mw.jars.close)
+        mw.jars.compact_threshold = 0
+
+        def db_size():
+            tmpdir = Path(mw.jars._tmpdir.name)
+            return sum(path.stat().st_size for path in tmpdir.iterdir())
+
+        for i in range(1000):
+            req = Request("http://scrapytest.org/", meta={"cookiejar": i % 3})
+            assert mw.process_request(req, self.spider) is None
+            if i < 3:
+                headers = {"Set-Cookie": f"C{i}={'x' * 100}; path=/"}
+                res = Response("http://scrapytest.org/", headers=headers, request=req)
+                assert mw.process_response(req, res, self.spider) is res
+            if i == 99:
+                size = db_size()
+        # each jar reuses its dbm key, and stale records are dropped
+        self.assertLessEqual(len(mw.jars._db_keys), 3)
+        self.assertLessEqual(db_size(), size * 2)
+        for i in range(3):
+            req = Request("http://scrapytest.org/", meta={"cookiejar": i})
+            assert mw.process_request(req, self.spider) is None
+            self.assertEqual(req.headers.get("Cookie"), f"C{i}={'x' * 100}".encode())
+
     def test_local_domain(self):
         request = Request("http://example-host/", cookies={"currencyCookie": "USD"})
         assert self.mw.process_request(request, self.spider) is None
@@ -0,0 +1,91 @@
+import codecs
+import unittest
+
+from scrapy.downloadermiddlewares.encodinghints import EncodingHintsMiddleware
+from scrapy.exceptions import NotConfigured
+from scrapy.http import HtmlResponse, Request, Response, TextResponse
+from scrapy.spiders import Spider
+from scrapy.utils.test import get_crawler
+
+BODY = "текст".encode("cp1251")
+
+
+class EncodingHintsMiddlewareTest(unittest.TestCase):
+    def setUp(self):
+        crawler = get_crawler(Spider, {"ENCODING_HINTS_ENABLED": True})
+        self.spider = crawler._create_spider("foo")
+        self.mw = EncodingHintsMiddleware.from_crawler(crawler)
+
+    def _process(self, url, response_class=TextResponse, **kwargs):
+        request = Request(url)
+        response = response_class(url, **kwargs)
+        return self.mw.process_response(request, response, self.spider)
+
+    def _learn(self, url="http://a.example/"):
+        self._process(url, headers={"Content-Type": "text/html; charset=windows-1251"})
+
+    def test_disabled(self):
+        crawler = get_crawler(Spider)
+        with self.assertRaises(NotConfigured):
+            EncodingHintsMiddleware.from_crawler(crawler)
+
+    def test_hint_from_headers(self):
+        response = self._process("http://a.example/1", body=BODY)
+        self.assertIsNone(response.encoding_hint)
+        self.assertEqual(response.encoding, "cp1252")
+
+        self._learn()
+        response = self._process("http://a.example/2", body=BODY)
+        self.assertEqual(response.encoding_hint, "cp1251")
+        self.assertEqual(response.encoding, "cp1251")
+        self.assertEqual(response.text, "текст")
+
+        # other hosts are not affected
+        response = self._process("http://b.example/", body=BODY)
+        self.assertIsNone(response.encoding_hint)
+
+    def test_hint_from_body(self):
+        self._process(
+            "http://a.example/1",
+            response_class=HtmlResponse,
+            body=b'<html><head><meta charset="koi8-r"></head></html>',
+        )
+        response = self._process("http://a.example/2", body=BODY)
+        self.assertEqual(response.encoding_hint, "koi8-r")
+
+    def test_hint_updated(self):
+        self._learn()
+        self._process(
+            "http://a.example/1", headers={"Content-Type": "text/html; charset=utf-8"}
+        )
+        response = self._process("http://a.example/2", body=BODY)
+        self.assertEqual(response.encoding_hint, "utf-8")
+        self.assertEqual(response.encoding, "cp1252")
+
+    def test_not_hinted(self):
+        self._learn()
+        binary = Response("http://a.example/", body=BODY)
+        self.assertIs(
+            self.mw.process_response(Request(binary.url), binary, self.spider),
+            binary,
+        )
+        for kwargs in (
+            {"encoding": "cp1252"},
+            {"encoding_hint": "koi8-r"},
+            {"body": codecs.BOM_UTF8 + b"text"},
+        ):
+            request = Request("http://a.example/")
+            response = TextResponse(request.url, **kwargs)
+            self.assertIs(
+                self.mw.process_response(request, response, self.spider), response
+            )
+
+    def test_max_hosts(self):
+        crawler = get_crawler(
+            Spider, {"ENCODING_HINTS_ENABLED": True, "ENCODING_HINTS_MAX_HOSTS": 1}
+        )
+        self.mw = EncodingHintsMiddleware.from_crawler(crawler)
+        self._learn("http://a.example/")
+        self._learn("http://b.example/")
+        self.assertIsNone(self._process("http://a.example/").encoding_hint)
+        self.assertEqual(self._process("http://b.example/").encoding_hint, "cp1251")
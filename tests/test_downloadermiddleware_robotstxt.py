@@ -1,11 +1,15 @@
+import os
+import time
+from shutil import rmtree
+from tempfile import mkdtemp
 from unittest import mock
 
-from twisted.internet import error, reactor
+from twisted.internet import defer, error, reactor
 from twisted.internet.defer import Deferred, DeferredList, maybeDeferred
 from twisted.python import failure
 from twisted.trial import unittest
 
-from scrapy.downloadermiddlewares.robotstxt import RobotsTxtMiddleware
+from scrapy.downloadermiddlewares.robotstxt import RobotsTxtCache, RobotsTxtMiddleware
 from scrapy.downloadermiddlewares.robotstxt import logger as mw_module_logger
 from scrapy.exceptions import IgnoreRequest, NotConfigured
 from scrapy.http import Request, Response, TextResponse
@@ -228,6 +232,108 @@ Disallow: /some/randome/page.html
             Deferred,
         )
 
+    @defer.inlineCallbacks
+    def test_robotstxt_cache(self):
+        crawler = self._get_successful_crawler()
+        crawler.settings.set("ROBOTSTXT_CACHE_ENABLED", True)
+        yield self.assertIgnored(
+            Request("http://site.local/admin/main"), RobotsTxtMiddleware(crawler)
+        )
+        # the memory cache is not shared by other crawlers
+        yield self.assertIgnored(
+            Request("http://site.local/admin/main"), RobotsTxtMiddleware(crawler)
+        )
+        self.assertEqual(crawler.engine.download.call_count, 2)
+
+        # the disk cache is, and also reused by later processes
+        cachedir = mkdtemp()
+        self.addCleanup(rmtree, cachedir)
+        crawler.settings.set("ROBOTSTXT_CACHE_DIR", cachedir)
+        yield self.assertIgnored(
+            Request("http://site.local/admin/main"), RobotsTxtMiddleware(crawler)
+        )
+        yield self.assertIgnored(
+            Request("http://site.local/admin/main"), RobotsTxtMiddleware(crawler)
+        )
+        self.assertEqual(crawler.engine.download.call_count, 3)
+
+    def test_robotstxt_cache_size(self):
+        caches = [
+            RobotsTxtCache(Settings({"ROBOTSTXT_CACHE_SIZE": size})) for size in (1, 2)
+        ]
+        self.assertIsNot(caches[0].memory, caches[1].memory)
+        self.assertEqual([cache.memory.limit for cache in caches], [1, 2])
+
+    def test_robotstxt_cache_expiration(self):
+        settings = Settings({"ROBOTSTXT_CACHE_EXPIRATION_SECS": 60})
+        cache = RobotsTxtCache(settings)
+        for headers, expiration_secs in [
+            ({}, 60),
+            ({"Cache-Control": "public, max-age=3600"}, 3600),
+            ({"Cache-Control": "max-age=0"}, 0),
+            ({"Cache-Control": "no-store"}, 0),
+        ]:
+            response = Response("http://site.local/robots.txt", headers=headers)
+            self.assertEqual(cache._expiration_secs(response), expiration_secs)
+        response = Response("http://site.local/robots.txt", status=503)
+        self.assertEqual(cache._expiration_secs(response), 0)
+
+        cache.memory["site.local"] = (b"", time.time() - 1)
+        self.assertIsNone(cache.get("site.local"))
+        self.assertNotIn("site.local", cache.memory)
+
+    def test_robotstxt_cache_files(self):
+        cachedir = mkdtemp()
+        self.addCleanup(rmtree, cachedir)
+        settings = Settings({"ROBOTSTXT_CACHE_DIR": cachedir})
+        cache = RobotsTxtCache(settings)
+        response = Response("http://site.local/robots.txt", body=b"User-agent: *")
+        cache.store("site.local", response)
+        cache.store("expired.local", response)
+        path = cache._get_path("site.local")
+        expired_path = cache._get_path("expired.local")
+        self.assertEqual(list(path.parent.glob("*.tmp")), [])
+        self.assertGreater(path.stat().st_mtime, time.time())
+
+        # corrupt files are cache misses, and are removed
+        cache.memory.clear()
+        path.write_bytes(path.read_bytes()[:10])
+        with self.assertLogs(mw_module_logger, "WARNING"):
+            self.assertIsNone(cache.get("site.local"))
+        self.assertFalse(path.exists())
+
+        # expired files are removed when the cache is created
+        os.utime(expired_path, (time.time(), time.time() - 1))
+        RobotsTxtCache(settings)
+        self.assertFalse(expired_path.exists())
+
+    def test_robotstxt_parsers_unbounded(self):
+        crawler = self._get_emptybody_crawler()
+        crawler.settings.set("ROBOTSTXT_CACHE_SIZE", 2)
+        crawler.settings.set("ROBOTSTXT_CACHE_ENABLED", True)
+        middleware = RobotsTxtMiddleware(crawler)
+        self.assertIsNone(middleware._parsers.limit)
+
+    def test_robotstxt_parsers_limit(self):
+        cachedir = mkdtemp()
+        self.addCleanup(rmtree, cachedir)
+        crawler = self._get_emptybody_crawler()
+        crawler.settings.set("ROBOTSTXT_CACHE_SIZE", 2)
+        crawler.settings.set("ROBOTSTXT_CACHE_ENABLED", True)
+        crawler.settings.set("ROBOTSTXT_CACHE_DIR", cachedir)
+        middleware = RobotsTxtMiddleware(crawler)
+        dfds = [
+            self.assertNotIgnored(Request(f"http://site{i}.local"), middleware)
+            for i in range(3)
+        ]
+        dfd = DeferredList(dfds, fireOnOneErrback=True)
+        dfd.addCallback(
+            lambda _: self.assertEqual(
+                list(middleware._parsers), ["site1.local", "site2.local"]
+            )
+        )
+        return dfd
+
     def assertNotIgnored(self, request, middleware):
         spider = None  # not actually used
         dfd = maybeDeferred(middleware.process_request, request, spider)
@@ -435,6 +435,26 @@ class EngineTest(unittest.TestCase):
         finally:
             yield e.stop()
 
+    @defer.inlineCallbacks
+    def test_start_requests_batch_size(self):
+        crawler = get_crawler(TestSpider, {"START_REQUESTS_BATCH_SIZE": 2})
+        e = ExecutionEngine(crawler, lambda _: None)
+        start_requests = iter(
+            [Request(f"http://example.com/{i}", dont_filter=True) for i in range(5)]
+        )
+        yield e.open_spider(TestSpider(), start_requests, close_if_idle=False)
+        e.running = True
+        try:
+            self.assertEqual(e._next_start_requests(), 2)
+            self.assertEqual(len(e.slot.scheduler), 2)
+            self.assertEqual(e._next_start_requests(), 2)
+            self.assertEqual(e._next_start_requests(), 1)
+            self.assertIsNone(e.slot.start_requests)
+            self.assertEqual(len(e.slot.scheduler), 5)
+        finally:
+            e.running = False
+            yield e.close_spider(e.spider)
+
     def test_short_timeout(self):
         args = (
             sys.executable,
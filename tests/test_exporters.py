@@ -10,6 +10,7 @@ from io import BytesIO
 
 import lxml.etree
 from itemadapter import ItemAdapter
+from testfixtures import LogCapture
 
 from scrapy.exporters import (
     BaseItemExporter,
@@ -17,6 +18,7 @@ from scrapy.exporters import (
     JsonItemExporter,
     JsonLinesItemExporter,
     MarshalItemExporter,
+    ParquetItemExporter,
     PickleItemExporter,
     PprintItemExporter,
     PythonItemExporter,
@@ -25,6 +27,12 @@ from scrapy.exporters import (
 from scrapy.item import Field, Item
 from scrapy.utils.python import to_unicode
 
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 
 def custom_serializer(value):
     return str(int(value) + 2)
@@ -133,6 +141,30 @@ class BaseItemExporterTest(unittest.TestCase):
             ie.serialize_field(a.get_field_meta("age"), "age", a["age"]), "24"
         )
 
+    def test_serialized_fields_of_mixed_items(self):
+        ie = self._get_exporter()
+        items = [
+            self.i,
+            self.custom_field_item_class(name="John\xa3", age="22"),
+            {"name": "John\xa3", "age": "22"},
+            self.custom_field_item_class(name="Paul", age="30"),
+        ]
+        self.assertEqual(
+            [dict(ie._get_serialized_fields(item)) for item in items],
+            [
+                {"name": "John\xa3", "age": "22"},
+                {"name": "John\xa3", "age": "24"},
+                {"name": "John\xa3", "age": "22"},
+                {"name": "Paul", "age": "32"},
+            ],
+        )
+
+        ie = self._get_exporter(fields_to_export={"age": "edad"})
+        self.assertEqual(
+            [dict(ie._get_serialized_fields(item)) for item in items],
+            [{"edad": "22"}, {"edad": "24"}, {"edad": "22"}, {"edad": "32"}],
+        )
+
 
 class BaseItemExporterDataclassTest(BaseItemExporterTest):
     item_class = TestDataClass
@@ -641,6 +673,34 @@ class JsonItemExporterTest(JsonLinesItemExporterTest):
         self.assertEqual(exported, [item])
 
 
+class JsonItemExporterBufferTest(unittest.TestCase):
+    exporter_class = JsonItemExporter
+
+    def test_buffer(self):
+        output = BytesIO()
+        ie = self.exporter_class(output, buffer_size=50)
+        ie.start_exporting()
+        ie.export_item({"name": "John"})
+        self.assertEqual(output.getvalue(), b"")
+        for _ in range(3):
+            ie.export_item({"name": "John"})
+        self.assertNotEqual(output.getvalue(), b"")
+        ie.finish_exporting()
+        self.assertEqual(output.getvalue().count(b'{"name": "John"}'), 4)
+
+    def test_no_buffer(self):
+        for kwargs in ({}, {"buffer_size": 0}):
+            output = BytesIO()
+            ie = self.exporter_class(output, **kwargs)
+            ie.start_exporting()
+            ie.export_item({"name": "John"})
+            self.assertIn(b'{"name": "John"}', output.getvalue())
+
+
+class JsonLinesItemExporterBufferTest(JsonItemExporterBufferTest):
+    exporter_class = JsonLinesItemExporter
+
+
 class JsonItemExporterToBytesTest(BaseItemExporterTest):
     def _get_exporter(self, **kwargs):
         kwargs["encoding"] = "latin"
@@ -664,6 +724,131 @@ class JsonItemExporterDataclassTest(JsonItemExporterTest):
     custom_field_item_class = CustomFieldDataclass
 
 
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class ParquetItemExporterTest(BaseItemExporterTest):
+    def _get_exporter(self, **kwargs):
+        return ParquetItemExporter(self.output, **kwargs)
+
+    def _read_output(self):
+        return pyarrow.parquet.ParquetFile(BytesIO(self.output.getvalue()))
+
+    def _check_output(self):
+        exported = self._read_output().read().to_pylist()
+        self.assertEqual(exported, [ItemAdapter(self.i).asdict()])
+
+    def _export(self, *items, **kwargs):
+        ie = self._get_exporter(**kwargs)
+        ie.start_exporting()
+        for item in items:
+            ie.export_item(item)
+        ie.finish_exporting()
+        return self._read_output()
+
+    def test_row_groups(self):
+        items = [{"name": f"John{i}", "age": i} for i in range(5)]
+        parquet_file = self._export(*items, row_group_size=2)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        self.assertEqual(parquet_file.read().to_pylist(), items)
+
+    def test_nonstring_types_item(self):
+        item = self._get_nonstring_types_item()
+        parquet_file = self._export(item)
+        self.assertEqual(parquet_file.read().to_pylist(), [item])
+        schema = parquet_file.schema_arrow
+        self.assertEqual(schema.field("boolean").type, pyarrow.bool_())
+        self.assertEqual(schema.field("number").type, pyarrow.int64())
+        self.assertEqual(schema.field("float").type, pyarrow.float64())
+
+    def test_nested_item(self):
+        i1 = self.item_class(name="Joseph", age="22")
+        i2 = dict(name="Maria", age=[i1])
+        parquet_file = self._export(i2)
+        self.assertEqual(
+            parquet_file.read().to_pylist(),
+            [{"name": "Maria", "age": [{"name": "Joseph", "age": "22"}]}],
+        )
+
+    def test_missing_fields(self):
+        items = [{"name": "John"}, {"age": 22}]
+        parquet_file = self._export(*items)
+        self.assertEqual(
+            parquet_file.read().to_pylist(),
+            [{"name": "John", "age": None}, {"name": None, "age": 22}],
+        )
+
+    def test_fields_to_export_order(self):
+        items = [{"age": 22}, {"name": "John", "age": 23}]
+        parquet_file = self._export(*items, fields_to_export=["name", "age"])
+        self.assertEqual(parquet_file.schema_arrow.names, ["name", "age"])
+
+    def test_field_arrow_type(self):
+        class TypedItem(Item):
+            name = Field()
+            age = Field(arrow_type=pyarrow.int16())
+
+        parquet_file = self._export(TypedItem(name="John", age=22))
+        self.assertEqual(parquet_file.schema_arrow.field("age").type, pyarrow.int16())
+
+    def test_schema(self):
+        schema = pyarrow.schema([("age", pyarrow.large_string())])
+        parquet_file = self._export(self.i, schema=schema)
+        self.assertEqual(parquet_file.schema_arrow, schema)
+        self.assertEqual(parquet_file.read().to_pylist(), [{"age": "22"}])
+
+    def test_new_fields_after_first_row_group(self):
+        items = [{"name": "John"}, {"name": "Paul", "age": 22}]
+        parquet_file = self._export(*items, row_group_size=1)
+        self.assertEqual(
+            parquet_file.read().to_pylist(), [{"name": "John"}, {"name": "Paul"}]
+        )
+
+    def test_empty(self):
+        parquet_file = self._export()
+        self.assertEqual(parquet_file.metadata.num_rows, 0)
+
+    def test_type_drift(self):
+        items = [{"a": None}, {"a": None}, {"a": 1}]
+        parquet_file = self._export(*items, row_group_size=2)
+        self.assertEqual(parquet_file.schema_arrow.field("a").type, pyarrow.string())
+        self.assertEqual(
+            parquet_file.read().to_pylist(), [{"a": None}, {"a": None}, {"a": "1"}]
+        )
+
+    def test_invalid_values(self):
+        items = [{"a": 1}, {"a": 2}, {"a": "N/A"}, {"a": 3}, {"a": "4"}]
+        with LogCapture() as log:
+            parquet_file = self._export(*items, row_group_size=2)
+        self.assertEqual(parquet_file.schema_arrow.field("a").type, pyarrow.int64())
+        self.assertEqual(
+            parquet_file.read().to_pylist(),
+            [{"a": 1}, {"a": 2}, {"a": None}, {"a": 3}, {"a": 4}],
+        )
+        self.assertIn("1 values of field 'a' cannot be converted to int64", str(log))
+
+    def test_mixed_types(self):
+        items = [{"a": 1}, {"a": "x"}, {"a": None}, {"a": {"b": 1}}]
+        with LogCapture() as log:
+            parquet_file = self._export(*items)
+        self.assertEqual(parquet_file.schema_arrow.field("a").type, pyarrow.string())
+        self.assertEqual(
+            parquet_file.read().to_pylist(),
+            [{"a": "1"}, {"a": "x"}, {"a": None}, {"a": None}],
+        )
+        self.assertIn("Field 'a' has values of different types", str(log))
+
+    def test_compression(self):
+        parquet_file = self._export(self.i, compression="zstd")
+        self.assertEqual(
+            parquet_file.metadata.row_group(0).column(0).compression, "ZSTD"
+        )
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class ParquetItemExporterDataclassTest(ParquetItemExporterTest):
+    item_class = TestDataClass
+    custom_field_item_class = CustomFieldDataclass
+
+
 class CustomExporterItemTest(unittest.TestCase):
     item_class = TestItem
 
@@ -693,6 +878,21 @@ class CustomExporterItemTest(unittest.TestCase):
         self.assertEqual(ie.serialize_field({}, "name", i2["name"]), "John")
         self.assertEqual(ie.serialize_field({}, "age", i2["age"]), "23")
 
+    def test_dict_serializers_not_cached(self):
+        class CustomItemExporter(BaseItemExporter):
+            def serialize_field(self, field, name, value):
+                return str(value)
+
+        for ie in (BaseItemExporter(), CustomItemExporter()):
+            for i in range(3):
+                item = {f"field{i}": i}
+                self.assertEqual(
+                    dict(ie._get_serialized_fields(item)),
+                    {f"field{i}": i if type(ie) is BaseItemExporter else str(i)},
+                )
+                dict(ie._get_serialized_fields(item, include_empty=True))
+            self.assertEqual(ie._serializers, {})
+
 
 class CustomExporterDataclassTest(CustomExporterItemTest):
     item_class = TestDataClass
@@ -8,6 +8,8 @@ import shutil
 import string
 import sys
 import tempfile
+import threading
+import time
 import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
@@ -47,6 +49,12 @@ from scrapy.extensions.feedexport import (
     S3FeedStorage,
     StdoutFeedStorage,
 )
+from scrapy.extensions.postprocessing import (
+    Bz2Plugin,
+    GzipPlugin,
+    LZMAPlugin,
+    _BlockCompressor,
+)
 from scrapy.settings import Settings
 from scrapy.utils.python import to_unicode
 from scrapy.utils.test import get_crawler, mock_google_cloud_storage, skip_if_no_boto
@@ -485,6 +493,205 @@ class S3FeedStorageTest(unittest.TestCase):
             acl = storage.s3_client.put_object.call_args[1]["ACL"]
         self.assertEqual(acl, "custom-acl")
 
+    def _multipart_storage(self, **kwargs):
+        with mock.patch.object(S3FeedStorage, "_MIN_PART_SIZE", 1):
+            storage = S3FeedStorage(
+                "s3://mybucket/export.csv", "access_key", "secret_key", **kwargs
+            )
+        storage.s3_client = mock.MagicMock()
+        storage.s3_client.create_multipart_upload.return_value = {"UploadId": "id"}
+        bodies = {}
+
+        def record_body(*, PartNumber, Body, **kwargs):
+            bodies[PartNumber] = Body.read()
+            return {"ETag": f"etag{PartNumber}"}
+
+        storage.s3_client.upload_part.side_effect = record_body
+        crawler = get_crawler()
+        spider = scrapy.Spider("default")
+        spider.crawler = crawler
+        return storage, spider, bodies
+
+    @defer.inlineCallbacks
+    def test_store_multipart(self):
+        storage, spider, bodies = self._multipart_storage(
+            acl="custom-acl", part_size=4, part_concurrency=2
+        )
+        file = storage.open(spider)
+        file.write(b"0123")
+        file.write(b"45678")
+        file.write(b"9")
+        yield storage.store(file)
+
+        client = storage.s3_client
+        client.create_multipart_upload.assert_called_once_with(
+            Bucket="mybucket", Key="export.csv", ACL="custom-acl"
+        )
+        self.assertEqual(bodies, {1: b"0123", 2: b"45678", 3: b"9"})
+        client.complete_multipart_upload.assert_called_once_with(
+            Bucket="mybucket",
+            Key="export.csv",
+            UploadId="id",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "etag1", "PartNumber": 1},
+                    {"ETag": "etag2", "PartNumber": 2},
+                    {"ETag": "etag3", "PartNumber": 3},
+                ]
+            },
+        )
+        client.abort_multipart_upload.assert_not_called()
+        client.upload_fileobj.assert_not_called()
+        client.put_object.assert_not_called()
+
+    @defer.inlineCallbacks
+    def test_store_multipart_small_file(self):
+        storage, spider, bodies = self._multipart_storage(part_size=1024)
+        file = storage.open(spider)
+        file.write(b"test file")
+        yield storage.store(file)
+
+        client = storage.s3_client
+        client.create_multipart_upload.assert_not_called()
+        if IS_BOTO3_AVAILABLE:
+            client.upload_fileobj.assert_called_once()
+        else:
+            client.put_object.assert_called_once()
+
+    @defer.inlineCallbacks
+    def test_store_multipart_error(self):
+        storage, spider, bodies = self._multipart_storage(part_size=4)
+        storage.s3_client.upload_part.side_effect = ValueError("upload failed")
+        file = storage.open(spider)
+        file.write(b"0123")
+        file.write(b"4")
+        with self.assertRaises(ValueError):
+            yield storage.store(file)
+        storage.s3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket="mybucket", Key="export.csv", UploadId="id"
+        )
+        storage.s3_client.complete_multipart_upload.assert_not_called()
+
+    @defer.inlineCallbacks
+    def test_store_multipart_pending_parts(self):
+        storage, spider, bodies = self._multipart_storage(
+            part_size=4, part_concurrency=2
+        )
+        uploading = threading.Semaphore(0)
+        upload_part = storage.s3_client.upload_part.side_effect
+        running = []
+        max_running = []
+
+        def blocked_upload_part(**kwargs):
+            running.append(None)
+            max_running.append(len(running))
+            uploading.acquire()
+            running.pop()
+            return upload_part(**kwargs)
+
+        storage.s3_client.upload_part.side_effect = blocked_upload_part
+        file = storage.open(spider)
+        # writing does not wait for uploads
+        for data in (b"0123", b"4567", b"89ab"):
+            file.write(data)
+        self.assertEqual(bodies, {})
+        for _ in range(3):
+            uploading.release()
+        yield storage.store(file)
+        self.assertEqual(bodies, {1: b"0123", 2: b"4567", 3: b"89ab"})
+        self.assertEqual(max(max_running), 2)
+
+    @defer.inlineCallbacks
+    def test_store_multipart_error_waits_for_parts(self):
+        storage, spider, bodies = self._multipart_storage(part_size=4)
+        events = []
+
+        def upload_part(*, PartNumber, **kwargs):
+            if PartNumber == 1:
+                raise ValueError("upload failed")
+            time.sleep(0.1)
+            events.append("uploaded")
+            return {"ETag": "etag"}
+
+        storage.s3_client.upload_part.side_effect = upload_part
+        storage.s3_client.abort_multipart_upload.side_effect = (
+            lambda **kwargs: events.append("aborted")
+        )
+        file = storage.open(spider)
+        file.write(b"0123")
+        file.write(b"4567")
+        with self.assertRaises(ValueError):
+            yield storage.store(file)
+        self.assertEqual(events, ["uploaded", "aborted"])
+
+    @defer.inlineCallbacks
+    def test_store_multipart_stubber(self):
+        from botocore.stub import ANY, Stubber
+
+        storage = S3FeedStorage(
+            "s3://mybucket/export.csv",
+            "access_key",
+            "secret_key",
+            region_name="us-east-1",
+            part_size=S3FeedStorage._MIN_PART_SIZE,
+            part_concurrency=1,
+        )
+        crawler = get_crawler()
+        spider = scrapy.Spider("default")
+        spider.crawler = crawler
+        key = {"Bucket": "mybucket", "Key": "export.csv"}
+        stub = Stubber(storage.s3_client)
+        stub.add_response(
+            "create_multipart_upload", {"UploadId": "id"}, expected_params=key
+        )
+        for number in (1, 2):
+            stub.add_response(
+                "upload_part",
+                {"ETag": f"etag{number}"},
+                expected_params={
+                    **key,
+                    "UploadId": "id",
+                    "PartNumber": number,
+                    "Body": ANY,
+                },
+            )
+        parts = [{"ETag": "etag1", "PartNumber": 1}, {"ETag": "etag2", "PartNumber": 2}]
+        stub.add_response(
+            "complete_multipart_upload",
+            {},
+            expected_params={
+                **key,
+                "UploadId": "id",
+                "MultipartUpload": {"Parts": parts},
+            },
+        )
+        with stub:
+            file = storage.open(spider)
+            file.write(b"0" * S3FeedStorage._MIN_PART_SIZE)
+            file.write(b"1")
+            yield storage.store(file)
+            stub.assert_no_pending_responses()
+
+    def test_part_size_too_small(self):
+        with LogCapture() as log:
+            storage = S3FeedStorage(
+                "s3://mybucket/export.csv", "access_key", "secret_key", part_size=1024
+            )
+        self.assertEqual(storage.part_size, 5 * 1024 * 1024)
+        self.assertIn("lower than the minimum part size", str(log))
+
+    def test_from_crawler_with_part_size(self):
+        settings = {
+            "AWS_ACCESS_KEY_ID": "access_key",
+            "AWS_SECRET_ACCESS_KEY": "secret_key",
+            "FEED_STORAGE_S3_PART_SIZE": 5 * 1024 * 1024,
+            "FEED_STORAGE_S3_PART_CONCURRENCY": 8,
+        }
+        crawler = get_crawler(settings_dict=settings)
+        storage = S3FeedStorage.from_crawler(crawler, "s3://mybucket/export.csv")
+        self.assertEqual(storage.part_size, 5 * 1024 * 1024)
+        self.assertEqual(storage.part_concurrency, 8)
+
     def test_overwrite_default(self):
         with LogCapture() as log:
             S3FeedStorage(
@@ -2141,6 +2348,57 @@ class FeedPostProcessedExportsTest(FeedExportTestBase):
             self.assertEqual(compressed, data[filename])
             self.assertEqual(self.expected, result)
 
+    @defer.inlineCallbacks
+    def test_compression_workers(self):
+        plugins = {
+            "gzip": ("GzipPlugin", gzip.decompress),
+            "bz2": ("Bz2Plugin", bz2.decompress),
+            "lzma": ("LZMAPlugin", lzma.decompress),
+        }
+        settings = {
+            "FEEDS": {
+                self._named_tempfile(f"{prefix}_workers"): {
+                    "format": "csv",
+                    "postprocessing": [f"scrapy.extensions.postprocessing.{plugin}"],
+                    f"{prefix}_workers": 2,
+                }
+                for prefix, (plugin, _) in plugins.items()
+            },
+        }
+
+        data = yield self.exported_data(self.items, settings)
+        for prefix, (_, decompress) in plugins.items():
+            filename = self._named_tempfile(f"{prefix}_workers")
+            self.assertEqual(decompress(data[filename]), self.expected)
+
+    def test_compression_workers_blocks(self):
+        plugins = (
+            (GzipPlugin, "gzip", gzip.decompress),
+            (Bz2Plugin, "bz2", bz2.decompress),
+            (LZMAPlugin, "lzma", lzma.decompress),
+        )
+        chunks = [f"line {i}\n".encode() for i in range(1000)]
+        for plugin_cls, prefix, decompress in plugins:
+            output = BytesIO()
+            with mock.patch.object(_BlockCompressor, "block_size", 100):
+                plugin = plugin_cls(output, {f"{prefix}_workers": 3})
+                for chunk in chunks:
+                    plugin.write(chunk)
+                with mock.patch.object(output, "close"):
+                    plugin.close()
+            self.assertEqual(decompress(output.getvalue()), b"".join(chunks))
+
+    def test_compression_workers_empty(self):
+        output = BytesIO()
+        plugin = GzipPlugin(output, {"gzip_workers": 2})
+        with mock.patch.object(output, "close"):
+            plugin.close()
+        self.assertEqual(gzip.decompress(output.getvalue()), b"")
+
+    def test_lzma_workers_format(self):
+        with self.assertRaises(ValueError):
+            LZMAPlugin(BytesIO(), {"lzma_workers": 2, "lzma_format": lzma.FORMAT_ALONE})
+
     @defer.inlineCallbacks
     def test_custom_plugin(self):
         filename = self._named_tempfile("csv_file")
@@ -2461,6 +2719,29 @@ class BatchDeliveriesTest(FeedExportTestBase):
         header = self.MyItem.fields.keys()
         yield self.assertExported(items, header, rows, settings=settings)
 
+    @defer.inlineCallbacks
+    def test_export_parquet(self):
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            raise unittest.SkipTest("ParquetItemExporter requires pyarrow")
+
+        items = [{"foo": f"bar{i}", "egg": i} for i in range(5)]
+        settings = {
+            "FEEDS": {
+                self._random_temp_filename()
+                / "parquet"
+                / self._file_mark: {"format": "parquet"},
+            },
+            "FEED_EXPORT_BATCH_ITEM_COUNT": 2,
+        }
+        data = yield self.exported_data(items, settings)
+        self.assertEqual(len(data["parquet"]), 3)
+        got_items = []
+        for batch in data["parquet"]:
+            got_items.extend(pyarrow.parquet.read_table(BytesIO(batch)).to_pylist())
+        self.assertEqual(got_items, items)
+
     def test_wrong_path(self):
         """If path is without %(batch_time)s and %(batch_id) an exception must be raised"""
         settings = {
@@ -2812,6 +3093,23 @@ class FeedExportInitTest(unittest.TestCase):
         with self.assertRaises(NotConfigured):
             FeedExporter.from_crawler(crawler)
 
+    def test_format_requirements(self):
+        settings = {
+            "FEEDS": {
+                "file://path": {
+                    "format": "parquet",
+                },
+            },
+        }
+        crawler = get_crawler(settings_dict=settings)
+        with mock.patch(
+            "scrapy.exporters.ParquetItemExporter.check_requirements",
+            side_effect=NotConfigured("missing pyarrow"),
+        ), LogCapture() as log:
+            with self.assertRaises(NotConfigured):
+                FeedExporter.from_crawler(crawler)
+        self.assertIn("Disabled feed format: parquet", str(log))
+
     def test_absolute_pathlib_as_uri(self):
         with tempfile.NamedTemporaryFile(suffix="json") as tmp:
             settings = {
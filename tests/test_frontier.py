@@ -0,0 +1,213 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from testfixtures import LogCapture
+from twisted.internet import defer, reactor
+from twisted.internet.endpoints import serverFromString
+from twisted.internet.task import deferLater
+from twisted.trial.unittest import TestCase
+
+from scrapy.core.frontier import Frontier, FrontierScheduler, FrontierServerFactory
+from scrapy.http import Request
+from scrapy.spiders import Spider
+from scrapy.utils.test import get_crawler
+from tests.test_scheduler import MockDownloader, MockEngine
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class FrontierTest(unittest.TestCase):
+    def test_duplicates(self):
+        frontier = Frontier()
+        self.assertEqual(frontier.push([("a", 0, b"1", b"x"), ("a", 0, b"1", b"y")]), 1)
+        self.assertEqual(frontier.push([("b", 0, b"1", b"z"), ("b", 0, None, b"w")]), 1)
+        self.assertEqual(len(frontier), 2)
+        entries, wait = frontier.pop(10)
+        self.assertEqual(entries, [("a", 0, b"x"), ("b", 0, b"w")])
+        self.assertIsNone(wait)
+        self.assertEqual(len(frontier), 0)
+
+    def test_priorities_and_turns(self):
+        frontier = Frontier()
+        frontier.push(
+            [
+                ("a", 0, None, b"a1"),
+                ("a", 1, None, b"a2"),
+                ("a", 0, None, b"a3"),
+                ("b", 0, None, b"b1"),
+            ]
+        )
+        entries, _ = frontier.pop(3)
+        self.assertEqual([data for _, _, data in entries], [b"a2", b"b1", b"a1"])
+        entries, _ = frontier.pop(3)
+        self.assertEqual(entries, [("a", 0, b"a3")])
+
+    def test_delay(self):
+        clock = FakeClock()
+        frontier = Frontier(delay=2.0, clock=clock)
+        frontier.push([("a", 0, None, b"a1"), ("a", 0, None, b"a2")])
+        frontier.push([("b", 0, None, b"b1")])
+        entries, wait = frontier.pop(10)
+        self.assertEqual([data for _, _, data in entries], [b"a1", b"b1"])
+        self.assertEqual(wait, 2.0)
+
+        clock.time = 1.0
+        self.assertEqual(frontier.pop(10), ([], 1.0))
+        # an empty slot stays delayed when it gets new requests
+        frontier.push([("b", 0, None, b"b2")])
+        clock.time = 2.0
+        entries, wait = frontier.pop(10)
+        self.assertEqual([data for _, _, data in entries], [b"a2", b"b2"])
+        self.assertIsNone(wait)
+
+
+class FrontierSchedulerTest(TestCase):
+    endpoint = "tcp:0:interface=127.0.0.1"
+
+    @defer.inlineCallbacks
+    def setUp(self):
+        self.frontier = Frontier()
+        self.port = yield serverFromString(reactor, self.endpoint).listen(
+            FrontierServerFactory(self.frontier)
+        )
+        self.schedulers = []
+
+    @defer.inlineCallbacks
+    def tearDown(self):
+        for scheduler in self.schedulers:
+            yield scheduler.close("finished")
+        yield self.port.stopListening()
+
+    def client_endpoint(self):
+        return f"tcp:host=127.0.0.1:port={self.port.getHost().port}"
+
+    @defer.inlineCallbacks
+    def create_scheduler(self, batch_size=100):
+        settings = {
+            "FRONTIER_ENDPOINT": self.client_endpoint(),
+            "FRONTIER_BATCH_SIZE": batch_size,
+            "REQUEST_FINGERPRINTER_IMPLEMENTATION": "2.7",
+        }
+        crawler = get_crawler(Spider, settings)
+        crawler.engine = MockEngine(downloader=MockDownloader())
+        scheduler = FrontierScheduler.from_crawler(crawler)
+        yield scheduler.open(Spider(name="spider"))
+        self.schedulers.append(scheduler)
+        return scheduler
+
+    @defer.inlineCallbacks
+    def pop_all(self, scheduler, number):
+        requests = []
+        for _ in range(100):
+            request = scheduler.next_request()
+            while request is not None:
+                requests.append(request)
+                request = scheduler.next_request()
+            if len(requests) >= number:
+                break
+            yield deferLater(reactor, 0.01, lambda: None)
+        return requests
+
+    @defer.inlineCallbacks
+    def test_shared(self):
+        pusher = yield self.create_scheduler()
+        popper = yield self.create_scheduler()
+        for url in ["http://a.example/1", "http://b.example/1", "http://a.example/1"]:
+            self.assertTrue(pusher.enqueue_request(Request(url)))
+        pusher.enqueue_request(Request("http://a.example/1", dont_filter=True))
+        self.assertTrue(pusher.has_pending_requests())
+
+        requests = yield self.pop_all(popper, 3)
+        self.assertEqual(
+            sorted(request.url for request in requests),
+            ["http://a.example/1", "http://a.example/1", "http://b.example/1"],
+        )
+        self.assertTrue(requests[-1].dont_filter)
+        yield popper._pop_dfd
+        self.assertFalse(popper.has_pending_requests())
+        self.assertEqual(pusher.crawler.stats.get_value("dupefilter/filtered"), 1)
+        self.assertEqual(
+            popper.crawler.stats.get_value("scheduler/dequeued/frontier"), 3
+        )
+
+    @defer.inlineCallbacks
+    def test_batches(self):
+        scheduler = yield self.create_scheduler(batch_size=2)
+        for i in range(5):
+            scheduler.enqueue_request(Request(f"http://a.example/{i}"))
+        # full batches are sent right away
+        self.assertEqual(len(scheduler._pushes), 1)
+        requests = yield self.pop_all(scheduler, 5)
+        self.assertEqual(len(requests), 5)
+
+    @defer.inlineCallbacks
+    def test_requeue_on_close(self):
+        scheduler = yield self.create_scheduler()
+        for i in range(3):
+            scheduler.enqueue_request(Request(f"http://a.example/{i}"))
+        self.assertIsNone(scheduler.next_request())
+        yield scheduler._pop_dfd
+        request = scheduler.next_request()
+        self.assertEqual(len(scheduler._requests), 2)
+        self.schedulers.remove(scheduler)
+        yield scheduler.close("shutdown")
+        self.assertEqual(len(self.frontier), 2)
+
+        scheduler = yield self.create_scheduler()
+        requests = yield self.pop_all(scheduler, 2)
+        self.assertEqual(len(requests), 2)
+        self.assertNotIn(request.url, [r.url for r in requests])
+
+    @defer.inlineCallbacks
+    def test_pop_failure(self):
+        scheduler = yield self.create_scheduler()
+        scheduler.enqueue_request(Request("http://a.example"))
+        call = scheduler._call
+
+        def fail_pop(command, args):
+            if command == "pop":
+                return defer.fail(ValueError())
+            return call(command, args)
+
+        with mock.patch.object(scheduler, "_call", side_effect=fail_pop):
+            with LogCapture() as log:
+                self.assertIsNone(scheduler.next_request())
+        self.assertIn("Error while talking to the frontier", str(log))
+        self.assertIsNone(scheduler._pop_dfd)
+        # later pops are still sent
+        requests = yield self.pop_all(scheduler, 1)
+        self.assertEqual(len(requests), 1)
+
+    @defer.inlineCallbacks
+    def test_unserializable(self):
+        scheduler = yield self.create_scheduler()
+        request = Request("http://a.example", callback=lambda response: None)
+        self.assertTrue(scheduler.enqueue_request(request))
+        self.assertIs(scheduler.next_request(), request)
+        self.assertEqual(
+            scheduler.crawler.stats.get_value("scheduler/unserializable"), 1
+        )
+
+
+class FrontierSchedulerUnixTest(FrontierSchedulerTest):
+    def setUp(self):
+        # socket paths must be short
+        self.tmpdir = tempfile.mkdtemp()
+        self.endpoint = f"unix:{self.tmpdir}/frontier.sock"
+        return super().setUp()
+
+    @defer.inlineCallbacks
+    def tearDown(self):
+        yield super().tearDown()
+        shutil.rmtree(self.tmpdir)
+
+    def client_endpoint(self):
+        return f"unix:path={self.tmpdir}/frontier.sock"
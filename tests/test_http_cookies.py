@@ -1,8 +1,11 @@
+import time
+import warnings
 from unittest import TestCase
 from urllib.parse import urlparse
 
+from scrapy.exceptions import ScrapyDeprecationWarning
 from scrapy.http import Request, Response
-from scrapy.http.cookies import WrappedRequest, WrappedResponse
+from scrapy.http.cookies import CookieJar, WrappedRequest, WrappedResponse
 
 
 class WrappedRequestTest(TestCase):
@@ -65,3 +68,47 @@ class WrappedResponseTest(TestCase):
     def test_get_all(self):
         # get_all result must be native string
         self.assertEqual(self.wrapped.get_all("content-type"), ["text/html"])
+
+
+class CookieJarTest(TestCase):
+    def set_cookie(self, jar, url, header):
+        request = Request(url)
+        jar.extract_cookies(Response(url, headers={"Set-Cookie": header}), request)
+
+    def test_check_expired_frequency_deprecated(self):
+        with self.assertWarns(ScrapyDeprecationWarning):
+            jar = CookieJar(check_expired_frequency=100)
+        self.assertEqual(jar.check_expired_frequency, 100)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            CookieJar()
+
+    def test_expired_cookies_cleared(self):
+        jar = CookieJar()
+        self.set_cookie(jar, "https://a.example/", "a=1; Max-Age=60")
+        self.set_cookie(jar, "https://b.example/", "b=1; Max-Age=60")
+        self.set_cookie(jar, "https://b.example/", "b2=1; Path=/x")
+        for cookie in jar:
+            if cookie.name != "b2":
+                cookie.expires = int(time.time()) - 1
+                jar.jar.set_cookie(cookie)
+
+        request = Request("https://b.example/x/")
+        jar.add_cookie_header(request)
+        self.assertEqual(request.headers.get("Cookie"), b"b2=1")
+        self.assertEqual([cookie.name for cookie in jar], ["b2"])
+        # empty domains and paths do not stay behind
+        self.assertEqual(list(jar._cookies), ["b.example"])
+        self.assertEqual(list(jar._cookies["b.example"]), ["/x"])
+
+    def test_renewed_cookie_not_cleared(self):
+        jar = CookieJar()
+        for _ in range(200):
+            self.set_cookie(jar, "https://a.example/", "a=1; Max-Age=60")
+        self.assertLess(len(jar.jar._expirations), 64)
+
+        cookie = next(iter(jar))
+        jar.jar._expirations[0] = (int(time.time()) - 1,) + jar.jar._expirations[0][1:]
+        jar.jar.clear_expired_cookies()
+        self.assertEqual([cookie.name for cookie in jar], ["a"])
+        self.assertIs(next(iter(jar)), cookie)
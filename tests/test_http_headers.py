@@ -110,6 +110,29 @@ class HeadersTest(unittest.TestCase):
         assert h1.getlist("header1") is not h2.getlist("header1")
         assert isinstance(h2, Headers)
 
+    def test_copy_independent_values(self):
+        h1 = Headers({"header1": ["value1"]})
+        h2 = h1.copy()
+        h2.appendlist("header1", "value2")
+        self.assertEqual(h1.getlist("header1"), [b"value1"])
+        self.assertEqual(h2.getlist("header1"), [b"value1", b"value2"])
+
+    def test_interned_keys(self):
+        h1 = Headers({"content-type": "text/html"})
+        h2 = Headers({b"CONTENT-TYPE": b"text/html"})
+        (key1,) = h1.keys()
+        (key2,) = h2.keys()
+        self.assertEqual(key1, b"Content-Type")
+        self.assertEqual(key2, b"Content-Type")
+        (key3,) = Headers({"content-type": "text/plain"}).keys()
+        self.assertIs(key1, key3)
+
+    def test_normkey_encoding(self):
+        h1 = Headers({"X-Foo": "bar"}, encoding="utf-8")
+        h2 = Headers({"X-Foo": "bar"}, encoding="utf-16")
+        self.assertEqual(list(h1.keys()), [b"X-Foo"])
+        self.assertEqual(list(h2.keys()), ["X-Foo".encode("utf-16")])
+
     def test_appendlist(self):
         h1 = Headers({"header1": "value1"})
         h1.appendlist("header1", "value3")
@@ -85,6 +85,28 @@ class RequestTest(unittest.TestCase):
             for s in v:
                 self.assertIsInstance(s, bytes)
 
+    def test_lazy_containers(self):
+        r1 = self.request_class("http://www.example.com")
+        r2 = self.request_class("http://www.example.com")
+        for attr in ("headers", "cookies", "flags", "meta", "cb_kwargs"):
+            self.assertIsNot(getattr(r1, attr), getattr(r2, attr))
+            self.assertIs(getattr(r1, attr), getattr(r1, attr))
+        r1.headers["X-Foo"] = "bar"
+        r1.cookies["foo"] = "bar"
+        r1.flags.append("foo")
+        self.assertEqual(r1.headers[b"X-Foo"], b"bar")
+        self.assertEqual(r1.cookies, {"foo": "bar"})
+        self.assertEqual(r1.flags, ["foo"])
+        self.assertEqual(r2.cookies, {})
+        self.assertEqual(r2.flags, [])
+        r2.headers = Headers({"X-Bar": "foo"})
+        self.assertEqual(r2.headers[b"X-Bar"], b"foo")
+
+    def test_custom_attributes(self):
+        r = self.request_class("http://www.example.com")
+        r.custom_attribute = "foo"
+        self.assertEqual(r.custom_attribute, "foo")
+
     def test_eq(self):
         url = "http://www.scrapy.org"
         r1 = self.request_class(url=url)
@@ -504,6 +504,54 @@ class TextResponseTest(BaseResponseTest):
         self.assertEqual(r._declared_encoding(), None)
         self._assert_response_values(r, "utf-8", "\xa3")
 
+    def test_inferred_encoding_decodes_once(self):
+        body = "\u0442\u0435\u043a\u0441\u0442 \xa3".encode("utf-8")
+        r = self.response_class("http://www.example.com", body=body)
+        # the encoding is not resolved on instantiation
+        self.assertIsNone(r._cached_benc)
+        self.assertEqual(r.encoding, "utf-8")
+        # the decoding done while inferring the encoding is kept as the text
+        with mock.patch("scrapy.http.response.text.html_to_unicode") as decode:
+            self.assertEqual(r.text, body.decode("utf-8"))
+        decode.assert_not_called()
+
+    def test_encoding_hint(self):
+        unicode_string = "\u0442\u0435\u043a\u0441\u0442"
+        r1 = self.response_class(
+            "http://www.example.com",
+            body=unicode_string.encode("cp1251"),
+            encoding_hint="windows-1251",
+        )
+        self._assert_response_values(r1, "cp1251", unicode_string)
+        self.assertEqual(r1.replace().encoding_hint, "windows-1251")
+
+        # ascii and utf-8 are tried first
+        r2 = self.response_class(
+            "http://www.example.com",
+            body=unicode_string.encode("utf-8"),
+            encoding_hint="cp1251",
+        )
+        self._assert_response_values(r2, "utf-8", unicode_string)
+        r3 = self.response_class(
+            "http://www.example.com", body=b"text", encoding_hint="cp1251"
+        )
+        self._assert_response_values(r3, "cp1252", "text")
+
+        # declared encodings take precedence
+        r4 = self.response_class(
+            "http://www.example.com",
+            body=b"\xa3",
+            headers={"Content-type": ["text/html; charset=iso-8859-1"]},
+            encoding_hint="cp1251",
+        )
+        self._assert_response_values(r4, "cp1252", "\xa3")
+
+        # invalid hints are ignored
+        r5 = self.response_class(
+            "http://www.example.com", body=b"\xa3", encoding_hint="UNKNOWN"
+        )
+        self._assert_response_values(r5, "cp1252", "\xa3")
+
     def test_utf16(self):
         """Test utf-16 because UnicodeDammit is known to have problems with"""
         r = self.response_class(
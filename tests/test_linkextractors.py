@@ -850,3 +850,34 @@ class LxmlLinkExtractorTestCase(Base.LinkExtractorTestCase):
                 ),
             ],
         )
+
+    def test_matches_many_patterns(self):
+        lx = self.extractor_cls(
+            allow=[r"/item/\d+", re.compile("/CATEGORY/", re.IGNORECASE), r"(?i)/tag"],
+            deny=[r"/item/(\d)\1", r"#\d+$"],
+        )
+        self.assertTrue(lx.matches("http://example.org/item/12"))
+        self.assertTrue(lx.matches("http://example.org/category/1"))
+        self.assertTrue(lx.matches("http://example.org/TAG/1"))
+        self.assertFalse(lx.matches("http://example.org/Item/12"))
+        self.assertFalse(lx.matches("http://example.org/item/11"))
+        self.assertFalse(lx.matches("http://example.org/item/12#34"))
+
+    def test_repeated_links(self):
+        html = b"""
+        <a href="/item1.html">Item 1</a>
+        <a href=" /item1.html ">Item 1 again</a>
+        <a href="/item2.html">Item 2</a>
+        <a href="/item1.html">Item 1 once more</a>
+        """
+        response = HtmlResponse("http://example.org/index.html", body=html)
+        lx = self.extractor_cls(unique=False)
+        self.assertEqual(
+            [link.url for link in lx.extract_links(response)],
+            [
+                "http://example.org/item1.html",
+                "http://example.org/item1.html",
+                "http://example.org/item2.html",
+                "http://example.org/item1.html",
+            ],
+        )
@@ -27,6 +27,7 @@ from scrapy.pipelines.files import (
     S3FilesStore,
 )
 from scrapy.settings import Settings
+from scrapy.spiders import Spider
 from scrapy.utils.test import (
     assert_gcs_environ,
     get_crawler,
@@ -210,6 +211,45 @@ class FilesPipelineTestCase(unittest.TestCase):
         for p in patchers:
             p.stop()
 
+    @defer.inlineCallbacks
+    def test_item_waits_for_persisted_files(self):
+        item1 = _create_item_with_files("http://example.com/file4.pdf")
+        item2 = _create_item_with_files("http://example.com/file5.pdf")
+        persisted1, persisted2 = defer.Deferred(), defer.Deferred()
+        patchers = [
+            mock.patch.object(FilesPipeline, "inc_stats", return_value=True),
+            mock.patch.object(FSFilesStore, "stat_file", return_value={}),
+            mock.patch.object(
+                FSFilesStore, "persist_file", side_effect=[persisted1, persisted2]
+            ),
+            mock.patch.object(
+                FilesPipeline,
+                "get_media_requests",
+                side_effect=lambda item, info: [
+                    _prepare_request_object(url) for url in item["file_urls"]
+                ],
+            ),
+        ]
+        for p in patchers:
+            p.start()
+
+        dfd1 = self.pipeline.process_item(item1, None)
+        dfd2 = self.pipeline.process_item(item2, None)
+        self.assertFalse(dfd1.called)
+        self.assertFalse(dfd2.called)
+        # items only wait for their own files
+        persisted2.callback(None)
+        result = yield dfd2
+        self.assertEqual(result["files"][0]["status"], "downloaded")
+        self.assertFalse(dfd1.called)
+        # an item does not get the files that could not be stored
+        persisted1.errback(OSError("disk full"))
+        result = yield dfd1
+        self.assertEqual(result["files"], [])
+
+        for p in patchers:
+            p.stop()
+
     def test_file_path_from_item(self):
         """
         Custom file path based on item data, overriding default implementation
@@ -509,6 +549,55 @@ class FilesPipelineTestCaseCustomSettings(unittest.TestCase):
         self.assertEqual(fs_store.basedir, str(path))
 
 
+class TestFSFilesStore(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = mkdtemp()
+        crawler = get_crawler(Spider)
+        self.spider = crawler._create_spider("foo")
+        self.info = FilesPipeline.SpiderInfo(self.spider)
+
+    def tearDown(self):
+        rmtree(self.tempdir)
+
+    @defer.inlineCallbacks
+    def test_persist_and_stat(self):
+        store = FSFilesStore(self.tempdir)
+        yield store.persist_file("full/file.txt", BytesIO(b"data"), self.info)
+        self.assertEqual(Path(self.tempdir, "full", "file.txt").read_bytes(), b"data")
+        file_stats = yield store.stat_file("full/file.txt", self.info)
+        self.assertEqual(file_stats["checksum"], "8d777f385d3dfec8815d20f7496026dc")
+        missing_stats = yield store.stat_file("full/missing.txt", self.info)
+        self.assertEqual(missing_stats, {})
+
+        stats = self.spider.crawler.stats
+        self.assertEqual(stats.get_value("media_store/persist_count"), 1)
+        self.assertEqual(stats.get_value("media_store/stat_count"), 2)
+        for key in (
+            "media_store/persist_time",
+            "media_store/stat_time_max",
+            "media_store/queue_wait_time",
+        ):
+            self.assertGreaterEqual(stats.get_value(key), 0)
+
+    @defer.inlineCallbacks
+    def test_threads_per_pipeline(self):
+        pipelines = [
+            FilesPipeline.from_settings(
+                Settings({"FILES_STORE": self.tempdir, "MEDIA_STORE_THREADS": size})
+            )
+            for size in (2, 3)
+        ]
+        threads = [pipeline.store._threads for pipeline in pipelines]
+        self.assertIsNot(threads[0], threads[1])
+        self.assertEqual([t.size for t in threads], [2, 3])
+
+        yield pipelines[0].store.persist_file("file.txt", BytesIO(b"data"), self.info)
+        self.assertIsNotNone(threads[0]._pool)
+        self.assertIsNone(threads[1]._pool)
+        pipelines[0].close_spider(self.spider)
+        self.assertIsNone(threads[0]._pool)
+
+
 class TestS3FilesStore(unittest.TestCase):
     @defer.inlineCallbacks
     def test_persist(self):
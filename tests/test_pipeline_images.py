@@ -3,18 +3,25 @@ import hashlib
 import io
 import random
 import warnings
+from pathlib import Path
 from shutil import rmtree
 from tempfile import mkdtemp
 from unittest.mock import patch
 
 import attr
 from itemadapter import ItemAdapter
+from twisted.internet import defer
 from twisted.trial import unittest
 
 from scrapy.exceptions import ScrapyDeprecationWarning
 from scrapy.http import Request, Response
 from scrapy.item import Field, Item
-from scrapy.pipelines.images import ImageException, ImagesPipeline, NoimagesDrop
+from scrapy.pipelines.images import (
+    ImageException,
+    ImagesPipeline,
+    NoimagesDrop,
+    _process_image,
+)
 from scrapy.settings import Settings
 from scrapy.utils.python import to_bytes
 
@@ -309,6 +316,98 @@ class ImagesPipelineTestCase(unittest.TestCase):
         self.assertEqual(converted.mode, "RGB")
         self.assertEqual(converted.getcolors(), [(10000, (205, 230, 255))])
 
+    def test_process_image(self):
+        thumbs = {"small": (20, 20), "big": (40, 40)}
+        _, buf = _create_image("JPEG", "RGB", (100, 50), (0, 127, 255))
+        size, full_jpeg, thumb_results = _process_image(buf.getvalue(), thumbs, 0, 0)
+        self.assertEqual(size, (100, 50))
+        # the response body is stored as is
+        self.assertIsNone(full_jpeg)
+        self.assertEqual(
+            [(thumb_id, thumb_size) for thumb_id, thumb_size, _ in thumb_results],
+            [("small", (20, 10)), ("big", (40, 20))],
+        )
+        for _, thumb_size, thumb_jpeg in thumb_results:
+            thumb = Image.open(io.BytesIO(thumb_jpeg))
+            self.assertEqual((thumb.format, thumb.size), ("JPEG", thumb_size))
+
+        _, buf = _create_image("PNG", "RGBA", (100, 100), (0, 127, 255, 50))
+        size, full_jpeg, thumb_results = _process_image(buf.getvalue(), {}, 0, 0)
+        self.assertEqual(thumb_results, [])
+        full = Image.open(io.BytesIO(full_jpeg))
+        self.assertEqual((full.format, full.mode, full.size), ("JPEG", "RGB", size))
+
+        with self.assertRaises(ImageException):
+            _process_image(buf.getvalue(), {}, 100, 101)
+
+    @defer.inlineCallbacks
+    def _assert_processed_in_executor(self, executor):
+        settings = {"IMAGES_EXECUTOR": executor, "IMAGES_THUMBS": {"small": (20, 20)}}
+        pipeline = ImagesPipeline(self.tempdir, settings=settings)
+        _, buf = _create_image("PNG", "RGB", (50, 50), (0, 0, 0))
+        url = "https://example.com/image.png"
+        response = Response(url, body=buf.getvalue())
+        try:
+            checksum = yield pipeline._call_persisting(
+                pipeline.file_downloaded, response, Request(url), info=None
+            )
+        finally:
+            pipeline.close_spider(None)
+
+        path = Path(self.tempdir, pipeline.file_path(Request(url)))
+        self.assertEqual(checksum, hashlib.md5(path.read_bytes()).hexdigest())
+        self.assertEqual(Image.open(path).format, "JPEG")
+        thumb_path = Path(self.tempdir, pipeline.thumb_path(Request(url), "small"))
+        self.assertEqual(Image.open(thumb_path).size, (20, 20))
+
+    def test_file_downloaded_in_process_pool(self):
+        return self._assert_processed_in_executor(
+            "concurrent.futures.ProcessPoolExecutor"
+        )
+
+    def test_file_downloaded_in_thread_pool(self):
+        return self._assert_processed_in_executor(
+            "concurrent.futures.ThreadPoolExecutor"
+        )
+
+    @defer.inlineCallbacks
+    def test_file_downloaded_without_executor(self):
+        pipeline = ImagesPipeline(self.tempdir)
+        _, buf = _create_image("JPEG", "RGB", (50, 50), (0, 0, 0))
+        url = "https://example.com/image.jpg"
+        response = Response(url, body=buf.getvalue())
+        checksum = yield pipeline._call_persisting(
+            pipeline.file_downloaded, response, Request(url), info=None
+        )
+        self.assertEqual(checksum, hashlib.md5(buf.getvalue()).hexdigest())
+        self.assertIsNone(pipeline._executor)
+
+    def test_close_spider_does_not_wait_for_executor(self):
+        settings = {"IMAGES_EXECUTOR": "concurrent.futures.ThreadPoolExecutor"}
+        pipeline = ImagesPipeline(self.tempdir, settings=settings)
+        executor = pipeline._get_executor()
+        with patch.object(executor, "shutdown") as shutdown:
+            pipeline.close_spider(None)
+        shutdown.assert_called_once_with(wait=False)
+        self.assertIsNone(pipeline._executor)
+        executor.shutdown()
+
+    @defer.inlineCallbacks
+    def test_file_downloaded_overridden_convert_image(self):
+        class CustomImagesPipeline(ImagesPipeline):
+            def convert_image(self, image, size=None, response_body=None):
+                return super().convert_image(image, size, response_body)
+
+        pipeline = CustomImagesPipeline(self.tempdir)
+        _, buf = _create_image("JPEG", "RGB", (50, 50), (0, 0, 0))
+        url = "https://example.com/image.jpg"
+        response = Response(url, body=buf.getvalue())
+        checksum = yield pipeline._call_persisting(
+            pipeline.file_downloaded, response, Request(url), info=None
+        )
+        self.assertEqual(checksum, hashlib.md5(buf.getvalue()).hexdigest())
+        self.assertIsNone(pipeline._executor)
+
 
 class DeprecatedImagesPipeline(ImagesPipeline):
     def file_key(self, url):
@@ -340,6 +340,27 @@ class MediaPipelineTestCase(BaseMediaPipelineTestCase):
         self.assertTrue(new_item is item)
         self.assertEqual(new_item["results"], [(True, rsp1), (True, rsp1)])
 
+    @inlineCallbacks
+    def test_results_cache_evicts_least_recently_used(self):
+        self.pipe.cache_size = 2
+        self.pipe.open_spider(self.spider)
+        self.info = self.pipe.spiderinfo
+        requests = [
+            Request(f"http://url{i}", meta=dict(response=Response(f"http://url{i}")))
+            for i in range(3)
+        ]
+        yield self.pipe.process_item(dict(requests=requests[:2]), self.spider)
+        # url0 is used again, so url1 is evicted instead
+        yield self.pipe.process_item(dict(requests=requests[0]), self.spider)
+        yield self.pipe.process_item(dict(requests=requests[2]), self.spider)
+        self.assertEqual(
+            list(self.info.downloaded),
+            [self.fingerprint(requests[0]), self.fingerprint(requests[2])],
+        )
+        stats = self.pipe.crawler.stats
+        self.assertEqual(stats.get_value("media_cache/hit"), 1)
+        self.assertEqual(stats.get_value("media_cache/evicted"), 1)
+
     @inlineCallbacks
     def test_wait_if_request_is_downloading(self):
         def _check_downloading(response):
@@ -1,10 +1,20 @@
+import shutil
 import tempfile
+import time
 import unittest
+from unittest import mock
 
 import queuelib
 
+from scrapy import signals
+from scrapy.core.downloader import Slot
+from scrapy.exceptions import IgnoreRequest
 from scrapy.http.request import Request
-from scrapy.pqueues import DownloaderAwarePriorityQueue, ScrapyPriorityQueue
+from scrapy.pqueues import (
+    DownloaderAwarePriorityQueue,
+    ScrapyPriorityQueue,
+    SlotFairPriorityQueue,
+)
 from scrapy.spiders import Spider
 from scrapy.squeues import FifoMemoryQueue
 from scrapy.utils.test import get_crawler
@@ -155,3 +165,128 @@ class DownloaderAwarePriorityQueueTest(unittest.TestCase):
         self.assertEqual(self.queue.peek().url, req3.url)
         self.assertEqual(self.queue.pop().url, req3.url)
         self.assertIsNone(self.queue.peek())
+
+
+class SlotDownloader(MockDownloader):
+    def __init__(self, per_slot_settings=None):
+        super().__init__()
+        self.per_slot_settings = per_slot_settings or {}
+
+
+class SlotFairPriorityQueueTest(unittest.TestCase):
+    def create_queue(self, per_slot_settings=None, settings=None, key=""):
+        crawler = self.crawler = get_crawler(Spider, settings)
+        self.downloader = SlotDownloader(per_slot_settings)
+        crawler.engine = MockEngine(downloader=self.downloader)
+        self.stats = crawler.stats
+        self.queue = SlotFairPriorityQueue.from_crawler(
+            crawler=crawler,
+            downstream_queue_cls=FifoMemoryQueue,
+            key=key,
+        )
+        return self.queue
+
+    def tearDown(self):
+        self.queue.close()
+
+    def push_urls(self, *urls):
+        for url in urls:
+            try:
+                self.queue.push(Request(url))
+            except IgnoreRequest:
+                pass
+
+    def pop_hosts(self):
+        hosts = []
+        while True:
+            request = self.queue.pop()
+            if request is None:
+                return hosts
+            hosts.append(request.url.split("/")[2])
+
+    def test_turns(self):
+        self.create_queue()
+        self.push_urls("http://a/1", "http://a/2", "http://a/3", "http://b/1")
+        self.assertEqual(len(self.queue), 4)
+        self.assertEqual(self.pop_hosts(), ["a", "b", "a", "a"])
+        self.assertEqual(len(self.queue), 0)
+
+    def test_new_slot_gets_no_burst(self):
+        self.create_queue()
+        self.push_urls("http://a/1", "http://a/2", "http://a/3", "http://a/4")
+        for _ in range(3):
+            self.queue.pop()
+        self.push_urls("http://c/1", "http://c/2", "http://c/3")
+        self.assertEqual(self.pop_hosts(), ["c", "a", "c", "c"])
+
+    def test_weighted(self):
+        self.create_queue({"a": {"concurrency": 2}, "b": {"concurrency": 1}})
+        self.push_urls(*(f"http://{host}/{i}" for i in range(4) for host in "ab"))
+        hosts = self.pop_hosts()
+        self.assertEqual(hosts[:6].count("a"), 4)
+        self.assertEqual(sorted(hosts), ["a"] * 4 + ["b"] * 4)
+
+    def test_delayed_slot(self):
+        self.create_queue()
+        slot = self.downloader.slots["a"] = Slot(1, 10, False)
+        slot.lastseen = time.time()
+        self.push_urls("http://a/1", "http://b/1")
+        self.assertEqual(self.queue.pop().url, "http://b/1")
+        self.assertIsNone(self.queue.pop())
+        self.assertEqual(len(self.queue), 1)
+        self.assertTrue(self.queue._wake_call.active())
+        with mock.patch("scrapy.pqueues.time", return_value=time.time() + 10):
+            self.assertEqual(self.queue.pop().url, "http://a/1")
+
+    def test_delayed_slots_not_checked_until_ready(self):
+        self.create_queue()
+        for i in range(100):
+            slot = self.downloader.slots[str(i)] = Slot(1, 10, False)
+            slot.lastseen = time.time()
+            self.queue.push(Request(f"http://{i}/1"))
+        self.assertIsNone(self.queue.pop())
+        with mock.patch.object(
+            self.queue, "_wait", wraps=self.queue._wait
+        ) as wait_mock:
+            self.assertIsNone(self.queue.pop())
+            self.assertIsNone(self.queue.peek())
+        wait_mock.assert_not_called()
+        self.assertEqual(len(self.queue), 100)
+
+    def test_busy_slot(self):
+        self.create_queue()
+        slot = self.downloader.slots["a"] = Slot(1, 0, False)
+        slot.transferring.add(Request("http://a/0"))
+        self.push_urls("http://a/1")
+        self.assertIsNone(self.queue.pop())
+        self.assertIsNone(self.queue._wake_call)
+        slot.transferring.clear()
+        self.assertIsNone(self.queue.pop())
+        self.crawler.signals.send_catch_log(
+            signals.request_left_downloader, request=Request("http://a/0"), spider=None
+        )
+        self.assertEqual(self.queue.pop().url, "http://a/1")
+
+    def test_budget(self):
+        self.create_queue({"a": {"budget": 3}}, {"SCHEDULER_SLOT_BUDGET": 1})
+        self.push_urls(*(f"http://{host}/{i}" for i in range(4) for host in "abc"))
+        self.assertEqual(sorted(self.pop_hosts()), ["a", "a", "a", "b", "c"])
+        self.assertEqual(self.stats.get_value("scheduler/slot_budget_exceeded"), 7)
+
+    def test_budget_exceeded_raises(self):
+        self.create_queue(settings={"SCHEDULER_SLOT_BUDGET": 1})
+        self.queue.push(Request("http://a/1"))
+        with self.assertRaises(IgnoreRequest):
+            self.queue.push(Request("http://a/2"))
+        self.assertEqual(len(self.queue), 1)
+
+    def test_budget_persisted(self):
+        jobdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, jobdir)
+        self.create_queue(settings={"SCHEDULER_SLOT_BUDGET": 2}, key=jobdir)
+        self.push_urls("http://a/1")
+        self.queue.close()
+
+        self.create_queue(settings={"SCHEDULER_SLOT_BUDGET": 2}, key=jobdir)
+        self.push_urls("http://a/2", "http://a/3")
+        self.assertEqual(len(self.queue), 1)
@@ -1,5 +1,7 @@
 from twisted.trial import unittest
 
+from scrapy.robotstxt import _PathPrefixDecisions
+
 
 def reppy_available():
     # check if reppy parser is installed
@@ -140,6 +142,45 @@ class BaseRobotParserTest:
             rp.allowed("https://site.local/some/randome/page.html", "UnicödeBöt")
         )
 
+    def test_path_prefix_decisions(self):
+        robotstxt_robotstxt_body = (
+            "User-agent: * \n"
+            "Allow: /disallowed/allowed \n"
+            "Disallow: /disallowed/ \n"
+            "User-agent: otherbot \n"
+            "Disallow: /".encode("utf-8")
+        )
+        rp = self.parser_cls.from_crawler(
+            crawler=None, robotstxt_body=robotstxt_robotstxt_body
+        )
+        long_path = "/disallowed/" + "a" * 200
+        for _ in range(2):
+            self.assertTrue(rp.allowed("https://site.local/a?b=/disallowed/", "*"))
+            self.assertFalse(rp.allowed("https://site.local/disallowed/?a=b", "*"))
+            self.assertTrue(rp.allowed("https://site.local/disallowed/allowed", "*"))
+            self.assertFalse(rp.allowed(f"https://site.local{long_path}b", "*"))
+            self.assertFalse(rp.allowed(f"https://site.local{long_path}c", "*"))
+            self.assertFalse(rp.allowed("https://site.local/a", "otherbot"))
+            self.assertTrue(rp.allowed("https://site.local/b", "*"))
+        self.assertEqual(len(rp._decisions.decisions), 6)
+
+
+class PathPrefixDecisionsTest(unittest.TestCase):
+    def test_prefix_length(self):
+        for robotstxt_body, prefix_length in [
+            (b"", 12),
+            (b"User-agent: *\nDisallow: /", 12),
+            (b"User-agent: *\nDisallow: /some/long/path/ # comment?", 48),
+            (b"User-agent: *\nDisallow: /some/path*\nSitemap: /s?a=1", 33),
+            (b"User-agent: *\nDisallow: /*.pdf", None),
+            (b"User-agent: *\nDisallow: /a$", None),
+            (b"User-agent: *\nDisallow: /a?b", None),
+            (b"User-agent: *\nDisallow: /K%C3%A4", None),
+            (b"User-agent: *\nAllow: /index.html", None),
+        ]:
+            decisions = _PathPrefixDecisions(robotstxt_body)
+            self.assertEqual(decisions.prefix_length, prefix_length, robotstxt_body)
+
 
 class PythonRobotParserTest(BaseRobotParserTest, unittest.TestCase):
     def setUp(self):
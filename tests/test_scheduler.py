@@ -20,8 +20,11 @@ MockSlot = collections.namedtuple("MockSlot", ["active"])
 
 
 class MockDownloader:
+    domain_concurrency = 8
+
     def __init__(self):
         self.slots = {}
+        self.per_slot_settings = {}
 
     def _get_slot_key(self, request, spider):
         if Downloader.DOWNLOAD_SLOT in request.meta:
@@ -42,7 +45,7 @@ class MockDownloader:
 
 
 class MockCrawler(Crawler):
-    def __init__(self, priority_queue_cls, jobdir):
+    def __init__(self, priority_queue_cls, jobdir, settings=None):
         settings = dict(
             SCHEDULER_DEBUG=False,
             SCHEDULER_DISK_QUEUE="scrapy.squeues.PickleLifoDiskQueue",
@@ -51,6 +54,7 @@ class MockCrawler(Crawler):
             JOBDIR=jobdir,
             DUPEFILTER_CLASS="scrapy.dupefilters.BaseDupeFilter",
             REQUEST_FINGERPRINTER_IMPLEMENTATION="2.7",
+            **(settings or {}),
         )
         super().__init__(Spider, settings)
         self.engine = MockEngine(downloader=MockDownloader())
@@ -59,9 +63,12 @@ class MockCrawler(Crawler):
 class SchedulerHandler:
     priority_queue_cls = None
     jobdir = None
+    settings = None
 
     def create_scheduler(self):
-        self.mock_crawler = MockCrawler(self.priority_queue_cls, self.jobdir)
+        self.mock_crawler = MockCrawler(
+            self.priority_queue_cls, self.jobdir, self.settings
+        )
         self.scheduler = Scheduler.from_crawler(self.mock_crawler)
         self.spider = Spider(name="spider")
         self.scheduler.open(self.spider)
@@ -225,6 +232,116 @@ class TestMigration(unittest.TestCase):
             self._migration(self.tmpdir)
 
 
+class CheckpointTestMixin:
+    settings = {"JOBDIR_CHECKPOINT_INTERVAL": 60}
+
+    def kill_scheduler(self):
+        """Close the disk queue files without saving the queue state."""
+        self.scheduler._checkpoint_task.stop()
+        dqs = self.scheduler.dqs
+        pqueues = getattr(dqs, "pqueues", {None: dqs}).values()
+        for pqueue in pqueues:
+            for q in pqueue.queues.values():
+                q.f.close()
+        self.mock_crawler.engine.downloader.close()
+
+    def test_checkpoint(self):
+        for url in _URLS:
+            self.scheduler.enqueue_request(Request(url))
+        self.scheduler.checkpoint()
+        self.assertEqual(
+            self.mock_crawler.stats.get_value("scheduler/checkpoint_count"), 1
+        )
+        self.assertIsNotNone(self.scheduler.next_request())
+        # a new priority and a new downloader slot
+        self.scheduler.enqueue_request(Request("http://bar.com/a", priority=5))
+        self.scheduler.enqueue_request(Request("http://bar.com/b"))
+        self.kill_scheduler()
+
+        self.create_scheduler()
+        self.assertEqual(len(self.scheduler), len(_URLS) + 1)
+        urls = []
+        while self.scheduler.has_pending_requests():
+            urls.append(self.scheduler.next_request().url)
+        self.check_recovered(urls)
+
+    def check_recovered(self, urls):
+        self.assertEqual(urls[0], "http://bar.com/a")
+        self.assertIn("http://bar.com/b", urls)
+        self.assertTrue(set(urls[1:]) < _URLS | {"http://bar.com/b"})
+
+    def test_checkpoint_closed(self):
+        for url in _URLS:
+            self.scheduler.enqueue_request(Request(url))
+        self.scheduler.checkpoint()
+        self.close_scheduler()
+
+        self.create_scheduler()
+        self.assertEqual(self.scheduler._checkpoint_sequence, 1)
+        self.assertEqual(len(self.scheduler), len(_URLS))
+
+
+class TestSchedulerCheckpoint(
+    CheckpointTestMixin, BaseSchedulerOnDiskTester, unittest.TestCase
+):
+    priority_queue_cls = "scrapy.pqueues.ScrapyPriorityQueue"
+
+
+class TestSchedulerWithSlotFairOnDisk(BaseSchedulerOnDiskTester, unittest.TestCase):
+    priority_queue_cls = "scrapy.pqueues.SlotFairPriorityQueue"
+
+
+class TestSchedulerWithSlotFairBudget(SchedulerHandler, unittest.TestCase):
+    priority_queue_cls = "scrapy.pqueues.SlotFairPriorityQueue"
+    settings = {"SCHEDULER_SLOT_BUDGET": 2}
+
+    def setUp(self):
+        self.jobdir = tempfile.mkdtemp()
+        self.create_scheduler()
+
+    def tearDown(self):
+        self.close_scheduler()
+        shutil.rmtree(self.jobdir)
+
+    def test_budget_shared_by_memory_and_disk_queues(self):
+        # unserializable requests go to the memory queue
+        self.scheduler.enqueue_request(Request("http://foo.com/a", callback=print))
+        self.scheduler.enqueue_request(Request("http://foo.com/b"))
+        self.scheduler.enqueue_request(Request("http://foo.com/c"))
+        self.assertEqual(len(self.scheduler), 2)
+        self.assertEqual(
+            self.mock_crawler.stats.get_value("scheduler/slot_budget_exceeded"), 1
+        )
+
+    def test_budget_exceeded_not_enqueued(self):
+        for path in "abc":
+            self.scheduler.enqueue_request(Request(f"http://foo.com/{path}"))
+        self.assertFalse(self.scheduler.enqueue_request(Request("http://foo.com/d")))
+        stats = self.mock_crawler.stats
+        self.assertEqual(stats.get_value("scheduler/enqueued"), 2)
+        self.assertEqual(stats.get_value("scheduler/enqueued/disk"), 2)
+        self.assertEqual(stats.get_value("scheduler/slot_budget_exceeded"), 2)
+
+
+class TestSchedulerWithSlotFairCheckpoint(
+    CheckpointTestMixin, BaseSchedulerOnDiskTester, unittest.TestCase
+):
+    priority_queue_cls = "scrapy.pqueues.SlotFairPriorityQueue"
+
+    def check_recovered(self, urls):
+        # slots take turns regardless of the priority of their requests
+        self.assertEqual(len(set(urls)), len(_URLS) + 1)
+        self.assertIn("http://bar.com/a", urls)
+        self.assertIn("http://bar.com/b", urls)
+        self.assertTrue(set(urls) - {"http://bar.com/a"} < _URLS | {"http://bar.com/b"})
+
+
+class TestSchedulerWithDownloaderAwareCheckpoint(
+    CheckpointTestMixin, BaseSchedulerOnDiskTester, unittest.TestCase
+):
+    priority_queue_cls = "scrapy.pqueues.DownloaderAwarePriorityQueue"
+
+
 def _is_scheduling_fair(enqueued_slots, dequeued_slots):
     """
     We enqueued same number of requests for every slot.
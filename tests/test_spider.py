@@ -497,6 +497,35 @@ class SitemapSpiderTest(SpiderTest):
         r = Response(url="http://www.example.com/sitemap.xml.gz", body=self.BODY)
         self.assertSitemapBody(r, self.BODY)
 
+    def test_parse_sitemap_gzip(self):
+        sitemap = b"""<?xml version="1.0" encoding="UTF-8"?>
+    <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+        <url><loc>http://www.example.com/1</loc></url>
+        <url><loc>http://www.example.com/2</loc></url>
+    </urlset>"""
+        r = Response(
+            url="http://www.example.com/sitemap.xml.gz", body=gzip.compress(sitemap)
+        )
+        spider = self.spider_class("example.com")
+        requests = spider._parse_sitemap(r)
+        self.assertEqual(next(requests).url, "http://www.example.com/1")
+        self.assertEqual([req.url for req in requests], ["http://www.example.com/2"])
+
+    def test_get_sitemap_body_overridden(self):
+        class CustomSitemapSpider(self.spider_class):
+            def _get_sitemap_body(self, response):
+                return b"""<?xml version="1.0" encoding="UTF-8"?>
+    <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+        <url><loc>http://www.example.com/custom</loc></url>
+    </urlset>"""
+
+        r = HtmlResponse(url="http://www.example.com/sitemap", body=b"<html/>")
+        spider = CustomSitemapSpider("example.com")
+        self.assertEqual(
+            [req.url for req in spider._parse_sitemap(r)],
+            ["http://www.example.com/custom"],
+        )
+
     def test_get_sitemap_urls_from_robotstxt(self):
         robots = b"""# Sitemap files
 Sitemap: http://example.com/sitemap.xml
@@ -14,7 +14,7 @@ from scrapy.crawler import CrawlerRunner
 from scrapy.http import Request
 from scrapy.interfaces import ISpiderLoader
 from scrapy.settings import Settings
-from scrapy.spiderloader import SpiderLoader
+from scrapy.spiderloader import IndexedSpiderLoader, SpiderLoader
 
 module_dir = Path(__file__).resolve().parent
 
@@ -202,3 +202,94 @@ class DuplicateSpiderNameLoaderTest(unittest.TestCase):
 
             spiders = set(spider_loader.list())
             self.assertEqual(spiders, {"spider1", "spider2", "spider3", "spider4"})
+
+
+class IndexedSpiderLoaderTest(unittest.TestCase):
+    def setUp(self):
+        orig_spiders_dir = module_dir / "test_spiders"
+        self.tmpdir = Path(self.mktemp())
+        self.tmpdir.mkdir()
+        self.spiders_dir = self.tmpdir / "test_spiders_xxx"
+        _copytree(orig_spiders_dir, self.spiders_dir)
+        sys.path.append(str(self.tmpdir))
+        self.settings = Settings(
+            {
+                "SPIDER_MODULES": ["test_spiders_xxx"],
+                "SPIDER_LOADER_INDEX_FILE": str(self.tmpdir / "index.json"),
+            }
+        )
+
+    def tearDown(self):
+        self._unload_spider_modules()
+        sys.path.remove(str(self.tmpdir))
+
+    def _unload_spider_modules(self):
+        for name in list(sys.modules):
+            if name.split(".")[0] == "test_spiders_xxx":
+                del sys.modules[name]
+
+    def _get_warm_loader(self):
+        IndexedSpiderLoader.from_settings(self.settings)
+        self._unload_spider_modules()
+        return IndexedSpiderLoader.from_settings(self.settings)
+
+    def test_interface(self):
+        verifyObject(ISpiderLoader, self._get_warm_loader())
+
+    def test_list(self):
+        spider_loader = IndexedSpiderLoader.from_settings(self.settings)
+        self.assertEqual(
+            set(spider_loader.list()), {"spider1", "spider2", "spider3", "spider4"}
+        )
+        self.assertEqual(spider_loader.list(), self._get_warm_loader().list())
+        self.assertNotIn("test_spiders_xxx.spider1", sys.modules)
+
+    def test_load(self):
+        spider_loader = self._get_warm_loader()
+        spider4 = spider_loader.load("spider4")
+        self.assertEqual(spider4.__name__, "Spider4")
+        self.assertIn("test_spiders_xxx.nested.spider4", sys.modules)
+        self.assertNotIn("test_spiders_xxx.spider1", sys.modules)
+        self.assertRaisesRegex(KeyError, "Spider not found", spider_loader.load, "x")
+
+    def test_find_by_request(self):
+        spider_loader = self._get_warm_loader()
+        self.assertEqual(
+            set(spider_loader.find_by_request(Request("http://scrapy3.org/test"))),
+            {"spider1", "spider2"},
+        )
+
+    def test_index_invalidation(self):
+        IndexedSpiderLoader.from_settings(self.settings)
+        self._unload_spider_modules()
+        (self.spiders_dir / "spider5.py").write_text(
+            "from scrapy.spiders import Spider\n\n"
+            "class Spider5(Spider):\n"
+            '    name = "spider5"\n'
+        )
+        spider_loader = IndexedSpiderLoader.from_settings(self.settings)
+        self.assertIn("spider5", spider_loader.list())
+        self.assertIn("test_spiders_xxx.spider1", sys.modules)
+
+        self._unload_spider_modules()
+        spider_loader = IndexedSpiderLoader.from_settings(self.settings)
+        self.assertEqual(spider_loader.load("spider5").__name__, "Spider5")
+        self.assertNotIn("test_spiders_xxx.spider1", sys.modules)
+
+    def test_dupename_warning(self):
+        shutil.copyfile(
+            self.spiders_dir / "spider3.py", self.spiders_dir / "spider3dupe.py"
+        )
+        for _ in range(2):
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                spider_loader = IndexedSpiderLoader.from_settings(self.settings)
+                self.assertEqual(len(w), 1)
+                self.assertIn("several spiders with the same name", str(w[0].message))
+            self._unload_spider_modules()
+        self.assertEqual(spider_loader.load("spider3").__name__, "Spider3")
+
+    def test_bad_spider_modules_exception(self):
+        module = "tests.test_spiderloader.test_spiders.doesnotexist"
+        self.settings.set("SPIDER_MODULES", [module])
+        self.assertRaises(ImportError, IndexedSpiderLoader.from_settings, self.settings)
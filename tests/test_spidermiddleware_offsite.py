@@ -1,3 +1,4 @@
+import re
 import warnings
 from unittest import TestCase
 from urllib.parse import urlparse
@@ -5,6 +6,7 @@ from urllib.parse import urlparse
 from scrapy.http import Request, Response
 from scrapy.spidermiddlewares.offsite import OffsiteMiddleware, PortWarning, URLWarning
 from scrapy.spiders import Spider
+from scrapy.utils.httpobj import urlparse_cached
 from scrapy.utils.test import get_crawler
 
 
@@ -100,3 +102,76 @@ class TestOffsiteMiddleware6(TestOffsiteMiddleware4):
             warnings.simplefilter("always")
             self.mw.get_host_regex(self.spider)
             assert issubclass(w[-1].category, PortWarning)
+
+
+class TestOffsiteMiddlewareHostRegex(TestCase):
+    def test_same_as_host_regex(self):
+        class RegexOffsiteMiddleware(OffsiteMiddleware):
+            def get_host_regex(self, spider):
+                return super().get_host_regex(spider)
+
+        crawler = get_crawler(Spider)
+        spider = crawler._create_spider(
+            name="foo", allowed_domains=["scrapytest.org", "a.b.c", "c", ""]
+        )
+        mw = OffsiteMiddleware.from_crawler(crawler)
+        mw.spider_opened(spider)
+        regex_mw = RegexOffsiteMiddleware.from_crawler(crawler)
+        regex_mw.spider_opened(spider)
+        urls = [
+            "http://scrapytest.org/",
+            "http://sub.scrapytest.org/",
+            "http://roguescrapytest.org/",
+            "http://scrapytest.org.evil.com/",
+            "http://a.b.c/",
+            "http://x.b.c/",
+            "http://d.c/",
+            "http://example.com./",
+            "http://example.com/",
+            "data:,",
+        ]
+        for url in urls:
+            request = Request(url)
+            self.assertEqual(
+                mw.should_follow(request, spider),
+                regex_mw.should_follow(request, spider),
+                url,
+            )
+
+    def test_host_regex(self):
+        crawler = get_crawler(Spider)
+        spider = crawler._create_spider(name="foo", allowed_domains=["scrapytest.org"])
+        mw = OffsiteMiddleware.from_crawler(crawler)
+        mw.spider_opened(spider)
+        self.assertTrue(mw.host_regex.search("sub.scrapytest.org"))
+        self.assertFalse(mw.host_regex.search("example.com"))
+
+    def test_no_valid_domains(self):
+        crawler = get_crawler(Spider)
+        spider = crawler._create_spider(
+            name="foo", allowed_domains=["http://scrapytest.org", "scrapy.org:8000"]
+        )
+        mw = OffsiteMiddleware.from_crawler(crawler)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            mw.spider_opened(spider)
+            regex = mw.get_host_regex(spider)
+        for url in ["http://scrapytest.org/", "http://example.com./", "data:,"]:
+            request = Request(url)
+            self.assertEqual(
+                mw.should_follow(request, spider),
+                bool(regex.search(urlparse_cached(request).hostname or "")),
+                url,
+            )
+
+    def test_get_host_regex_overridden(self):
+        class CustomOffsiteMiddleware(OffsiteMiddleware):
+            def get_host_regex(self, spider):
+                return re.compile(r"^allowed\.example$")
+
+        crawler = get_crawler(Spider)
+        spider = crawler._create_spider(name="foo", allowed_domains=["scrapytest.org"])
+        mw = CustomOffsiteMiddleware.from_crawler(crawler)
+        mw.spider_opened(spider)
+        self.assertTrue(mw.should_follow(Request("http://allowed.example/"), spider))
+        self.assertFalse(mw.should_follow(Request("http://scrapytest.org/"), spider))
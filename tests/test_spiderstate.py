@@ -1,7 +1,11 @@
 import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
+from unittest import mock
 
+from testfixtures import LogCapture
+from twisted.internet import task
 from twisted.trial import unittest
 
 from scrapy.exceptions import NotConfigured
@@ -32,6 +36,50 @@ class SpiderStateTest(unittest.TestCase):
         finally:
             shutil.rmtree(jobdir)
 
+    def test_checkpoint(self):
+        jobdir = self.mktemp()
+        Path(jobdir).mkdir()
+        try:
+            spider = Spider(name="default")
+            ss = SpiderState(jobdir, checkpoint_interval=60)
+            ss.spider_opened(spider)
+            ss.task.clock = clock = task.Clock()
+            ss.task.stop()
+            ss.task.start(60, now=False)
+            spider.state["one"] = 1
+            clock.advance(60)
+
+            spider2 = Spider(name="default")
+            ss2 = SpiderState(jobdir)
+            ss2.spider_opened(spider2)
+            self.assertEqual(spider2.state, {"one": 1})
+            ss.spider_closed(spider)
+        finally:
+            shutil.rmtree(jobdir)
+
+    def test_checkpoint_error(self):
+        jobdir = self.mktemp()
+        Path(jobdir).mkdir()
+        clock = task.Clock()
+
+        class LoopingCall(task.LoopingCall):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.clock = clock
+
+        try:
+            spider = Spider(name="default")
+            ss = SpiderState(jobdir, checkpoint_interval=60)
+            with mock.patch.object(task, "LoopingCall", LoopingCall):
+                ss.spider_opened(spider)
+            spider.state["lock"] = threading.Lock()
+            with LogCapture() as log:
+                clock.advance(60)
+            self.assertIn("Error while saving the spider state", str(log))
+            self.assertFalse(ss.task.running)
+        finally:
+            shutil.rmtree(jobdir)
+
     def test_state_attribute(self):
         # state attribute must be present if jobdir is not set, to provide a
         # consistent interface
@@ -1,5 +1,6 @@
 import pickle
 import sys
+from unittest import mock
 
 from queuelib.tests import test_queue as t
 
@@ -48,6 +49,28 @@ class FifoDiskQueueTestMixin:
 
     test_nonserializable_object = nonserializable_object_test
 
+    def test_checkpoint_recover(self):
+        q = self.queue()
+        q.push("a")
+        q.push("b")
+        q.checkpoint()
+        self.assertEqual(q.pop(), "a")
+        q.push("c")
+        q.push("d")
+        # killed: close the files without saving the queue state
+        q.headf.close()
+        q.tailf.close()
+
+        q = self.queue()
+        q.recover()
+        popped = [q.pop() for _ in range(len(q))]
+        # "a" is popped again unless its chunk file was removed
+        self.assertIn(popped, (["a", "b", "c", "d"], ["b", "c", "d"]))
+        self.assertIsNone(q.pop())
+        q.push("e")
+        self.assertEqual(q.pop(), "e")
+        q.close()
+
 
 class MarshalFifoDiskQueueTest(t.FifoDiskQueueTest, FifoDiskQueueTestMixin):
     chunksize = 100000
@@ -149,6 +172,35 @@ class LifoDiskQueueTestMixin:
 
     test_nonserializable_object = nonserializable_object_test
 
+    def test_checkpoint_recover(self):
+        q = self.queue()
+        q.push("a")
+        q.push("b")
+        q.checkpoint()
+        self.assertEqual(q.pop(), "b")
+        q.push("c")
+        q.push("d")
+        # killed: close the file without saving the queue state
+        q.f.close()
+
+        q = self.queue()
+        self.assertEqual(len(q), 2)
+        q.recover()
+        self.assertEqual([q.pop() for _ in range(len(q))], ["d", "c", "a"])
+        self.assertIsNone(q.pop())
+        q.close()
+
+    def test_flush_after_checkpoint(self):
+        q = self.queue()
+        with mock.patch.object(q.f, "flush", wraps=q.f.flush) as flush:
+            q.push("a")
+            flush.assert_not_called()
+            q.checkpoint()
+            flush.reset_mock()
+            q.push("b")
+            flush.assert_called_once_with()
+        q.close()
+
 
 class MarshalLifoDiskQueueTest(t.LifoDiskQueueTest, LifoDiskQueueTestMixin):
     def queue(self):
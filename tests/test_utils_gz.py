@@ -4,7 +4,7 @@ from pathlib import Path
 from w3lib.encoding import html_to_unicode
 
 from scrapy.http import Response
-from scrapy.utils.gz import gunzip, gzip_magic_number
+from scrapy.utils.gz import gunzip, gunzip_chunks, gzip_magic_number
 from tests import tests_datadir
 
 SAMPLEDIR = Path(tests_datadir, "compressed")
@@ -22,6 +22,13 @@ class GunzipTest(unittest.TestCase):
         self.assertFalse(gzip_magic_number(r2))
         self.assertEqual(len(r2.body), 9950)
 
+    def test_gunzip_chunks(self):
+        data = (SAMPLEDIR / "feed-sample1.xml.gz").read_bytes()
+        chunks = list(gunzip_chunks(data, chunk_size=1024))
+        self.assertEqual(b"".join(chunks), gunzip(data))
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= 1024 for chunk in chunks))
+
     def test_gunzip_truncated(self):
         text = gunzip((SAMPLEDIR / "truncated-crc-error.gz").read_bytes())
         assert text.endswith(b"</html")
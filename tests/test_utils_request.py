@@ -524,6 +524,36 @@ class RequestFingerprinterTestCase(unittest.TestCase):
         )
         self.assertFalse(logged_warnings)
 
+    def test_2_11_implementation(self):
+        settings = {
+            "REQUEST_FINGERPRINTER_IMPLEMENTATION": "2.11",
+        }
+        with warnings.catch_warnings(record=True) as logged_warnings:
+            crawler = get_crawler(settings_dict=settings)
+        fingerprinter = crawler.request_fingerprinter
+        self.assertFalse(logged_warnings)
+
+        r1 = Request("http://www.example.com/query?id=111&cat=222")
+        r2 = Request("http://www.example.com/query?cat=222&id=111#fragment")
+        r3 = Request("http://www.example.com/query?cat=222&id=111", method="POST")
+        r4 = Request(
+            "http://www.example.com/query?cat=222&id=111", method="POST", body=b"a"
+        )
+        fp1 = fingerprinter.fingerprint(r1)
+        self.assertEqual(len(fp1), 16)
+        self.assertIs(fingerprinter.fingerprint(r1), fp1)
+        self.assertEqual(fingerprinter.fingerprint(r2), fp1)
+        self.assertEqual(
+            fingerprinter.fingerprint(r1),
+            bytes.fromhex("4a77713bbf8745eb9e093100b1cd5552"),
+        )
+        fingerprints = {
+            fp1,
+            fingerprinter.fingerprint(r3),
+            fingerprinter.fingerprint(r4),
+        }
+        self.assertEqual(len(fingerprints), 3)
+
     def test_unknown_implementation(self):
         settings = {
             "REQUEST_FINGERPRINTER_IMPLEMENTATION": "2.5",
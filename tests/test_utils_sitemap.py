@@ -296,6 +296,37 @@ Disallow: /forum/active/
 
         self.assertEqual(list(s), [{"loc": "http://127.0.0.1:8000/"}])
 
+    def test_chunks(self):
+        body = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>http://www.example.com/1</loc></url>
+  <url><loc>http://www.example.com/2</loc><lastmod>2009-08-16</lastmod></url>
+</urlset>"""
+        s = Sitemap(body[i : i + 7] for i in range(0, len(body), 7))
+        assert s.type == "urlset"
+        self.assertEqual(
+            list(s),
+            [
+                {"loc": "http://www.example.com/1"},
+                {"loc": "http://www.example.com/2", "lastmod": "2009-08-16"},
+            ],
+        )
+
+    def test_entries_released(self):
+        body = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>http://www.example.com/1</loc></url>
+  <url><loc>http://www.example.com/2</loc></url>
+  <url><loc>http://www.example.com/3</loc></url>
+</urlset>"""
+        s = Sitemap(body[i : i + 16] for i in range(0, len(body), 16))
+        for _ in s:
+            # the entry just parsed, and maybe the start of the next one
+            self.assertLessEqual(len(s._root), 2)
+
+    def test_invalid(self):
+        self.assertRaises(Exception, Sitemap, b"SITEMAP")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,160 @@
+import unittest
+from unittest import mock
+
+from testfixtures import LogCapture
+from twisted.internet import defer
+from twisted.trial.unittest import TestCase
+
+from scrapy import Spider, signals
+from scrapy.core.downloader.middleware import DownloaderMiddlewareManager
+from scrapy.core.spidermw import SpiderMiddlewareManager
+from scrapy.http import Request, Response
+from scrapy.utils.test import get_crawler
+from scrapy.utils.timing import ComponentTimer
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+    def sleep(self, seconds):
+        self.time += seconds
+
+
+class Outer:
+    def __init__(self, inner, clock):
+        self.inner = inner
+        self.clock = clock
+
+    def run(self):
+        self.clock.sleep(0.002)
+        return self.inner()
+
+
+class Producer:
+    def __init__(self, clock):
+        self.clock = clock
+
+    def produce(self):
+        for i in range(3):
+            self.clock.sleep(0.002)
+            yield i
+
+    def passthrough(self, iterable):
+        for item in iterable:
+            yield item
+
+
+class ComponentTimerTest(unittest.TestCase):
+    def setUp(self):
+        self.crawler = get_crawler(Spider)
+        self.stats = self.crawler.stats
+        self.timer = ComponentTimer.from_crawler(self.crawler)
+        self.clock = FakeClock()
+        patcher = mock.patch("scrapy.utils.timing.perf_counter", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_exclusive_time(self):
+        inner = self.timer.wrap(lambda: self.clock.sleep(0.02))
+        outer = self.timer.wrap(Outer(inner, self.clock).run)
+        outer()
+        outer()
+
+        name = f"{__name__}.Outer.run"
+        self.assertEqual(self.stats.get_value(f"timing/{name}/count"), 2)
+        self.assertAlmostEqual(self.stats.get_value(f"timing/{name}/time"), 0.004)
+        self.assertEqual(self.stats.get_value(f"timing/{name}/under_10ms"), 2)
+        inner_name = (
+            f"{__name__}.ComponentTimerTest.test_exclusive_time.<locals>.<lambda>"
+        )
+        self.assertAlmostEqual(self.stats.get_value(f"timing/{inner_name}/time"), 0.04)
+        self.assertEqual(self.stats.get_value(f"timing/{inner_name}/under_100ms"), 2)
+
+    def test_generator(self):
+        producer = Producer(self.clock)
+        produce = self.timer.wrap(producer.produce)
+        passthrough = self.timer.wrap(producer.passthrough)
+        self.assertEqual(list(passthrough(produce())), [0, 1, 2])
+
+        produce_name = f"{__name__}.Producer.produce"
+        passthrough_name = f"{__name__}.Producer.passthrough"
+        self.assertEqual(self.stats.get_value(f"timing/{produce_name}/count"), 1)
+        self.assertAlmostEqual(
+            self.stats.get_value(f"timing/{produce_name}/time"), 0.006
+        )
+        self.assertEqual(self.stats.get_value(f"timing/{passthrough_name}/count"), 1)
+        self.assertEqual(self.stats.get_value(f"timing/{passthrough_name}/time"), 0.0)
+
+    def test_exception(self):
+        def fail():
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            self.timer.wrap(fail)()
+        name = f"{__name__}.ComponentTimerTest.test_exception.<locals>.fail"
+        self.assertEqual(self.stats.get_value(f"timing/{name}/count"), 1)
+
+    def test_summary(self):
+        list(self.timer.wrap(Producer(self.clock).passthrough)([]))
+        spider = self.crawler._create_spider("foo")
+        with LogCapture() as log:
+            self.crawler.signals.send_catch_log(signals.spider_closed, spider=spider)
+        (message,) = [
+            r.getMessage() for r in log.records if r.name == "scrapy.utils.timing"
+        ]
+        self.assertIn("Component timing", message)
+        self.assertIn(f"{__name__}.Producer.passthrough", message)
+
+
+class TimingEnabledTest(TestCase):
+    def setUp(self):
+        self.crawler = get_crawler(Spider, {"COMPONENT_TIMING_ENABLED": True})
+        self.spider = self.crawler._create_spider("foo")
+        self.stats = self.crawler.stats
+
+    def test_disabled(self):
+        crawler = get_crawler(Spider)
+        self.assertIsNone(crawler._component_timer)
+        mwman = DownloaderMiddlewareManager.from_crawler(crawler)
+        self.assertFalse(hasattr(mwman._chains["process_request"][0], "__wrapped__"))
+
+    def test_downloader_middlewares(self):
+        mwman = DownloaderMiddlewareManager.from_crawler(self.crawler)
+        request = Request("https://example.com")
+        response = Response(request.url)
+        results = []
+        mwman.download(lambda **kwargs: response, request, self.spider).addBoth(
+            results.append
+        )
+        self.assertIs(results[0], response)
+        name = (
+            "scrapy.downloadermiddlewares.useragent.UserAgentMiddleware"
+            ".process_request"
+        )
+        self.assertEqual(self.stats.get_value(f"timing/{name}/count"), 1)
+
+    @defer.inlineCallbacks
+    def test_spider_middlewares(self):
+        mwman = SpiderMiddlewareManager.from_crawler(self.crawler)
+        request = Request("https://example.com")
+        response = Response(request.url, request=request)
+        result = yield mwman.scrape_response(
+            lambda response, request, spider: [{"a": 1}],
+            response,
+            request,
+            self.spider,
+        )
+        self.assertEqual(list(result), [{"a": 1}])
+        name = "scrapy.spidermiddlewares.depth.DepthMiddleware.process_spider_output"
+        self.assertEqual(self.stats.get_value(f"timing/{name}/count"), 1)
+
+    def test_signal_handlers(self):
+        handler = Outer(lambda: None, FakeClock())
+        self.crawler.signals.connect(handler.run, signals.spider_idle)
+        self.crawler.signals.send_catch_log(signals.spider_idle)
+        name = f"{__name__}.Outer.run"
+        self.assertEqual(self.stats.get_value(f"timing/{name}/count"), 1)
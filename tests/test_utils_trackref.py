@@ -87,3 +87,34 @@ Foo                                 1   oldest: 0s ago\n\n""",
             set(trackref.iter_all("Foo")),
             {o1, o3},
         )
+
+    def test_track_counts_only(self):
+        o1 = Foo()  # NOQA
+        trackref.track_instances(False)
+        try:
+            o2 = Foo()  # NOQA
+            o3 = Bar()  # NOQA
+            self.assertEqual(
+                trackref.format_live_refs(),
+                """\
+Live References
+
+Bar                                 1
+Foo                                 2
+""",
+            )
+            self.assertIsNone(trackref.get_oldest("Foo"))
+            self.assertEqual(list(trackref.iter_all("Foo")), [])
+            del o1, o3
+            self.assertEqual(
+                trackref.format_live_refs(),
+                """\
+Live References
+
+Foo                                 1
+""",
+            )
+        finally:
+            trackref.track_instances(True)
+        o4 = Foo()  # NOQA
+        self.assertEqual(set(trackref.iter_all("Foo")), {o4})